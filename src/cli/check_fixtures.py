@@ -3,24 +3,23 @@ Perform sanity checks on the framework's pydantic serialization and
 deserialization using generated json fixtures files.
 """
 
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Generator
+from typing import Dict, Iterable, List
 
 import click
+from pydantic import BaseModel
 from rich.progress import BarColumn, Progress, TaskProgressColumn, TextColumn, TimeElapsedColumn
 
 from ethereum_test_base_types import to_json
+from ethereum_test_fixtures.compression import iter_fixture_files, read_fixture_file
 from ethereum_test_fixtures.file import Fixtures
 from ethereum_test_specs.base import HashMismatchExceptionError
 
-
-def count_json_files_exclude_index(start_path: Path) -> int:
-    """
-    Return the number of json files in the specified directory, excluding
-    index.json files.
-    """
-    json_file_count = sum(1 for file in start_path.rglob("*.json") if file.name != "index.json")
-    return json_file_count
+from .index_manifest import INDEX_MANIFEST_FILE_NAME
 
 
 def check_json(json_file_path: Path):
@@ -36,7 +35,7 @@ def check_json(json_file_path: Path):
         a. Compare the newly calculated hashes from step 2. and 3. and
         b. If present, compare info["hash"] with the calculated hash from step 2.
     """
-    fixtures: Fixtures = Fixtures.model_validate_json(json_file_path.read_text())
+    fixtures: Fixtures = Fixtures.model_validate_json(read_fixture_file(json_file_path))
     fixtures_json = to_json(fixtures)
     fixtures_deserialized: Fixtures = Fixtures.model_validate(fixtures_json)
     for fixture_name, fixture in fixtures.items():
@@ -57,6 +56,54 @@ def check_json(json_file_path: Path):
             )
 
 
+class FixtureFileCheckResult(BaseModel):
+    """The result of checking a fixture file, as recorded in the journal of a check run."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    error_type: str | None = None
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        """Return True if the check of the file succeeded."""
+        return self.error_type is None
+
+    def matches_stat(self, stat: os.stat_result) -> bool:
+        """Return True if the file has the same size and modification time as when checked."""
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+def check_json_file(json_file_path: Path) -> FixtureFileCheckResult:
+    """Check the fixtures of a json file, returning the error raised by the check, if any."""
+    stat = json_file_path.stat()
+    result = FixtureFileCheckResult(
+        path=str(json_file_path), size=stat.st_size, mtime_ns=stat.st_mtime_ns
+    )
+    try:
+        check_json(json_file_path)
+    except Exception as e:
+        result.error_type = type(e).__name__
+        result.error = str(e)
+    return result
+
+
+def read_journal(journal_path: Path) -> Dict[str, FixtureFileCheckResult]:
+    """Return the results recorded in the journal of a previous run, by file path."""
+    results: Dict[str, FixtureFileCheckResult] = {}
+    if not journal_path.exists():
+        return results
+    with open(journal_path) as f:
+        for line in f:
+            try:
+                result = FixtureFileCheckResult.model_validate_json(line)
+            except ValueError:
+                continue  # the line of an interrupted write
+            results[result.path] = result
+    return results
+
+
 @click.command()
 @click.option(
     "--input",
@@ -75,6 +122,32 @@ def check_json(json_file_path: Path):
     expose_value=True,
     help="Don't show the progress bar while processing fixture files.",
 )
+@click.option(
+    "--workers",
+    "-n",
+    "workers",
+    type=int,
+    default=None,
+    help="Number of processes used to check the fixture files (default: the number of CPUs).",
+)
+@click.option(
+    "--journal",
+    "journal_str",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help=(
+        "Record the result of each checked file in this journal file. Files recorded in the "
+        "journal are not checked again if unchanged, so an interrupted run can be resumed by "
+        "running the same command again."
+    ),
+)
+@click.option(
+    "--report",
+    "report_str",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Write a JSON report of the files that failed the checks to this file.",
+)
 @click.option(
     "--stop-on-error",
     "--raise-on-error",
@@ -85,61 +158,111 @@ def check_json(json_file_path: Path):
     expose_value=True,
     help="Stop and raise any exceptions encountered while checking fixtures.",
 )
-def check_fixtures(input_str: str, quiet_mode: bool, stop_on_error: bool):
+def check_fixtures(
+    input_str: str,
+    quiet_mode: bool,
+    stop_on_error: bool,
+    workers: int | None = None,
+    journal_str: str | None = None,
+    report_str: str | None = None,
+):
     """Perform some checks on the fixtures contained in the specified directory."""
     input_path = Path(input_str)
-    success = True
-    file_count = 0
     filename_display_width = 25
     if input_path.is_file():
-        file_count = 1
-    elif not quiet_mode:
-        file_count = count_json_files_exclude_index(input_path)
+        input_files = [input_path]
+    else:
+        input_files = [
+            file
+            for file in iter_fixture_files(input_path)
+            if file.name not in ("index.json", INDEX_MANIFEST_FILE_NAME)
+        ]
+
+    # Results of the files checked by a previous, interrupted run are reused if unchanged.
+    results: Dict[str, FixtureFileCheckResult] = {}
+    files_to_check: List[Path] = []
+    journaled_results = read_journal(Path(journal_str)) if journal_str else {}
+    for file in input_files:
+        journaled_result = journaled_results.get(str(file))
+        if journaled_result is not None and journaled_result.matches_stat(file.stat()):
+            results[str(file)] = journaled_result
+        else:
+            files_to_check.append(file)
 
-    def get_input_files() -> Generator[Path, None, None]:
-        if input_path.is_file():
-            yield input_path
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(files_to_check)))
+
+    with ExitStack() as stack:
+        journal = stack.enter_context(open(journal_str, "a")) if journal_str else None
+        progress = stack.enter_context(
+            Progress(
+                TextColumn(
+                    f"[bold cyan]{{task.fields[filename]:<{filename_display_width}}}[/]",
+                    justify="left",
+                ),
+                BarColumn(bar_width=None, complete_style="green3", finished_style="bold green3"),
+                TaskProgressColumn(),
+                TimeElapsedColumn(),
+                expand=True,
+                disable=quiet_mode,
+            )
+        )
+        task_id = progress.add_task(
+            "Checking fixtures",
+            total=len(input_files),
+            completed=len(input_files) - len(files_to_check),
+            filename="...",
+        )
+        check_results: Iterable[FixtureFileCheckResult]
+        if workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            # Results are reported in order, as the files are listed.
+            check_results = executor.map(check_json_file, files_to_check)
         else:
-            yield from input_path.rglob("*.json")
-
-    with Progress(
-        TextColumn(
-            f"[bold cyan]{{task.fields[filename]:<{filename_display_width}}}[/]", justify="left"
-        ),
-        BarColumn(bar_width=None, complete_style="green3", finished_style="bold green3"),
-        TaskProgressColumn(),
-        TimeElapsedColumn(),
-        expand=True,
-        disable=quiet_mode,
-    ) as progress:  # type: Progress
-        task_id = progress.add_task("Checking fixtures", total=file_count, filename="...")
-        for json_file_path in get_input_files():
-            if json_file_path.name == "index.json":
-                continue
+            check_results = map(check_json_file, files_to_check)
+
+        for json_file_path, result in zip(files_to_check, check_results, strict=True):
+            results[result.path] = result
+            if journal is not None:
+                journal.write(result.model_dump_json() + "\n")
+                journal.flush()
 
             display_filename = json_file_path.name
             if len(display_filename) > filename_display_width:
                 display_filename = display_filename[: filename_display_width - 3] + "..."
             else:
                 display_filename = display_filename.ljust(filename_display_width)
+            progress.update(task_id, advance=1, filename=f"Checking {display_filename}")
 
-            try:
-                progress.update(task_id, advance=1, filename=f"Checking {display_filename}")
-                check_json(json_file_path)
-            except Exception as e:
-                success = False
+            if not result.success:
                 if stop_on_error:
-                    raise e
-                else:
-                    progress.console.print(f"\nError checking {json_file_path}:")
-                    progress.console.print(f"  {e}")
+                    if workers > 1:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                    # Check the file again to raise the original exception.
+                    check_json(json_file_path)
+                progress.console.print(f"\nError checking {json_file_path}:")
+                progress.console.print(f"  {result.error}")
 
-        reward_string = "🦄" if success else "🐢"
+        failures = [result for result in results.values() if not result.success]
+        reward_string = "🐢" if failures else "🦄"
         progress.update(
-            task_id, completed=file_count, filename=f"Completed checking all files {reward_string}"
+            task_id,
+            completed=len(input_files),
+            filename=f"Completed checking all files {reward_string}",
         )
 
-    return success
+    if report_str:
+        report = {
+            "checked_files": len(results),
+            "failed_files": len(failures),
+            "failures": [
+                result.model_dump(include={"path", "error_type", "error"}) for result in failures
+            ],
+        }
+        Path(report_str).write_text(json.dumps(report, indent=2))
+
+    return not failures
 
 
 if __name__ == "__main__":
@@ -7,15 +7,24 @@ both of the folders. Used within the coverage workflow.
 """
 
 import json
+import os
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Set
+from typing import Dict, Iterable, List, Set, Tuple
 
 import click
 
 from ethereum_test_base_types import HexNumber
+from ethereum_test_fixtures.compression import (
+    is_compressed_fixture_file,
+    open_fixture_file,
+    read_fixture_file,
+)
 from ethereum_test_fixtures.consume import IndexFile, TestCaseIndexFile
+from ethereum_test_fixtures.file import scan_fixture_file
 
 
 def get_index_path(folder: Path) -> Path:
@@ -49,40 +58,90 @@ def find_duplicates(base_hashes: Set[HexNumber], patch_hashes: Set[HexNumber]) -
     return base_hashes & patch_hashes
 
 
-def pop_by_hash(index: IndexFile, fixture_hash: HexNumber) -> TestCaseIndexFile:
-    """Pops a single test case from an index file by its hash."""
-    for i in range(len(index.test_cases)):
-        if index.test_cases[i].fixture_hash == fixture_hash:
-            return index.test_cases.pop(i)
-    raise Exception(f"Hash {fixture_hash} not found in index.")
-
+def pop_by_hashes(index: IndexFile, fixture_hashes: Set[HexNumber]) -> List[TestCaseIndexFile]:
+    """Pop the first test case with each of the given hashes from an index file."""
+    positions: Dict[HexNumber, int] = {}
+    for position, test_case in enumerate(index.test_cases):
+        if test_case.fixture_hash is not None:
+            positions.setdefault(test_case.fixture_hash, position)
+    removed_positions = set()
+    for fixture_hash in fixture_hashes:
+        if fixture_hash not in positions:
+            raise Exception(f"Hash {fixture_hash} not found in index.")
+        removed_positions.add(positions[fixture_hash])
+    removed_test_cases = [index.test_cases[position] for position in sorted(removed_positions)]
+    index.test_cases = [
+        test_case
+        for position, test_case in enumerate(index.test_cases)
+        if position not in removed_positions
+    ]
+    return removed_test_cases
+
+
+def remove_fixtures_from_file(
+    file: Path, test_case_ids: List[str]
+) -> Dict[str, Tuple[int, int] | None]:
+    """
+    Remove fixtures by their IDs from a generic fixture file, rewriting it once.
 
-def remove_fixture_from_file(file: Path, test_case_id: str):
-    """Remove a single fixture by its ID from a generic fixture file."""
+    Return the new location (offset and length) of each remaining fixture in the file, as
+    recorded in the index, or None if the location can't be recorded.
+    """
     try:
         # Load from json to a dict
-        full_file = json.loads(file.read_text())
-        full_file.pop(test_case_id)
-        file.write_text(json.dumps(full_file, indent=2))
+        full_file = json.loads(read_fixture_file(file))
+        for test_case_id in test_case_ids:
+            full_file.pop(test_case_id)
+        text = json.dumps(full_file, indent=2)
+        with open_fixture_file(file, "w") as f:
+            f.write(text)
     except FileNotFoundError:
         raise FileNotFoundError(f"Fixture file not found: {file}") from None
-    except KeyError:
-        raise KeyError(f"Test case {test_case_id} not found in {file}") from None
+    except KeyError as e:
+        raise KeyError(f"Test case {e.args[0]} not found in {file}") from None
+    if is_compressed_fixture_file(file) or not text.isascii():
+        return dict.fromkeys(full_file)
+    return {name: (offset, length) for name, _, offset, length in scan_fixture_file(text)}
 
 
-def remove_fixture(
+def remove_fixtures(
     folder: Path,
     index: IndexFile,
-    fixture_hash: HexNumber,
+    fixture_hashes: Set[HexNumber],
     dry_run: bool,
+    workers: int = 1,
 ):
-    """Remove a single fixture from a folder that matches the given hash."""
-    test_case = pop_by_hash(index, fixture_hash)
-    test_case_file = folder / test_case.json_path
+    """
+    Remove the fixtures from a folder that match the given hashes.
+
+    The removals are grouped by fixture file, so that each file is rewritten once, by a pool of
+    `workers` processes.
+    """
+    removals: Dict[Path, List[str]] = {}
+    for test_case in pop_by_hashes(index, fixture_hashes):
+        removals.setdefault(test_case.json_path, []).append(test_case.id)
     if dry_run:
-        print(f"Remove {test_case.id} from {test_case_file}")
-    else:
-        remove_fixture_from_file(test_case_file, test_case.id)
+        for json_path, test_case_ids in removals.items():
+            for test_case_id in test_case_ids:
+                print(f"Remove {test_case_id} from {folder / json_path}")
+        return
+
+    workers = max(1, min(workers, len(removals)))
+    files = [folder / json_path for json_path in removals]
+    with ExitStack() as stack:
+        locations: Iterable[Dict[str, Tuple[int, int] | None]]
+        if workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            locations = executor.map(remove_fixtures_from_file, files, removals.values())
+        else:
+            locations = map(remove_fixtures_from_file, files, removals.values())
+        file_locations = dict(zip(removals, locations, strict=True))
+
+    # The remaining fixtures of the rewritten files have moved within the files.
+    for test_case in index.test_cases:
+        if test_case.json_path in file_locations:
+            location = file_locations[test_case.json_path].get(test_case.id)
+            test_case.byte_offset, test_case.byte_length = location or (None, None)
 
 
 def rewrite_index(folder: Path, index: IndexFile, dry_run: bool):
@@ -116,13 +175,23 @@ def rewrite_index(folder: Path, index: IndexFile, dry_run: bool):
     is_flag=True,
     help="Abort if the patch folder would be empty after fixture removal.",
 )
+@click.option(
+    "--workers",
+    "-n",
+    type=int,
+    default=None,
+    help="Number of processes used to rewrite the fixture files (default: the number of CPUs).",
+)
 def main(
     base: Path,
     patch: Path,
     dry_run: bool,
     abort_on_empty_patch: bool,
+    workers: int | None,
 ):
     """Compare two fixture folders and remove duplicates based on fixture hashes."""
+    if workers is None:
+        workers = os.cpu_count() or 1
     try:
         # Load indices
         base_index = load_index(base)
@@ -144,10 +213,9 @@ def main(
             click.echo("Patch folder would be empty after fixture removal.")
             sys.exit(0)
 
-        for duplicate_hash in duplicate_hashes:
-            # Remove from both folders
-            remove_fixture(base, base_index, duplicate_hash, dry_run)
-            remove_fixture(patch, patch_index, duplicate_hash, dry_run)
+        # Remove from both folders
+        remove_fixtures(base, base_index, duplicate_hashes, dry_run, workers)
+        remove_fixtures(patch, patch_index, duplicate_hashes, dry_run, workers)
 
         # Rewrite indices if necessary
         rewrite_index(base, base_index, dry_run)
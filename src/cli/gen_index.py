@@ -3,8 +3,11 @@
 import datetime
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import repeat
 from pathlib import Path
-from typing import List
+from typing import Any, Iterable, List, Tuple
 
 import click
 import rich
@@ -18,25 +21,108 @@ from rich.progress import (
 )
 
 from ethereum_test_base_types import HexNumber
+from ethereum_test_fixtures.base import BaseFixture, fixture_format_discriminator
+from ethereum_test_fixtures.compression import (
+    decode_fixture_file,
+    is_compressed_fixture_file,
+    iter_fixture_files,
+)
 from ethereum_test_fixtures.consume import IndexFile, TestCaseIndexFile
-from ethereum_test_fixtures.file import Fixtures
+from ethereum_test_fixtures.file import scan_fixture_file
 
 from .hasher import HashableItem
+from .index_manifest import (
+    INDEX_MANIFEST_FILE_NAME,
+    FixtureFileEntry,
+    IndexManifest,
+    file_digest,
+)
 
 # Files and directories to exclude from index generation
 INDEX_EXCLUDED_FILES = frozenset({"index.json"})
 INDEX_EXCLUDED_PATH_PARTS = frozenset({".meta", "pre_alloc"})
 
 
-def count_json_files_exclude_index(start_path: Path) -> int:
-    """Return the number of fixture json files in the specified directory."""
-    json_file_count = sum(
-        1
-        for file in start_path.rglob("*.json")
-        if file.name not in INDEX_EXCLUDED_FILES
-        and not any(part in INDEX_EXCLUDED_PATH_PARTS for part in file.parts)
+def is_indexed_file(file: Path) -> bool:
+    """Return True if the fixture file is included in the index."""
+    return file.name not in INDEX_EXCLUDED_FILES and not any(
+        part in INDEX_EXCLUDED_PATH_PARTS for part in file.parts
     )
-    return json_file_count
+
+
+def index_fixtures(
+    file: Path, input_path: Path, text: str, scanned_fixtures: List[Tuple[str, Any, int, int]]
+) -> List[TestCaseIndexFile]:
+    """
+    Return the index entries of the fixtures scanned from a fixture file.
+
+    Only the fields needed by the index are read from the JSON fixtures (`_info`, the fork and
+    `preHash`); the fixtures are not validated, which is the bulk of the cost of loading them.
+    The location of each fixture is recorded for plain files, so that consumers can read a single
+    fixture without parsing the whole file; offsets into the decoded text are byte offsets only
+    for ASCII files, which is the case of all filled fixtures.
+    """
+    relative_file_path = Path(file).absolute().relative_to(Path(input_path).absolute())
+    record_locations = not is_compressed_fixture_file(file) and text.isascii()
+    test_cases: List[TestCaseIndexFile] = []
+    for fixture_name, json_fixture, offset, length in scanned_fixtures:
+        format_name = fixture_format_discriminator(json_fixture)
+        assert format_name is not None, f"Fixture {fixture_name} is null"
+        fixture_format = BaseFixture.formats[format_name]
+        info = json_fixture["_info"]
+        test_cases.append(
+            TestCaseIndexFile(
+                id=fixture_name,
+                json_path=relative_file_path,
+                # eest uses hash; ethereum/tests uses generatedTestHash
+                fixture_hash=info.get("hash") or f"0x{info.get('generatedTestHash')}",
+                fork=fixture_format.get_fork_name_from_json(json_fixture),
+                format=fixture_format,
+                pre_hash=json_fixture.get("preHash"),
+                byte_offset=offset if record_locations else None,
+                byte_length=length if record_locations else None,
+            )
+        )
+    return test_cases
+
+
+def read_fixture_file_entry(
+    file: Path, known_entry: FixtureFileEntry | None, input_path: Path
+) -> FixtureFileEntry:
+    """
+    Read a fixture file and return its manifest entry, with the hashes of its tests and, if the
+    file is indexed, the index entries of its fixtures.
+
+    The known entry of the file is reused if the contents of the file didn't change.
+    """
+    stat = file.stat()
+    data = file.read_bytes()
+    digest = file_digest(data)
+    if known_entry is not None and known_entry.digest == digest:
+        return known_entry.model_copy(update={"size": stat.st_size, "mtime_ns": stat.st_mtime_ns})
+
+    entry = FixtureFileEntry(size=stat.st_size, mtime_ns=stat.st_mtime_ns, digest=digest)
+    indexed = is_indexed_file(file)
+    try:
+        text = decode_fixture_file(file, data)
+        scanned_fixtures = list(scan_fixture_file(text))
+        if indexed:
+            entry.test_cases = [
+                test_case.model_dump(mode="json")
+                for test_case in index_fixtures(file, input_path, text, scanned_fixtures)
+            ]
+    except Exception as e:
+        if indexed:
+            raise ValueError(f"Error loading fixtures from {file}: {e}") from e
+        return entry
+    try:
+        entry.test_hashes = HashableItem.get_test_hashes(
+            {fixture_name: json_fixture for fixture_name, json_fixture, _, _ in scanned_fixtures},
+            file.name,
+        )
+    except (KeyError, TypeError):
+        pass  # the file can't be hashed, and neither can the directory
+    return entry
 
 
 @click.command(
@@ -71,6 +157,14 @@ def count_json_files_exclude_index(start_path: Path) -> int:
     expose_value=True,
     help="Don't show the progress bar while processing fixture files.",
 )
+@click.option(
+    "--workers",
+    "-n",
+    "workers",
+    type=int,
+    default=None,
+    help="Number of processes used to read the fixture files (default: the number of CPUs).",
+)
 @click.option(
     "--force",
     "-f",
@@ -81,7 +175,11 @@ def count_json_files_exclude_index(start_path: Path) -> int:
     help="Force re-generation of the index file, even if it already exists.",
 )
 def generate_fixtures_index_cli(
-    input_dir: str, quiet_mode: bool, force_flag: bool, disable_infer_format: bool
+    input_dir: str,
+    quiet_mode: bool,
+    force_flag: bool,
+    disable_infer_format: bool,
+    workers: int | None,
 ):
     """CLI wrapper to an index of all the fixtures in the specified directory."""
     generate_fixtures_index(
@@ -89,6 +187,7 @@ def generate_fixtures_index_cli(
         quiet_mode=quiet_mode,
         force_flag=force_flag,
         disable_infer_format=disable_infer_format,
+        workers=workers,
     )
 
 
@@ -97,36 +196,36 @@ def generate_fixtures_index(
     quiet_mode: bool = False,
     force_flag: bool = False,
     disable_infer_format: bool = False,
+    workers: int | None = None,
 ):
     """
     Generate an index file (index.json) of all the fixtures in the specified
     directory.
+
+    The fixture files are read by a pool of `workers` processes, by default one per CPU. The
+    entries of the files that didn't change since the index was last generated are taken from
+    the manifest saved alongside the index file; `force_flag` ignores the manifest.
     """
-    total_files = 0
     if not os.path.isdir(input_path):  # caught by click if using via cli
         raise FileNotFoundError(f"The directory {input_path} does not exist.")
-    if not quiet_mode:
-        total_files = count_json_files_exclude_index(input_path)
 
     output_file = Path(f"{input_path}/.meta/index.json")
     output_file.parent.mkdir(parents=True, exist_ok=True)  # no meta dir in <=v3.0.0
-    try:
-        root_hash = HashableItem.from_folder(folder_path=input_path).hash()
-    except (KeyError, TypeError):
-        root_hash = b""  # just regenerate a new index file
+    manifest_file = output_file.parent / INDEX_MANIFEST_FILE_NAME
+    known_manifest = IndexManifest() if force_flag else IndexManifest.from_file(manifest_file)
 
-    if not force_flag and output_file.exists():
-        index_data: IndexFile
-        try:
-            with open(output_file, "r") as f:
-                index_data = IndexFile(**json.load(f))
-            if index_data.root_hash and index_data.root_hash == HexNumber(root_hash):
-                if not quiet_mode:
-                    rich.print(f"Index file [bold cyan]{output_file}[/] is up-to-date.")
-                return
-        except Exception as e:
-            rich.print(f"Ignoring exception {e}")
-            rich.print(f"...generating a new index file [bold cyan]{output_file}[/]")
+    # Only the files added or modified since the manifest was written are read.
+    manifest = IndexManifest()
+    files_to_read: List[Tuple[Path, FixtureFileEntry | None]] = []
+    for file in sorted(iter_fixture_files(input_path)):
+        if ".meta" in file.parts:
+            continue
+        relative_path = file.relative_to(input_path).as_posix()
+        known_entry = known_manifest.files.get(relative_path)
+        if known_entry is not None and known_entry.matches_stat(file.stat()):
+            manifest.files[relative_path] = known_entry
+        else:
+            files_to_read.append((file, known_entry))
 
     filename_display_width = 25
     with Progress(
@@ -145,54 +244,93 @@ def generate_fixtures_index(
         expand=False,
         disable=quiet_mode,
     ) as progress:  # type: Progress
-        task_id = progress.add_task("[cyan]Processing files...", total=total_files, filename="...")
-        forks = set()
-        fixture_formats = set()
-        test_cases: List[TestCaseIndexFile] = []
-        for file in input_path.rglob("*.json"):
-            if file.name in INDEX_EXCLUDED_FILES or any(
-                part in INDEX_EXCLUDED_PATH_PARTS for part in file.parts
-            ):
-                continue
-
-            try:
-                fixtures: Fixtures = Fixtures.model_validate_json(file.read_text())
-            except Exception as e:
-                rich.print(f"[red]Error loading fixtures from {file}[/red]")
-                raise e
-
-            relative_file_path = Path(file).absolute().relative_to(Path(input_path).absolute())
-            for fixture_name, fixture in fixtures.items():
-                fixture_fork = fixture.get_fork()
-                test_cases.append(
-                    TestCaseIndexFile(
-                        id=fixture_name,
-                        json_path=relative_file_path,
-                        # eest uses hash; ethereum/tests uses generatedTestHash
-                        fixture_hash=fixture.info.get("hash")
-                        or f"0x{fixture.info.get('generatedTestHash')}",
-                        fork=fixture_fork,
-                        format=fixture.__class__,
-                        pre_hash=getattr(fixture, "pre_hash", None),
-                    )
+        task_id = progress.add_task(
+            "[cyan]Processing files...", total=len(files_to_read), filename="..."
+        )
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(files_to_read)))
+        files = [file for file, _ in files_to_read]
+        known_entries = [known_entry for _, known_entry in files_to_read]
+        with ExitStack() as stack:
+            results: Iterable[FixtureFileEntry]
+            if workers > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                results = executor.map(
+                    read_fixture_file_entry,
+                    files,
+                    known_entries,
+                    repeat(input_path),
+                    chunksize=max(1, len(files) // (workers * 16)),
                 )
-                if fixture_fork:
-                    forks.add(fixture_fork)
-                fixture_formats.add(fixture.format_name)
-
-            display_filename = file.name
-            if len(display_filename) > filename_display_width:
-                display_filename = display_filename[: filename_display_width - 3] + "..."
             else:
-                display_filename = display_filename.ljust(filename_display_width)
+                results = map(read_fixture_file_entry, files, known_entries, repeat(input_path))
+            for file, entry in zip(files, results, strict=True):
+                manifest.files[file.relative_to(input_path).as_posix()] = entry
 
-            progress.update(task_id, advance=1, filename=display_filename)
+                display_filename = file.name
+                if len(display_filename) > filename_display_width:
+                    display_filename = display_filename[: filename_display_width - 3] + "..."
+                else:
+                    display_filename = display_filename.ljust(filename_display_width)
+
+                progress.update(task_id, advance=1, filename=display_filename)
 
         progress.update(
             task_id,
-            completed=total_files,
+            completed=len(files_to_read),
             filename="Indexing complete 🦄".ljust(filename_display_width),
         )
+    manifest.files = dict(sorted(manifest.files.items()))
+    manifest_changed = manifest.files != known_manifest.files
+    # The root hash doesn't depend on the names of the files, so renamed or moved files are
+    # detected with the manifest, if there is one.
+    files_changed = bool(known_manifest.files) and {
+        path: entry.digest for path, entry in manifest.files.items()
+    } != {path: entry.digest for path, entry in known_manifest.files.items()}
+
+    def file_item(file_path: Path, parents: List[str]) -> HashableItem:
+        entry = manifest.files.get(file_path.relative_to(input_path).as_posix())
+        if entry is None or entry.test_hashes is None:
+            raise KeyError(f"No test hashes for {file_path}")
+        return HashableItem.from_test_hashes(
+            file_name=file_path.name, test_hashes=entry.test_hashes, parents=parents
+        )
+
+    try:
+        root_hash = HashableItem.from_folder(folder_path=input_path, file_item=file_item).hash()
+    except (KeyError, TypeError):
+        root_hash = b""  # just regenerate a new index file
+
+    if not force_flag and output_file.exists():
+        index_data: IndexFile
+        try:
+            with open(output_file, "r") as f:
+                index_data = IndexFile(**json.load(f))
+            if (
+                index_data.root_hash
+                and index_data.root_hash == HexNumber(root_hash)
+                and not files_changed
+            ):
+                if manifest_changed:
+                    manifest.write(manifest_file)
+                if not quiet_mode:
+                    rich.print(f"Index file [bold cyan]{output_file}[/] is up-to-date.")
+                return
+        except Exception as e:
+            rich.print(f"Ignoring exception {e}")
+            rich.print(f"...generating a new index file [bold cyan]{output_file}[/]")
+
+    forks = set()
+    fixture_formats = set()
+    test_cases: List[TestCaseIndexFile] = []
+    for entry in manifest.files.values():
+        for json_test_case in entry.test_cases or []:
+            test_case = TestCaseIndexFile.model_validate(json_test_case)
+            test_cases.append(test_case)
+            if test_case.fork:
+                forks.add(test_case.fork)
+            fixture_formats.add(test_case.format.format_name)
 
     index = IndexFile(
         test_cases=test_cases,
@@ -205,6 +343,7 @@ def generate_fixtures_index(
 
     with open(output_file, "w") as f:
         f.write(index.model_dump_json(exclude_none=False, indent=2))
+    manifest.write(manifest_file)
 
 
 if __name__ == "__main__":
@@ -5,10 +5,16 @@ import json
 from dataclasses import dataclass, field
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import click
 
+from ethereum_test_fixtures.compression import (
+    is_fixture_file,
+    open_fixture_file,
+    uncompressed_name,
+)
+
 
 class HashableItemType(IntEnum):
     """Represents the type of a hashable item."""
@@ -56,17 +62,15 @@ class HashableItem:
             for key, item in sorted(self.items.items()):
                 item.print(name=key, level=next_level, print_type=print_type)
 
-    @classmethod
-    def from_json_file(cls, *, file_path: Path, parents: List[str]) -> "HashableItem":
-        """Create a hashable item from a JSON file."""
-        items = {}
-        with file_path.open("r") as f:
-            data = json.load(f)
+    @staticmethod
+    def get_test_hashes(data: Any, file_name: str) -> Dict[str, str]:
+        """Return the hash of each test of the decoded contents of a JSON fixture file."""
+        test_hashes: Dict[str, str] = {}
         for key, item in sorted(data.items()):
             if not isinstance(item, dict):
                 raise TypeError(f"Expected dict, got {type(item)} for {key}")
             if "_info" not in item:
-                raise KeyError(f"Expected '_info' in {key}, json file: {file_path.name}")
+                raise KeyError(f"Expected '_info' in {key}, json file: {file_name}")
 
             # EEST uses 'hash'; ethereum/tests use 'generatedTestHash'
             hash_value = item["_info"].get("hash") or item["_info"].get("generatedTestHash")
@@ -75,33 +79,70 @@ class HashableItem:
 
             if not isinstance(hash_value, str):
                 raise TypeError(f"Expected hash to be a string in {key}, got {type(hash_value)}")
+            test_hashes[key] = hash_value
+        return test_hashes
 
-            item_hash_bytes = bytes.fromhex(hash_value[2:])
-            items[key] = cls(
+    @classmethod
+    def from_test_hashes(
+        cls, *, file_name: str, test_hashes: Dict[str, str], parents: List[str]
+    ) -> "HashableItem":
+        """Create a hashable item from the hashes of the tests of a JSON file."""
+        items = {
+            key: cls(
                 type=HashableItemType.TEST,
-                root=item_hash_bytes,
-                parents=parents + [file_path.name],
+                root=bytes.fromhex(hash_value[2:]),
+                parents=parents + [file_name],
             )
+            for key, hash_value in test_hashes.items()
+        }
         return cls(type=HashableItemType.FILE, items=items, parents=parents)
 
+    @classmethod
+    def from_json_file(cls, *, file_path: Path, parents: List[str]) -> "HashableItem":
+        """Create a hashable item from a JSON file."""
+        with open_fixture_file(file_path) as f:
+            data = json.load(f)
+        return cls.from_test_hashes(
+            file_name=file_path.name,
+            test_hashes=cls.get_test_hashes(data, file_path.name),
+            parents=parents,
+        )
+
     @classmethod
     def from_folder(
-        cls, *, folder_path: Path, parents: Optional[List[str]] = None
+        cls,
+        *,
+        folder_path: Path,
+        parents: Optional[List[str]] = None,
+        file_item: Optional[Callable[[Path, List[str]], "HashableItem"]] = None,
     ) -> "HashableItem":
-        """Create a hashable item from a folder."""
+        """
+        Create a hashable item from a folder.
+
+        The items of the JSON files are created by `file_item`, given the path of the file and
+        its parents, which reads the file by default.
+        """
         if parents is None:
             parents = []
+        if file_item is None:
+
+            def file_item(file_path: Path, parents: List[str]) -> "HashableItem":
+                return cls.from_json_file(file_path=file_path, parents=parents)
+
         items = {}
         for file_path in sorted(folder_path.iterdir()):
             if ".meta" in file_path.parts:
                 continue
-            if file_path.is_file() and file_path.suffix == ".json":
-                item = cls.from_json_file(
-                    file_path=file_path, parents=parents + [folder_path.name]
-                )
-                items[file_path.name] = item
+            if file_path.is_file() and is_fixture_file(file_path):
+                item = file_item(file_path, parents + [folder_path.name])
+                # Compressed files hash as their uncompressed counterparts.
+                items[uncompressed_name(file_path)] = item
             elif file_path.is_dir():
-                item = cls.from_folder(folder_path=file_path, parents=parents + [folder_path.name])
+                item = cls.from_folder(
+                    folder_path=file_path,
+                    parents=parents + [folder_path.name],
+                    file_item=file_item,
+                )
                 items[file_path.name] = item
         return cls(type=HashableItemType.FOLDER, items=items, parents=parents)
 
@@ -0,0 +1,57 @@
+"""
+Manifest of the fixture files of a directory, saved alongside its index file.
+
+The manifest records the size, modification time and digest of each fixture file, along with the
+test hashes and index entries read from it, so that the index and the root hash of the directory
+can be updated by reading only the files that were added or modified since the last update.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+INDEX_MANIFEST_FILE_NAME = "index_manifest.json"
+
+
+class FixtureFileEntry(BaseModel):
+    """The state of a fixture file when it was last read, and the data read from it."""
+
+    size: int
+    mtime_ns: int
+    digest: str
+    """SHA-256 digest of the (possibly compressed) contents of the file."""
+    test_hashes: Dict[str, str] | None = None
+    """The hash of each test of the file, or None if the file can't be hashed."""
+    test_cases: List[Dict[str, Any]] | None = None
+    """The JSON index entries of the fixtures of the file, or None if it's not indexed."""
+
+    def matches_stat(self, stat: os.stat_result) -> bool:
+        """Return True if the file has the same size and modification time as when last read."""
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+class IndexManifest(BaseModel):
+    """Entries of the fixture files of a directory, by path relative to the directory."""
+
+    files: Dict[str, FixtureFileEntry] = Field(default_factory=dict)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "IndexManifest":
+        """Load the manifest, or return an empty manifest if it's missing or invalid."""
+        try:
+            return cls.model_validate_json(path.read_bytes())
+        except (OSError, ValueError):
+            return cls()
+
+    def write(self, path: Path) -> None:
+        """Write the manifest."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.model_dump_json(exclude_none=True))
+
+
+def file_digest(data: bytes) -> str:
+    """Return the digest of the contents of a fixture file recorded in the manifest."""
+    return hashlib.sha256(data).hexdigest()
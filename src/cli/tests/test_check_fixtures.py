@@ -0,0 +1,71 @@
+"""Test the parallel and resumable checks of fixture files."""
+
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+from click.testing import CliRunner
+
+from ethereum_test_specs.base import HashMismatchExceptionError
+
+from .. import check_fixtures as check_fixtures_module
+from ..check_fixtures import check_fixtures
+from .test_compressed_fixtures import fill_fixtures
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path: Path) -> Path:
+    """Return a directory of fixture files, with a fixture whose info hash is wrong."""
+    fixtures_dir = tmp_path / "fixtures"
+    fill_fixtures(fixtures_dir, ".json")
+    broken_file = fixtures_dir / "transaction_tests" / "module_b.json"
+    fixtures = json.loads(broken_file.read_text())
+    fixtures["module_b[2]"]["_info"]["hash"] = "0x" + "00" * 32
+    broken_file.write_text(json.dumps(fixtures, indent=4))
+    return fixtures_dir
+
+
+def test_check_fixtures_report_and_journal(
+    tmp_path: Path, fixtures_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test the failure report of a parallel run, and that a run is resumed from its journal."""
+    journal_path = tmp_path / "journal.jsonl"
+    report_path = tmp_path / "report.json"
+    args = ["-i", str(fixtures_dir), "-q", "--journal", str(journal_path)]
+    args += ["--report", str(report_path)]
+    result = CliRunner().invoke(check_fixtures, args + ["--workers", "2"])
+    assert result.exit_code == 0, result.output
+    report = json.loads(report_path.read_text())
+    assert report["checked_files"] == 2
+    assert report["failed_files"] == 1
+    [failure] = report["failures"]
+    assert failure["path"] == str(fixtures_dir / "transaction_tests" / "module_b.json")
+    assert failure["error_type"] == "HashMismatchExceptionError"
+    assert "module_b[2]" in failure["error"]
+    assert len(journal_path.read_text().splitlines()) == 2
+
+    checked_files: List[str] = []
+    check_json_file = check_fixtures_module.check_json_file
+
+    def recording_check_json_file(json_file_path: Path):
+        checked_files.append(json_file_path.name)
+        return check_json_file(json_file_path)
+
+    monkeypatch.setattr(check_fixtures_module, "check_json_file", recording_check_json_file)
+    (fixtures_dir / "transaction_tests" / "module_a.json").touch()
+    report_path.unlink()
+    result = CliRunner().invoke(check_fixtures, args + ["--workers", "1"])
+    assert result.exit_code == 0, result.output
+    assert checked_files == ["module_a.json"]
+    assert json.loads(report_path.read_text()) == report
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_check_fixtures_stop_on_error(fixtures_dir: Path, workers: int):
+    """Test that the original exception is raised when stopping on errors."""
+    result = CliRunner().invoke(
+        check_fixtures,
+        ["-i", str(fixtures_dir), "-q", "--stop-on-error", "--workers", str(workers)],
+    )
+    assert isinstance(result.exception, HashMismatchExceptionError)
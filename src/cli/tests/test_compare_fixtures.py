@@ -0,0 +1,66 @@
+"""Test the removal of duplicate fixtures from two fixture folders."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from ethereum_test_fixtures.file import Fixtures, read_fixture_bytes
+from ethereum_test_fixtures.transaction import FixtureResult, TransactionFixture
+
+from ..compare_fixtures import load_index, main
+from ..gen_index import generate_fixtures_index
+
+
+def fill_fixtures(output_dir: Path, intrinsic_gas_by_name: dict[str, int]) -> None:
+    """Write transaction fixtures with the given intrinsic gas to two files."""
+    for module in ("module_a", "module_b"):
+        fixtures = {}
+        for name, intrinsic_gas in intrinsic_gas_by_name.items():
+            if not name.startswith(module):
+                continue
+            fixture = TransactionFixture(
+                transaction="0x1234",
+                result={"Paris": FixtureResult(intrinsic_gas=intrinsic_gas)},
+            )
+            fixture.fill_info(
+                "t8n-version",
+                "description",
+                fixture_source_url="url",
+                ref_spec=None,
+                _info_metadata={},
+            )
+            fixtures[name] = fixture
+        file_path = output_dir / "transaction_tests" / f"{module}.json"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        Fixtures(root=fixtures).collect_into_file(file_path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_remove_duplicates(tmp_path: Path, workers: int):
+    """Test that duplicates are removed from both folders, and the index locations updated."""
+    base, patch = tmp_path / "base", tmp_path / "patch"
+    intrinsic_gas_by_name = {"module_a[1]": 1, "module_a[2]": 2, "module_b[1]": 3}
+    fill_fixtures(base, intrinsic_gas_by_name | {"module_b[2]": 4})
+    fill_fixtures(patch, intrinsic_gas_by_name | {"module_b[2]": 5})
+    for folder in (base, patch):
+        generate_fixtures_index(folder, quiet_mode=True, workers=1)
+
+    result = CliRunner().invoke(main, [str(base), str(patch), "--workers", str(workers)])
+    assert result.exit_code == 0, result.output
+    assert "Found 3 duplicates." in result.output
+
+    for folder in (base, patch):
+        index = load_index(folder)
+        assert [test_case.id for test_case in index.test_cases] == ["module_b[2]"]
+        assert json.loads((folder / "transaction_tests" / "module_a.json").read_text()) == {}
+        [test_case] = index.test_cases
+        assert test_case.byte_offset is not None and test_case.byte_length is not None
+        fixture_file = folder / test_case.json_path
+        assert (
+            json.loads(
+                read_fixture_bytes(fixture_file, test_case.byte_offset, test_case.byte_length)
+            )
+            == json.loads(fixture_file.read_text())["module_b[2]"]
+        )
@@ -0,0 +1,58 @@
+"""Test that the fixture CLI tools read compressed fixture files."""
+
+import json
+from pathlib import Path
+
+from ethereum_test_fixtures.consume import IndexFile
+from ethereum_test_fixtures.file import Fixtures
+from ethereum_test_fixtures.transaction import FixtureResult, TransactionFixture
+
+from ..check_fixtures import check_json
+from ..gen_index import generate_fixtures_index
+from ..hasher import HashableItem
+
+
+def fill_fixtures(output_dir: Path, suffix: str) -> None:
+    """Write the same fixtures to two files with the given suffix."""
+    for module in ("module_a", "module_b"):
+        fixtures = {}
+        for intrinsic_gas in (1, 2):
+            fixture = TransactionFixture(
+                transaction="0x1234",
+                result={"Paris": FixtureResult(intrinsic_gas=intrinsic_gas)},
+            )
+            fixture.fill_info(
+                "t8n-version",
+                "description",
+                fixture_source_url="url",
+                ref_spec=None,
+                _info_metadata={},
+            )
+            fixtures[f"{module}[{intrinsic_gas}]"] = fixture
+        file_path = output_dir / "transaction_tests" / f"{module}{suffix}"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        Fixtures(root=fixtures).collect_into_file(file_path)
+
+
+def test_index_and_hash_of_compressed_fixtures(tmp_path: Path):
+    """Test that compressed fixtures are indexed, and hash as their plain counterparts."""
+    fill_fixtures(tmp_path / "plain", ".json")
+    fill_fixtures(tmp_path / "compressed", ".json.gz")
+    assert (
+        HashableItem.from_folder(folder_path=tmp_path / "compressed").hash()
+        == HashableItem.from_folder(folder_path=tmp_path / "plain").hash()
+    )
+
+    generate_fixtures_index(tmp_path / "compressed", quiet_mode=True)
+    index = IndexFile.model_validate(
+        json.loads((tmp_path / "compressed" / ".meta" / "index.json").read_text())
+    )
+    assert index.test_count == 4
+    for file_path in (tmp_path / "compressed").rglob("*.json.gz"):
+        check_json(file_path)
+    assert sorted(str(test_case.json_path) for test_case in index.test_cases) == [
+        "transaction_tests/module_a.json.gz",
+        "transaction_tests/module_a.json.gz",
+        "transaction_tests/module_b.json.gz",
+        "transaction_tests/module_b.json.gz",
+    ]
@@ -0,0 +1,135 @@
+"""Test the location of each fixture recorded in the index file."""
+
+import json
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ethereum_test_fixtures.consume import IndexFile
+from ethereum_test_fixtures.file import read_fixture_bytes, scan_fixture_file
+from ethereum_test_fixtures.transaction import TransactionFixture
+
+from .. import gen_index
+from ..gen_index import generate_fixtures_index
+from ..hasher import HashableItem
+from .test_compressed_fixtures import fill_fixtures
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "{}",
+        ' { "a" : {"b": [1, "}"]} ,\n"c":null}\n',
+        json.dumps({"x": {"y": "z"}, "w": 1}, indent=4),
+    ],
+)
+def test_scan_fixture_file(text: str):
+    """Test that the scanned values and locations match the parsed JSON object."""
+    scanned = list(scan_fixture_file(text))
+    assert {name: value for name, value, _, _ in scanned} == json.loads(text)
+    for _, value, offset, length in scanned:
+        assert json.loads(text[offset : offset + length]) == value
+
+
+def test_index_byte_offsets(tmp_path: Path):
+    """Test that single fixtures can be read from plain files at the indexed locations."""
+    fill_fixtures(tmp_path / "plain", ".json")
+    fill_fixtures(tmp_path / "compressed", ".json.gz")
+    for folder in ("plain", "compressed"):
+        generate_fixtures_index(tmp_path / folder, quiet_mode=True)
+
+    index = IndexFile.model_validate_json(
+        (tmp_path / "plain" / ".meta" / "index.json").read_text()
+    )
+    assert index.test_count == 4
+    for test_case in index.test_cases:
+        assert test_case.byte_offset is not None and test_case.byte_length is not None
+        fixture_path = tmp_path / "plain" / test_case.json_path
+        fixture_json = read_fixture_bytes(
+            fixture_path, test_case.byte_offset, test_case.byte_length
+        )
+        fixture = TransactionFixture.model_validate_json(fixture_json)
+        assert json.loads(fixture_json) == json.loads(fixture_path.read_text())[test_case.id]
+        assert fixture.info["hash"] == str(test_case.fixture_hash)
+
+    compressed_index = IndexFile.model_validate_json(
+        (tmp_path / "compressed" / ".meta" / "index.json").read_text()
+    )
+    assert all(test_case.byte_offset is None for test_case in compressed_index.test_cases)
+
+
+def test_parallel_index(tmp_path: Path):
+    """Test that the index built by a process pool matches the one built in a single process."""
+    fill_fixtures(tmp_path, ".json")
+    indexes = []
+    for workers in (1, 2):
+        generate_fixtures_index(tmp_path, quiet_mode=True, force_flag=True, workers=workers)
+        indexes.append(
+            IndexFile.model_validate_json((tmp_path / ".meta" / "index.json").read_text())
+        )
+    assert indexes[0].test_cases == indexes[1].test_cases
+    assert [fork.name() for fork in indexes[0].forks or []] == ["Paris"]
+    assert indexes[0].fixture_formats == ["transaction_test"]
+    for test_case in indexes[0].test_cases:
+        fixtures = json.loads((tmp_path / test_case.json_path).read_text())
+        fixture = TransactionFixture.model_validate(fixtures[test_case.id])
+        assert test_case.fork == fixture.get_fork()
+        assert test_case.format == TransactionFixture
+
+
+def test_incremental_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that only added or modified files are read when regenerating the index."""
+    fixtures_dir = tmp_path / "fixtures"
+    fill_fixtures(fixtures_dir, ".json")
+    read_files: List[str] = []
+    read_fixture_file_entry = gen_index.read_fixture_file_entry
+
+    def recording_read_fixture_file_entry(file: Path, *args):
+        read_files.append(file.name)
+        return read_fixture_file_entry(file, *args)
+
+    monkeypatch.setattr(gen_index, "read_fixture_file_entry", recording_read_fixture_file_entry)
+
+    def generate_index() -> IndexFile:
+        read_files.clear()
+        generate_fixtures_index(fixtures_dir, quiet_mode=True, workers=1)
+        index = IndexFile.model_validate_json((fixtures_dir / ".meta" / "index.json").read_text())
+        assert index.root_hash == int.from_bytes(
+            HashableItem.from_folder(folder_path=fixtures_dir).hash(), "big"
+        )
+        return index
+
+    index = generate_index()
+    assert sorted(read_files) == ["module_a.json", "module_b.json"]
+    assert (fixtures_dir / ".meta" / "index_manifest.json").exists()
+
+    assert generate_index() == index
+    assert read_files == []
+
+    module_a = fixtures_dir / "transaction_tests" / "module_a.json"
+    stat = module_a.stat()
+    os.utime(module_a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert generate_index() == index
+    assert read_files == ["module_a.json"]
+
+    module_a.unlink()
+    fill_fixtures(tmp_path / "new", ".json")
+    (tmp_path / "new" / "transaction_tests" / "module_a.json").rename(
+        fixtures_dir / "transaction_tests" / "module_c.json"
+    )
+    index = generate_index()
+    assert read_files == ["module_c.json"]
+    assert sorted(test_case.id for test_case in index.test_cases) == [
+        "module_a[1]",
+        "module_a[2]",
+        "module_b[1]",
+        "module_b[2]",
+    ]
+    assert sorted(str(test_case.json_path) for test_case in index.test_cases) == [
+        "transaction_tests/module_b.json",
+        "transaction_tests/module_b.json",
+        "transaction_tests/module_c.json",
+        "transaction_tests/module_c.json",
+    ]
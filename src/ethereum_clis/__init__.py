@@ -7,9 +7,14 @@ from .clis.execution_specs import ExecutionSpecsTransitionTool
 from .clis.geth import GethFixtureConsumer, GethTransitionTool
 from .clis.nethermind import Nethtest, NethtestFixtureConsumer
 from .clis.nimbus import NimbusTransitionTool
+from .clis.replay import ReplayTransitionTool
 from .ethereum_cli import CLINotFoundInPathError, UnknownCLIError
 from .fixture_consumer_tool import FixtureConsumerTool
-from .transition_tool import TransitionTool
+from .trace_store import TraceStore, TransactionTrace
+from .transition_tool import TransitionTool, TransitionToolDaemonPool
+from .transition_tool_archive import TransitionToolArchive
+from .transition_tool_cache import TransitionToolCache
+from .transition_tool_metrics import TransitionToolMetrics
 from .types import (
     BlockExceptionWithMessage,
     Result,
@@ -34,9 +39,16 @@ __all__ = (
     "Nethtest",
     "NethtestFixtureConsumer",
     "NimbusTransitionTool",
+    "ReplayTransitionTool",
     "Result",
+    "TraceStore",
     "TransactionExceptionWithMessage",
+    "TransactionTrace",
     "TransitionTool",
+    "TransitionToolArchive",
+    "TransitionToolCache",
+    "TransitionToolDaemonPool",
+    "TransitionToolMetrics",
     "TransitionToolOutput",
     "UnknownCLIError",
 )
@@ -1,16 +1,14 @@
 """Hyperledger Besu Transition tool frontend."""
 
 import json
-import os
 import re
 import subprocess
 import tempfile
 import textwrap
+import time
 from pathlib import Path
 from typing import ClassVar, Dict, Optional
 
-import requests  # type: ignore
-
 from ethereum_test_exceptions import (
     BlockException,
     ExceptionBase,
@@ -28,6 +26,7 @@ class BesuTransitionTool(TransitionTool):
 
     default_binary = Path("evm")
     detect_binary_pattern = re.compile(r"^Besu evm .*$")
+    t8n_use_server = True
     binary: Path
     cached_version: Optional[str] = None
     trace: bool
@@ -93,7 +92,7 @@ class BesuTransitionTool(TransitionTool):
         if self.besu_trace_dir:
             self.besu_trace_dir.cleanup()
 
-    def evaluate(
+    def _evaluate(
         self,
         *,
         transition_tool_data: TransitionTool.TransitionToolData,
@@ -104,7 +103,10 @@ class BesuTransitionTool(TransitionTool):
         if not self.process:
             self.start_server()
 
-        input_json = transition_tool_data.to_input().model_dump(mode="json", **model_dump_config)
+        with self._measure("serialization"):
+            input_json = transition_tool_data.to_input().model_dump(
+                mode="json", **model_dump_config
+            )
 
         state_json = {
             "fork": transition_tool_data.fork_name,
@@ -140,11 +142,12 @@ class BesuTransitionTool(TransitionTool):
                 },
             )
 
-        response = requests.post(self.server_url, json=post_data, timeout=5)
-        response.raise_for_status()  # exception visible in pytest failure output
-        output: TransitionToolOutput = TransitionToolOutput.model_validate(
-            response.json(), context={"exception_mapper": self.exception_mapper}
-        )
+        start = time.perf_counter()
+        response = self._server_post(data=post_data, timeout=5)
+        if self.metrics is not None and self.metrics.current_call is not None:
+            self.record_server_response(response, time.perf_counter() - start)
+        with self._measure("parse"):
+            output: TransitionToolOutput = self.parse_output(response.json())
 
         if debug_output_path:
             dump_files_to_directory(
@@ -156,12 +159,6 @@ class BesuTransitionTool(TransitionTool):
                 },
             )
 
-        if response.status_code != 200:
-            raise Exception(
-                f"t8n-server returned status code {response.status_code}, "
-                f"response: {response.text}"
-            )
-
         if debug_output_path:
             dump_files_to_directory(
                 debug_output_path,
@@ -175,10 +172,9 @@ class BesuTransitionTool(TransitionTool):
             )
 
         if self.trace and self.besu_trace_dir:
+            # The trace store takes ownership of the trace files, moving them out of the
+            # server's output directory.
             self.collect_traces(output.result.receipts, self.besu_trace_dir, debug_output_path)
-            for i, r in enumerate(output.result.receipts):
-                trace_file_name = f"trace-{i}-{r.transaction_hash}.jsonl"
-                os.remove(os.path.join(self.besu_trace_dir.name, trace_file_name))
 
         return output
 
@@ -4,10 +4,11 @@ Ethereum Specs EVM Resolver Transition Tool Interface.
 https://github.com/petertdavies/ethereum-spec-evm-resolver
 """
 
+import hashlib
+import json
 import os
 import re
 import subprocess
-import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import ClassVar, Dict, List, Optional
@@ -20,7 +21,7 @@ from ethereum_test_exceptions import (
 )
 from ethereum_test_forks import Fork
 
-from ..transition_tool import TransitionTool
+from ..transition_tool import TransitionTool, unix_socket_url, wait_for_unix_socket
 
 DAEMON_STARTUP_TIMEOUT_SECONDS = 5
 
@@ -47,6 +48,7 @@ class ExecutionSpecsTransitionTool(TransitionTool):
     t8n_use_server: bool = True
     server_dir: Optional[TemporaryDirectory] = None
     server_url: str | None = None
+    resolutions_identity: str | None = None
 
     def __init__(
         self,
@@ -75,33 +77,64 @@ class ExecutionSpecsTransitionTool(TransitionTool):
         self.help_string = result.stdout
         self.server_url = server_url
 
-    def start_server(self):
+    def cache_identity(self) -> str | None:
         """
-        Start the t8n-server process, extract the port, and leave it running
-        for future reuse.
+        Return the identity of the resolver and of the EELS versions it resolves forks to.
+
+        The resolutions are read, as by the resolver, from `EELS_RESOLUTIONS` or from the file
+        at `EELS_RESOLUTIONS_FILE`. The identity can't be determined if any fork resolves to a
+        local checkout or to a branch without a pinned commit, since their contents can change
+        while the resolutions stay the same.
         """
-        self.server_dir = TemporaryDirectory()
-        self.server_file_path = Path(self.server_dir.name) / "t8n.sock"
-        replaced_str = str(self.server_file_path).replace("/", "%2F")
-        self.server_url = f"http+unix://{replaced_str}/"
-        self.process = subprocess.Popen(
+        if self.resolutions_identity is None:
+            resolutions_json = os.environ.get("EELS_RESOLUTIONS")
+            if resolutions_json is None and (file := os.environ.get("EELS_RESOLUTIONS_FILE")):
+                resolutions_json = Path(file).read_text()
+            if resolutions_json is None:
+                self.resolutions_identity = ""
+            else:
+                resolutions = json.loads(resolutions_json)
+                if any(
+                    "same_as" not in resolution and "commit" not in resolution
+                    for resolution in resolutions.values()
+                ):
+                    return None
+                resolutions_digest = hashlib.sha256(
+                    json.dumps(resolutions, sort_keys=True).encode()
+                ).hexdigest()
+                self.resolutions_identity = f" resolutions {resolutions_digest}"
+        return f"{super().cache_identity()}{self.resolutions_identity}"
+
+    def start_daemon(self, socket_path: Path) -> subprocess.Popen:
+        """Start an `ethereum-spec-evm-resolver` daemon listening on `socket_path`."""
+        return subprocess.Popen(
             args=[
                 str(self.binary),
                 "daemon",
                 "--uds",
-                self.server_file_path,
+                socket_path,
             ],
         )
-        start = time.time()
-        while True:
-            if self.server_file_path.exists():
-                break
-            if time.time() - start > DAEMON_STARTUP_TIMEOUT_SECONDS:
-                raise Exception("Failed starting ethereum-spec-evm subprocess")
-            time.sleep(0)  # yield to other processes
+
+    def start_server(self):
+        """
+        Start the t8n-server process, extract the port, and leave it running
+        for future reuse.
+        """
+        self.server_dir = TemporaryDirectory()
+        self.server_file_path = Path(self.server_dir.name) / "t8n.sock"
+        self.server_url = unix_socket_url(self.server_file_path)
+        self.process = self.start_daemon(self.server_file_path)
+        try:
+            wait_for_unix_socket(
+                self.server_file_path, DAEMON_STARTUP_TIMEOUT_SECONDS, self.process
+            )
+        except Exception as e:
+            raise Exception("Failed starting ethereum-spec-evm subprocess") from e
 
     def shutdown(self):
         """Stop the t8n-server process if it was started."""
+        super().shutdown()
         if self.process:
             self.process.terminate()
         if self.server_dir:
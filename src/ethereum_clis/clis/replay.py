@@ -0,0 +1,83 @@
+"""Transition tool that replays the outputs recorded from another transition tool."""
+
+import re
+import sys
+from pathlib import Path
+from typing import Optional, Set
+
+from ethereum_test_forks import Fork
+
+from ..transition_tool import TransitionTool
+from ..transition_tool_archive import TransitionToolArchive
+from ..types import TransitionToolOutput
+
+
+class ReplayTransitionTool(TransitionTool):
+    """
+    Transition tool that serves the outputs recorded in an archive by `fill --t8n-record`,
+    without running any client binary.
+
+    Replaying a fill isolates the time spent by the framework itself (pydantic models,
+    transaction signing, state roots, fixture writing) from the time spent executing the EVM,
+    and can be run on machines without any transition tool installed:
+
+    ```console
+    uv run fill --t8n-record=t8n-archive ...
+    uv run fill --t8n-replay=t8n-archive ...
+    ```
+
+    Every request must have been recorded; an unrecorded request raises an exception.
+    """
+
+    default_binary = Path("ethereum-t8n-replay")
+    detect_binary_pattern = re.compile(r"^ethereum-t8n-replay\b")
+
+    archive: TransitionToolArchive
+    recorded_forks: Set[str]
+
+    def __init__(
+        self,
+        *,
+        archive: Path,
+        binary: Optional[Path] = None,
+        trace: bool = False,
+    ):
+        """
+        Open the archive; the binary is ignored since no tool is executed.
+
+        The base class requires an existing binary, so the Python interpreter stands in for
+        it, and the archive is reported as the binary once initialized.
+        """
+        if trace:
+            raise Exception("Traces cannot be collected when replaying t8n outputs.")
+        self.archive = TransitionToolArchive(archive)
+        manifest = self.archive.read_manifest()
+        super().__init__(
+            exception_mapper=self.archive.exception_mapper(),
+            binary=Path(sys.executable),
+            trace=trace,
+        )
+        self.binary = archive
+        self.cached_version = f"replay of {manifest['tool']} {manifest['version']}"
+        self.recorded_forks = self.archive.recorded_forks()
+
+    def is_fork_supported(self, fork: Fork) -> bool:
+        """Return True if outputs of the fork were recorded in the archive."""
+        return fork.transition_tool_name() in self.recorded_forks
+
+    def _evaluate(
+        self,
+        *,
+        transition_tool_data: TransitionTool.TransitionToolData,
+        debug_output_path: str = "",
+        slow_request: bool = False,
+    ) -> TransitionToolOutput:
+        """Return the recorded output of the request."""
+        entry = self.archive.lookup(self.archive_key(transition_tool_data))
+        if entry is None:
+            raise Exception(
+                f"t8n request for fork {transition_tool_data.fork_name} not found in the "
+                f"archive {self.archive.directory}; record it again with `fill --t8n-record`."
+            )
+        self._info_metadata = entry["info_metadata"]
+        return self.parse_output(entry["output"])
@@ -1,12 +1,18 @@
 """Methods to work with the filesystem and json."""
 
+import hashlib
 import os
+import shutil
 import stat
-from json import dump
-from typing import Any, Dict
+import tempfile
+from json import dump, dumps
+from pathlib import Path
+from typing import Any, Dict, List
 
 from pydantic import BaseModel, RootModel
 
+RAM_FILESYSTEM_PATH = Path("/dev/shm")
+
 
 def write_json_file(data: Dict[str, Any], file_path: str) -> None:
     """Write a JSON file to the given path."""
@@ -14,6 +20,86 @@ def write_json_file(data: Dict[str, Any], file_path: str) -> None:
         dump(data, f, ensure_ascii=False, indent=4)
 
 
+class ReusableWorkspace:
+    """
+    Temporary directory that is reused between transition tool calls.
+
+    The directory is created in a RAM-backed filesystem when available and requested, and its
+    subdirectories are only created once. Input files are only rewritten if their contents
+    changed since the last call, and every other file is removed by `recycle` before the next
+    call.
+    """
+
+    temp_dir: tempfile.TemporaryDirectory
+    subdirectories: List[str]
+    input_subdirectory: str
+    in_ram_filesystem: bool
+
+    def __init__(
+        self,
+        *,
+        subdirectories: List[str],
+        input_subdirectory: str,
+        use_ram_filesystem: bool = True,
+    ):
+        """Create the workspace directory and its subdirectories."""
+        base_dir: Path | None = None
+        if (
+            use_ram_filesystem
+            and RAM_FILESYSTEM_PATH.is_dir()
+            and os.access(RAM_FILESYSTEM_PATH, os.W_OK)
+        ):
+            base_dir = RAM_FILESYSTEM_PATH
+        self.in_ram_filesystem = base_dir is not None
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="t8n-", dir=base_dir)
+        self.subdirectories = subdirectories
+        self.input_subdirectory = input_subdirectory
+        for subdirectory in subdirectories:
+            os.mkdir(os.path.join(self.name, subdirectory))
+        self._input_digests: Dict[str, bytes] = {}
+
+    @property
+    def name(self) -> str:
+        """Return the path of the workspace directory."""
+        return self.temp_dir.name
+
+    def write_json_file(self, data: Dict[str, Any], file_path: str) -> bool:
+        """
+        Write a JSON file to the given path if its contents changed since the last write.
+
+        Return True if the file was written.
+        """
+        contents = dumps(data, ensure_ascii=False, indent=4).encode()
+        digest = hashlib.sha256(contents).digest()
+        if self._input_digests.get(file_path) == digest and os.path.exists(file_path):
+            return False
+        with open(file_path, "wb") as f:
+            f.write(contents)
+        self._input_digests[file_path] = digest
+        return True
+
+    def recycle(self) -> None:
+        """Remove all the files produced by the previous call, keeping the input files."""
+        for entry in os.scandir(self.name):
+            if entry.name == self.input_subdirectory:
+                continue
+            if entry.name in self.subdirectories:
+                for sub_entry in os.scandir(entry.path):
+                    if sub_entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(sub_entry.path)
+                    else:
+                        os.unlink(sub_entry.path)
+            elif entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+    def cleanup(self) -> None:
+        """Remove the workspace directory."""
+        self._input_digests.clear()
+        self.temp_dir.cleanup()
+
+
 def dump_files_to_directory(output_path: str, files: Dict[str, Any]) -> None:
     """Dump the files to the given directory."""
     os.makedirs(output_path, exist_ok=True)
@@ -0,0 +1,48 @@
+"""Test the filesystem helpers used by the transition tools."""
+
+import os
+
+from ethereum_clis import file_utils
+from ethereum_clis.file_utils import ReusableWorkspace
+
+
+def test_reusable_workspace():
+    """Test that unchanged inputs are not rewritten and outputs are removed between calls."""
+    workspace = ReusableWorkspace(subdirectories=["input", "output"], input_subdirectory="input")
+    try:
+        env_path = os.path.join(workspace.name, "input", "env.json")
+        assert workspace.write_json_file({"number": "0x1"}, env_path)
+        assert not workspace.write_json_file({"number": "0x1"}, env_path)
+        assert workspace.write_json_file({"number": "0x2"}, env_path)
+
+        output_path = os.path.join(workspace.name, "output", "result.json")
+        trace_path = os.path.join(workspace.name, "trace-0-0x00.jsonl")
+        for path in [output_path, trace_path]:
+            with open(path, "w") as f:
+                f.write("{}")
+        workspace.recycle()
+
+        assert os.path.exists(env_path)
+        assert os.path.isdir(os.path.join(workspace.name, "output"))
+        assert not os.path.exists(output_path)
+        assert not os.path.exists(trace_path)
+        # An input file removed by someone else is written again.
+        os.unlink(env_path)
+        assert workspace.write_json_file({"number": "0x2"}, env_path)
+    finally:
+        workspace.cleanup()
+    assert not os.path.exists(workspace.name)
+
+
+def test_reusable_workspace_location(monkeypatch, tmp_path):
+    """Test that the workspace is only placed in the RAM-backed filesystem when requested."""
+    monkeypatch.setattr(file_utils, "RAM_FILESYSTEM_PATH", tmp_path)
+    for use_ram_filesystem in [True, False]:
+        workspace = ReusableWorkspace(
+            subdirectories=["input"],
+            input_subdirectory="input",
+            use_ram_filesystem=use_ram_filesystem,
+        )
+        workspace.cleanup()
+        assert workspace.in_ram_filesystem == use_ram_filesystem
+        assert (os.path.dirname(workspace.name) == str(tmp_path)) == use_ram_filesystem
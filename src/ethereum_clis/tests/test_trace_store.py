@@ -0,0 +1,39 @@
+"""Test the on-disk storage of transition tool traces."""
+
+import json
+from pathlib import Path
+
+from ethereum_clis import TraceStore
+
+
+def write_trace_file(path: Path, step_count: int) -> Path:
+    """Write a trace file with `step_count` alternating PUSH1/ADD steps and a summary line."""
+    with open(path, "w") as f:
+        for pc in range(step_count):
+            op_name, gas_cost = ("PUSH1", "0x3") if pc % 2 == 0 else ("ADD", 3)
+            f.write(json.dumps({"pc": pc, "opName": op_name, "gasCost": gas_cost}) + "\n")
+        f.write(json.dumps({"output": "", "gasUsed": hex(3 * step_count)}) + "\n")
+    return path
+
+
+def test_trace_store(tmp_path: Path):
+    """Test that traces are moved into the store and read lazily from disk."""
+    store = TraceStore(print_steps=3)
+    store.add_block([write_trace_file(tmp_path / "trace-0-0x00.jsonl", 1001)])
+    store.add_block([write_trace_file(tmp_path / "trace-0-0x01.jsonl", 0)])
+    assert not list(tmp_path.iterdir())
+    assert len(store) == 2
+
+    tx_trace = store[0][0]
+    assert len(list(tx_trace)) == 1002
+    summary = tx_trace.summary()
+    assert summary.step_count == 1001
+    assert summary.opcode_counts == {"PUSH1": 501, "ADD": 500}
+    assert summary.opcode_gas == {"PUSH1": 1503, "ADD": 1500}
+    assert [step["pc"] for step in tx_trace.last_steps(3)] == [998, 999, 1000]
+    assert len(tx_trace.last_steps(2000)) == 1001
+    assert store[1][0].last_steps(3) == []
+
+    store_directory = Path(store.directory.name)
+    store.cleanup()
+    assert not store_directory.exists()
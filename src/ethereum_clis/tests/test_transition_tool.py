@@ -1,20 +1,39 @@
 """Test the transition tool and subclasses."""
 
+import json
+import os
 import shutil
 import subprocess
+import sys
+import time
+from datetime import timedelta
 from pathlib import Path
-from typing import Type
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple, Type
 
 import pytest
 
 from ethereum_clis import (
+    BesuTransitionTool,
     CLINotFoundInPathError,
     EvmOneTransitionTool,
     ExecutionSpecsTransitionTool,
     GethTransitionTool,
     NimbusTransitionTool,
+    ReplayTransitionTool,
     TransitionTool,
+    TransitionToolArchive,
+    TransitionToolCache,
+    TransitionToolDaemonPool,
+    TransitionToolMetrics,
+    file_utils,
 )
+from ethereum_clis.transition_tool import wait_for_unix_socket
+from ethereum_test_exceptions import TransactionException
+from ethereum_test_forks import Cancun, Prague
+from ethereum_test_types import Alloc, Environment
+
+FIXTURES_ROOT = Path(os.path.join("src", "ethereum_clis", "tests", "fixtures"))
 
 
 def test_default_tool():
@@ -85,3 +104,383 @@ def test_unknown_binary_path():
     """
     with pytest.raises(CLINotFoundInPathError):
         TransitionTool.from_binary_path(binary_path=Path("unknown_binary_path"))
+
+
+def _start_dummy_daemon(socket_path: Path) -> subprocess.Popen:
+    """Start a process that accepts connections on a unix domain socket, like a t8n daemon."""
+    script = (
+        "import socket, sys, time\n"
+        "s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)\n"
+        "s.bind(sys.argv[1])\n"
+        "s.listen()\n"
+        "time.sleep(60)\n"
+    )
+    return subprocess.Popen([sys.executable, "-c", script, str(socket_path)])
+
+
+def test_supports_daemon(monkeypatch):
+    """Test that only tools implementing `start_daemon` can be used in a daemon pool."""
+
+    class MockCompletedProcess:
+        stdout = ""
+
+    monkeypatch.setattr(shutil, "which", lambda binary: str(binary))
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: MockCompletedProcess())
+    assert ExecutionSpecsTransitionTool().supports_daemon
+    assert not GethTransitionTool().supports_daemon
+
+
+def test_daemon_pool_least_loaded_checkout(tmp_path: Path):
+    """Test that workers are spread over the pool and the last check-in stops the daemons."""
+    started: List[subprocess.Popen] = []
+
+    def start_daemon(socket_path: Path) -> subprocess.Popen:
+        process = _start_dummy_daemon(socket_path)
+        started.append(process)
+        return process
+
+    pools = [
+        TransitionToolDaemonPool(folder=tmp_path, size=2, start_daemon=start_daemon)
+        for _ in range(3)
+    ]
+    urls = [pool.checkout() for pool in pools]
+    assert len(started) == 2, "daemons must only be started once per session"
+    assert urls[0] != urls[1]
+    assert urls[2] == urls[0]
+
+    for pool, url in zip(pools, urls, strict=True):
+        pool.checkin(url)
+    for process in started:
+        assert process.wait(timeout=10) is not None
+    assert not (tmp_path / TransitionToolDaemonPool.state_file_name).exists()
+
+
+def test_daemon_pool_restarts_unhealthy_daemon(tmp_path: Path):
+    """Test that a daemon that stopped accepting connections is restarted on checkout."""
+    started: List[subprocess.Popen] = []
+
+    def start_daemon(socket_path: Path) -> subprocess.Popen:
+        process = _start_dummy_daemon(socket_path)
+        started.append(process)
+        return process
+
+    pool = TransitionToolDaemonPool(folder=tmp_path, size=1, start_daemon=start_daemon)
+    url = pool.checkout()
+    socket_path = tmp_path / "t8n-0.sock"
+    socket_path.unlink()
+    assert pool.checkout() == url
+    assert len(started) == 2
+    assert started[0].wait(timeout=10) is not None, "the unhealthy daemon must be terminated"
+    pool.checkin(url)
+    pool.checkin(url)
+    assert started[1].wait(timeout=10) is not None
+
+
+def test_daemon_pool_ignores_exited_users(tmp_path: Path):
+    """Test that users that exited without checking in don't keep the daemons running."""
+    started: List[subprocess.Popen] = []
+
+    def start_daemon(socket_path: Path) -> subprocess.Popen:
+        process = _start_dummy_daemon(socket_path)
+        started.append(process)
+        return process
+
+    pool = TransitionToolDaemonPool(folder=tmp_path, size=1, start_daemon=start_daemon)
+    url = pool.checkout()
+    crashed_worker = subprocess.Popen([sys.executable, "-c", "pass"])
+    crashed_worker.wait()
+    state_file = tmp_path / TransitionToolDaemonPool.state_file_name
+    state = json.loads(state_file.read_text())
+    state["daemons"][0]["users"].append(crashed_worker.pid)
+    state_file.write_text(json.dumps(state))
+
+    pool.checkin(url)
+    assert started[0].wait(timeout=10) is not None
+    assert not state_file.exists()
+
+
+def test_wait_for_unix_socket_fails_fast_when_daemon_exits(tmp_path: Path):
+    """Test that waiting for a daemon that exited fails right away instead of timing out."""
+    process = subprocess.Popen([sys.executable, "-c", "import sys; sys.exit(3)"])
+    start = time.monotonic()
+    with pytest.raises(Exception, match="exited with code 3"):
+        wait_for_unix_socket(tmp_path / "t8n.sock", timeout=30, process=process)
+    assert time.monotonic() - start < 10
+
+
+def test_daemon_pool_checkout_fails_when_daemon_exits(tmp_path: Path):
+    """Test that a daemon exiting at startup fails the checkout, and that a retry restarts it."""
+    started: List[subprocess.Popen] = []
+
+    def start_daemon(socket_path: Path) -> subprocess.Popen:
+        if not started:
+            process = subprocess.Popen([sys.executable, "-c", "pass"])
+        else:
+            process = _start_dummy_daemon(socket_path)
+        started.append(process)
+        return process
+
+    pool = TransitionToolDaemonPool(folder=tmp_path, size=1, start_daemon=start_daemon)
+    with pytest.raises(Exception, match="exited with code 0"):
+        pool.checkout()
+    url = pool.checkout()
+    assert len(started) == 2
+    pool.checkin(url)
+    assert started[1].wait(timeout=10) is not None
+
+
+class MockServerResponse:
+    """Mock of a t8n-server response."""
+
+    def __init__(self, json_data, request_data):
+        """Initialize the response with the JSON data to return."""
+        self.json_data = json_data
+        self.content = json.dumps(json_data).encode()
+        self.request = SimpleNamespace(body=json.dumps(request_data).encode())
+        self.elapsed = timedelta(seconds=0.001)
+        self.status_code = 200
+
+    def raise_for_status(self):
+        """Do nothing, as the mock response is always successful."""
+
+    def json(self):
+        """Return a copy of the JSON data."""
+        return json.loads(json.dumps(self.json_data))
+
+
+def test_server_session_reuse(monkeypatch):
+    """Test that all t8n-server requests are sent through the same persistent session."""
+
+    class MockCompletedProcess:
+        stdout = ""
+
+    monkeypatch.setattr(shutil, "which", lambda binary: str(binary))
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: MockCompletedProcess())
+    t8n = ExecutionSpecsTransitionTool(server_url="http+unix://t8n.sock/")
+    t8n.metrics = TransitionToolMetrics()
+
+    with open(FIXTURES_ROOT / "1" / "exp.json") as f:
+        tool_output = json.load(f)
+    sessions: List[Any] = []
+
+    class MockSession:
+        def __init__(self):
+            sessions.append(self)
+            self.posts: List[Tuple[str, Dict]] = []
+
+        def post(self, url, *, json, timeout):
+            self.posts.append((url, json))
+            return MockServerResponse(tool_output, json)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr("ethereum_clis.transition_tool.Session", MockSession)
+    for state_test in [True, False, True]:
+        output = t8n.evaluate(
+            transition_tool_data=TransitionTool.TransitionToolData(
+                alloc=Alloc(),
+                txs=[],
+                env=Environment(),
+                fork=Cancun,
+                chain_id=1,
+                reward=0,
+                blob_schedule=None,
+                state_test=state_test,
+            )
+        )
+        assert output.result.gas_used == 0x5208
+
+    assert len(sessions) == 1
+    assert len(sessions[0].posts) == 3
+    assert [(call.mode, call.gas_used) for call in t8n.metrics.calls] == [("server", 0x5208)] * 3
+    assert all(
+        call.execution_time > 0 and call.request_bytes > 0 and call.response_bytes > 0
+        for call in t8n.metrics.calls
+    )
+    assert t8n.metrics.current_call is None
+
+
+def test_besu_evaluate_is_measured_and_cached(monkeypatch, tmp_path: Path):
+    """Test that Besu evaluations go through the metrics, cache and recorder of the base tool."""
+
+    class MockCompletedProcess:
+        stdout = ""
+
+    monkeypatch.setattr(shutil, "which", lambda binary: str(binary))
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: MockCompletedProcess())
+    t8n = BesuTransitionTool()
+    t8n.process = SimpleNamespace()  # type: ignore[assignment]
+    t8n.cached_version = "besu 1.0"
+    t8n.metrics = TransitionToolMetrics()
+    t8n.cache = TransitionToolCache(directory=tmp_path / "cache", max_size=2**20)
+    t8n.recorder = TransitionToolArchive(tmp_path / "archive")
+
+    with open(FIXTURES_ROOT / "1" / "exp.json") as f:
+        tool_output = json.load(f)
+    posts: List[Dict] = []
+
+    def mock_server_post(*, data, timeout, url_args=None):
+        posts.append(data)
+        return MockServerResponse(tool_output, data)
+
+    monkeypatch.setattr(t8n, "_server_post", mock_server_post)
+    transition_tool_data = TransitionTool.TransitionToolData(
+        alloc=Alloc(),
+        txs=[],
+        env=Environment(),
+        fork=Cancun,
+        chain_id=1,
+        reward=0,
+        blob_schedule=None,
+    )
+    outputs = [t8n.evaluate(transition_tool_data=transition_tool_data) for _ in range(2)]
+
+    assert outputs[0] == outputs[1]
+    assert len(posts) == 1
+    assert posts[0]["state"] == {"fork": "Cancun", "chainid": 1, "reward": 0}
+    assert [(call.mode, call.gas_used) for call in t8n.metrics.calls] == [
+        ("server", 0x5208),
+        ("cache", 0x5208),
+    ]
+    assert t8n.metrics.calls[0].response_bytes > 0
+    assert len(list((tmp_path / "archive").iterdir())) > 0
+
+
+def test_besu_collects_traces(monkeypatch):
+    """Test that the traces written by the Besu t8n-server are moved into the trace store."""
+
+    class MockCompletedProcess:
+        stdout = ""
+
+    monkeypatch.setattr(shutil, "which", lambda binary: str(binary))
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: MockCompletedProcess())
+    t8n = BesuTransitionTool(trace=True)
+    t8n.process = SimpleNamespace(kill=lambda: None)  # type: ignore[assignment]
+    assert t8n.besu_trace_dir is not None
+    trace_dir = Path(t8n.besu_trace_dir.name)
+
+    with open(FIXTURES_ROOT / "1" / "exp.json") as f:
+        tool_output = json.load(f)
+    trace_file_names = [
+        f"trace-{i}-{receipt['transactionHash']}.jsonl"
+        for i, receipt in enumerate(tool_output["result"]["receipts"])
+    ]
+
+    def mock_server_post(*, data, timeout, url_args=None):
+        for trace_file_name in trace_file_names:
+            (trace_dir / trace_file_name).write_text("{}\n")
+        return MockServerResponse(tool_output, data)
+
+    monkeypatch.setattr(t8n, "_server_post", mock_server_post)
+    transition_tool_data = TransitionTool.TransitionToolData(
+        alloc=Alloc(),
+        txs=[],
+        env=Environment(),
+        fork=Cancun,
+        chain_id=1,
+        reward=0,
+        blob_schedule=None,
+    )
+    for _ in range(2):
+        t8n.evaluate(transition_tool_data=transition_tool_data)
+
+    traces = t8n.get_traces()
+    assert traces is not None and len(traces) == 2
+    assert [trace.path.name for trace in traces[1]] == trace_file_names
+    assert all(trace.path.exists() for block in traces for trace in block)
+    assert list(trace_dir.iterdir()) == []
+    t8n.reset_traces()
+    t8n.shutdown()
+
+
+def test_filesystem_workspace_falls_back_to_disk(monkeypatch, tmp_path: Path):
+    """Test that the workspace leaves the RAM-backed filesystem when it runs out of space."""
+    ram_filesystem_path = tmp_path / "shm"
+    ram_filesystem_path.mkdir()
+    monkeypatch.setattr(file_utils, "RAM_FILESYSTEM_PATH", ram_filesystem_path)
+    with open(FIXTURES_ROOT / "1" / "exp.json") as f:
+        tool_output = json.load(f)
+    base_dirs: List[Path] = []
+
+    def mock_run(args, **kwargs):
+        if "--output.basedir" not in args:
+            return SimpleNamespace(stdout=b"", returncode=0)
+        base_dir = Path(args[args.index("--output.basedir") + 1])
+        base_dirs.append(base_dir)
+        if base_dir.is_relative_to(ram_filesystem_path):
+            return SimpleNamespace(
+                stdout=b"", stderr=b"write failed: No space left on device", returncode=1
+            )
+        for key in ["alloc", "result"]:
+            with open(base_dir / "output" / f"{key}.json", "w") as f:
+                json.dump(tool_output[key], f)
+        return SimpleNamespace(stdout=b"", stderr=b"", returncode=0)
+
+    monkeypatch.setattr(shutil, "which", lambda binary: str(binary))
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    t8n = EvmOneTransitionTool()
+    transition_tool_data = TransitionTool.TransitionToolData(
+        alloc=Alloc(),
+        txs=[],
+        env=Environment(),
+        fork=Cancun,
+        chain_id=1,
+        reward=0,
+        blob_schedule=None,
+    )
+    for _ in range(2):
+        output = t8n.evaluate(transition_tool_data=transition_tool_data)
+        assert output.result.gas_used == 0x5208
+    t8n.shutdown()
+
+    assert base_dirs[0].is_relative_to(ram_filesystem_path)
+    assert base_dirs[1] == base_dirs[2]
+    assert not base_dirs[1].is_relative_to(ram_filesystem_path)
+    assert len(base_dirs) == 3
+
+
+def test_record_and_replay(monkeypatch, tmp_path: Path):
+    """Test that the outputs recorded from a tool are replayed without running any tool."""
+
+    class MockCompletedProcess:
+        def __init__(self, stdout: bytes):
+            self.stdout = stdout
+            self.returncode = 0
+
+    with open(FIXTURES_ROOT / "1" / "exp.json") as f:
+        tool_output = f.read()
+    monkeypatch.setattr(shutil, "which", lambda binary: str(binary))
+    monkeypatch.setattr(
+        subprocess, "run", lambda args, **kwargs: MockCompletedProcess(tool_output.encode())
+    )
+    t8n = GethTransitionTool()
+    t8n.cached_version = "geth 1.0"
+    t8n.recorder = TransitionToolArchive(tmp_path)
+    transition_tool_data = TransitionTool.TransitionToolData(
+        alloc=Alloc(),
+        txs=[],
+        env=Environment(),
+        fork=Cancun,
+        chain_id=1,
+        reward=0,
+        blob_schedule=None,
+    )
+    recorded_output = t8n.evaluate(transition_tool_data=transition_tool_data)
+    monkeypatch.undo()
+
+    assert not ReplayTransitionTool.is_installed()
+    replay_t8n = ReplayTransitionTool(archive=tmp_path)
+    assert replay_t8n.version() == "replay of GethTransitionTool geth 1.0"
+    assert replay_t8n.is_fork_supported(Cancun)
+    assert not replay_t8n.is_fork_supported(Prague)
+    replayed_output = replay_t8n.evaluate(transition_tool_data=transition_tool_data)
+    assert replayed_output == recorded_output
+    assert (
+        TransactionException.NONCE_MISMATCH_TOO_LOW
+        in replayed_output.result.rejected_transactions[0].error
+    )
+
+    transition_tool_data.chain_id = 2
+    with pytest.raises(Exception, match="not found in the archive"):
+        replay_t8n.evaluate(transition_tool_data=transition_tool_data)
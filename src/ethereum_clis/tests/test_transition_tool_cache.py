@@ -0,0 +1,96 @@
+"""Test the on-disk cache of transition tool evaluations."""
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+from ethereum_clis import (
+    ExecutionSpecsTransitionTool,
+    TransitionToolCache,
+    TransitionToolOutput,
+)
+from ethereum_clis.clis.geth import GethExceptionMapper
+from ethereum_clis.transition_tool_cache import output_to_cache_json
+from ethereum_test_exceptions import TransactionException
+
+FIXTURES_ROOT = Path(os.path.join("src", "ethereum_clis", "tests", "fixtures"))
+model_dump_config = {"by_alias": True, "exclude_none": True}
+
+
+def test_cached_output_round_trip():
+    """Test that a cached output validates to the same output, including mapped exceptions."""
+    with open(FIXTURES_ROOT / "1" / "exp.json") as f:
+        tool_output = json.load(f)
+    context = {"exception_mapper": GethExceptionMapper()}
+    output = TransitionToolOutput.model_validate(tool_output, context=context)
+    assert (
+        TransactionException.NONCE_MISMATCH_TOO_LOW in output.result.rejected_transactions[0].error
+    )
+
+    cached_json = json.loads(json.dumps(output_to_cache_json(output, model_dump_config)))
+    assert cached_json["result"]["rejected"] == tool_output["result"]["rejected"]
+    assert TransitionToolOutput.model_validate(cached_json, context=context) == output
+
+
+def test_cache_key_is_canonical():
+    """Test that the cache key does not depend on the key order of the request."""
+    key = TransitionToolCache.key(tool_version="t8n 1.0", request={"a": 1, "b": [1, 2]})
+    assert key == TransitionToolCache.key(tool_version="t8n 1.0", request={"b": [1, 2], "a": 1})
+    assert key != TransitionToolCache.key(tool_version="t8n 1.1", request={"a": 1, "b": [1, 2]})
+
+
+def test_cache_lru_eviction(tmp_path: Path):
+    """Test that the least recently used entries are evicted when the cache is full."""
+    entry = {"output": "x" * 100, "info_metadata": {}}
+    entry_size = len(json.dumps(entry, separators=(",", ":")))
+    cache = TransitionToolCache(directory=tmp_path, max_size=3 * entry_size)
+    keys = [TransitionToolCache.key(tool_version="t8n", request={"i": i}) for i in range(4)]
+
+    for key in keys[:3]:
+        cache.put(key, entry)
+    # Make the first entry the least recently used one, then access it to refresh it.
+    for age, key in enumerate(keys[:3]):
+        os.utime(cache._path(key), (age, age))
+    assert cache.get(keys[0]) == entry
+
+    cache.put(keys[3], entry)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == entry
+    assert cache.get(keys[3]) == entry
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    # A new instance picks up the existing entries.
+    assert TransitionToolCache(directory=tmp_path, max_size=3 * entry_size).get(keys[3]) == entry
+
+
+def test_resolver_cache_identity(monkeypatch, tmp_path: Path):
+    """Test that the EELS resolutions are part of the identity of the resolver in cache keys."""
+
+    class MockCompletedProcess:
+        stdout = ""
+
+    monkeypatch.setattr(shutil, "which", lambda binary: str(binary))
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: MockCompletedProcess())
+    monkeypatch.delenv("EELS_RESOLUTIONS", raising=False)
+    resolutions_file = tmp_path / "eels_resolutions.json"
+    monkeypatch.setenv("EELS_RESOLUTIONS_FILE", str(resolutions_file))
+
+    def cache_identity(resolutions: dict) -> str | None:
+        resolutions_file.write_text(json.dumps(resolutions))
+        t8n = ExecutionSpecsTransitionTool()
+        t8n.cached_version = "ethereum-spec-evm-resolver 0.0.5"
+        return t8n.cache_identity()
+
+    pinned = {"EELSMaster": {"git_url": "url", "branch": "master", "commit": "a"}}
+    identity = cache_identity(pinned | {"Prague": {"same_as": "EELSMaster"}})
+    assert identity is not None and identity.startswith(
+        "ExecutionSpecsTransitionTool ethereum-spec-evm-resolver 0.0.5"
+    )
+    assert identity != cache_identity(
+        {"EELSMaster": {"git_url": "url", "branch": "master", "commit": "b"}}
+        | {"Prague": {"same_as": "EELSMaster"}}
+    )
+    assert cache_identity(pinned | {"Osaka": {"path": "/eels"}}) is None
+    assert cache_identity({"Prague": {"git_url": "url", "branch": "master"}}) is None
@@ -0,0 +1,41 @@
+"""Test the instrumentation of transition tool evaluations."""
+
+import csv
+import json
+from pathlib import Path
+
+from ethereum_clis import TransitionToolMetrics
+from ethereum_clis.transition_tool_metrics import aggregate_calls, summary_lines, write_report
+
+
+def test_metrics_report(tmp_path: Path):
+    """Test that the calls dumped by each worker are merged and aggregated in the report."""
+    for worker_id, fork in [("gw0", "Cancun"), ("gw1", "Prague")]:
+        metrics = TransitionToolMetrics()
+        metrics.test_id = f"test_{worker_id}"
+        for gas_used in [21_000, 42_000]:
+            call = metrics.start_call(fork=fork, mode="stream", tx_count=1)
+            with metrics.measure("execution"):
+                pass
+            call.gas_used = gas_used
+        metrics.current_call = None
+        with metrics.measure("parse"):
+            pass  # not attributed to any call
+        metrics.dump(tmp_path / "t8n_metrics" / f"{worker_id}.jsonl")
+
+    calls = TransitionToolMetrics.load(tmp_path / "t8n_metrics")
+    assert len(calls) == 4
+    assert all(call.execution_time > 0 and call.parse_time == 0 for call in calls)
+
+    per_fork = aggregate_calls(calls, "fork")
+    assert per_fork["Cancun"]["calls"] == 2
+    assert per_fork["Prague"]["gas_used"] == 63_000
+    assert aggregate_calls(calls, "mode")["stream"]["tx_count"] == 4
+
+    write_report(calls, tmp_path)
+    with open(tmp_path / "t8n_metrics.json") as f:
+        report = json.load(f)
+    assert set(report["per_test"]) == {"test_gw0", "test_gw1"}
+    with open(tmp_path / "t8n_metrics.csv", newline="") as f:
+        assert len(list(csv.DictReader(f))) == 4
+    assert len(summary_lines(calls)) == 1 + 1 + 2  # header, one mode and two forks
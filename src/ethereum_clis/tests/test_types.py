@@ -0,0 +1,32 @@
+"""Test the types used in the transition tool interactions."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from ethereum_clis import TransitionToolOutput
+from ethereum_clis.clis.geth import GethExceptionMapper
+
+FIXTURES_ROOT = Path(os.path.join("src", "ethereum_clis", "tests", "fixtures"))
+
+
+@pytest.mark.parametrize("test_dir", ["1", "3"])
+@pytest.mark.parametrize("with_storage", [False, True])
+def test_trusted_output_matches_validated_output(test_dir: str, with_storage: bool):
+    """Test that the trusted output is equal to the fully validated output."""
+    with open(FIXTURES_ROOT / test_dir / "exp.json") as f:
+        tool_output = json.load(f)
+    if with_storage:
+        account = next(iter(tool_output["alloc"].values()))
+        account["storage"] = {f"0x{key:064x}": f"0x{key * 0x100:064x}" for key in range(1, 1000)}
+    context = {"exception_mapper": GethExceptionMapper()}
+
+    validated_output = TransitionToolOutput.model_validate(tool_output, context=context)
+    trusted_output = TransitionToolOutput.model_validate_trusted(tool_output, context=context)
+
+    assert trusted_output == validated_output
+    assert trusted_output.model_dump(mode="json", by_alias=True) == validated_output.model_dump(
+        mode="json", by_alias=True
+    )
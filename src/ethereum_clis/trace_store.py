@@ -0,0 +1,151 @@
+"""On-disk storage of the execution traces produced by the transition tool."""
+
+import json
+import mmap
+import os
+import shutil
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+DEFAULT_TRACE_PRINT_STEPS = 64
+"""Default number of steps printed before the end of each transaction trace."""
+
+
+@dataclass(kw_only=True)
+class TraceSummary:
+    """Summary of the execution steps of a transaction trace."""
+
+    step_count: int = 0
+    opcode_counts: Counter[str] = field(default_factory=Counter)
+    opcode_gas: Counter[str] = field(default_factory=Counter)
+
+
+def is_trace_step(trace_line: Dict[str, Any]) -> bool:
+    """Return True if the trace line is an execution step, and not the final summary line."""
+    return "pc" in trace_line
+
+
+def trace_step_opcode(step: Dict[str, Any]) -> str:
+    """Return the name of the opcode executed in a trace step."""
+    if "opName" in step:
+        return step["opName"]
+    return f"0x{step.get('op', 0):02x}"
+
+
+def trace_step_gas_cost(step: Dict[str, Any]) -> int:
+    """Return the gas cost of a trace step, which tools report as a hex string or an int."""
+    gas_cost = step.get("gasCost", 0)
+    if isinstance(gas_cost, str):
+        return int(gas_cost, 0)
+    return gas_cost
+
+
+class TransactionTrace:
+    """
+    Trace of a single transaction, kept in its JSON lines file on disk.
+
+    Trace lines are only parsed while iterating, so traces of any size can be processed
+    without loading them into memory.
+    """
+
+    path: Path
+
+    def __init__(self, path: Path):
+        """Initialize the trace from its JSON lines file."""
+        self.path = path
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the parsed lines of the trace."""
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def steps(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the execution steps of the trace."""
+        return (trace_line for trace_line in self if is_trace_step(trace_line))
+
+    def summary(self) -> TraceSummary:
+        """Return the opcode histogram and the gas spent per opcode, in a single pass."""
+        summary = TraceSummary()
+        for step in self.steps():
+            opcode = trace_step_opcode(step)
+            summary.step_count += 1
+            summary.opcode_counts[opcode] += 1
+            summary.opcode_gas[opcode] += trace_step_gas_cost(step)
+        return summary
+
+    def last_steps(self, count: int) -> List[Dict[str, Any]]:
+        """Return the last `count` execution steps, reading the file backwards."""
+        if count <= 0 or os.path.getsize(self.path) == 0:
+            return []
+        steps: List[Dict[str, Any]] = []
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            end = len(m)
+            while end > 0 and len(steps) < count:
+                start = m.rfind(b"\n", 0, end - 1) + 1
+                line = m[start:end].strip()
+                end = start
+                if not line:
+                    continue
+                trace_line = json.loads(line)
+                if is_trace_step(trace_line):
+                    steps.append(trace_line)
+        steps.reverse()
+        return steps
+
+
+class TraceStore:
+    """
+    Traces of the transactions of each block evaluated for a test, stored on disk.
+
+    Trace files are moved out of the transition tool's output directory into a directory
+    owned by the store, which is removed by `cleanup`. Iterating over the store yields one list
+    of `TransactionTrace` per block.
+    """
+
+    directory: tempfile.TemporaryDirectory
+    blocks: List[List[TransactionTrace]]
+    print_steps: int | None
+
+    def __init__(self, *, print_steps: int | None = DEFAULT_TRACE_PRINT_STEPS):
+        """
+        Create an empty store.
+
+        `print_steps` is the number of steps printed before the end of each transaction when
+        the traces are printed, or None to print all the steps.
+        """
+        self.directory = tempfile.TemporaryDirectory(prefix="t8n-traces-")
+        self.blocks = []
+        self.print_steps = print_steps
+
+    def add_block(self, trace_files: List[Path]) -> None:
+        """Move the trace files of the transactions of a block into the store."""
+        block_dir = Path(self.directory.name) / str(len(self.blocks))
+        block_dir.mkdir()
+        block: List[TransactionTrace] = []
+        for trace_file in trace_files:
+            stored_file = block_dir / trace_file.name
+            shutil.move(trace_file, stored_file)
+            block.append(TransactionTrace(stored_file))
+        self.blocks.append(block)
+
+    def __iter__(self) -> Iterator[List[TransactionTrace]]:
+        """Iterate over the traces of each block."""
+        return iter(self.blocks)
+
+    def __len__(self) -> int:
+        """Return the number of blocks in the store."""
+        return len(self.blocks)
+
+    def __getitem__(self, block_number: int) -> List[TransactionTrace]:
+        """Return the traces of the transactions of a block."""
+        return self.blocks[block_number]
+
+    def cleanup(self) -> None:
+        """Remove all the stored trace files."""
+        self.blocks = []
+        self.directory.cleanup()
@@ -1,18 +1,34 @@
 """Transition tool abstract class."""
 
+import atexit
+import errno
 import json
 import os
 import shutil
+import signal
+import socket
 import subprocess
 import tempfile
 import textwrap
 import time
 from abc import abstractmethod
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, LiteralString, Mapping, Optional, Type
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    LiteralString,
+    Mapping,
+    Optional,
+    Type,
+)
 from urllib.parse import urlencode
 
+from filelock import FileLock
 from requests import Response
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests_unixsocket import Session  # type: ignore
@@ -24,7 +40,11 @@ from ethereum_test_forks.helpers import get_development_forks, get_forks
 from ethereum_test_types import Alloc, Environment, Transaction
 
 from .ethereum_cli import EthereumCLI
-from .file_utils import dump_files_to_directory, write_json_file
+from .file_utils import ReusableWorkspace, dump_files_to_directory
+from .trace_store import DEFAULT_TRACE_PRINT_STEPS, TraceStore
+from .transition_tool_archive import TransitionToolArchive
+from .transition_tool_cache import TransitionToolCache, output_to_cache_json
+from .transition_tool_metrics import TransitionToolMetrics
 from .types import (
     TransactionReceipt,
     TransitionToolContext,
@@ -39,6 +59,10 @@ model_dump_config: Mapping = {"by_alias": True, "exclude_none": True}
 # https://github.com/ethereum/execution-spec-tests/issues/1894
 NORMAL_SERVER_TIMEOUT = 180
 SLOW_REQUEST_TIMEOUT = 180
+DAEMON_POOL_STARTUP_TIMEOUT_SECONDS = 30
+DAEMON_POOL_SHUTDOWN_TIMEOUT_SECONDS = 5
+DAEMON_STARTUP_MIN_POLL_INTERVAL_SECONDS = 0.01
+DAEMON_STARTUP_MAX_POLL_INTERVAL_SECONDS = 0.05
 
 
 def get_valid_transition_tool_names() -> set[str]:
@@ -47,13 +71,211 @@ def get_valid_transition_tool_names() -> set[str]:
     return {fork.transition_tool_name() for fork in all_available_forks}
 
 
+def unix_socket_url(socket_path: Path) -> str:
+    """Return the `http+unix` URL used to reach a t8n server listening on `socket_path`."""
+    replaced_str = str(socket_path).replace("/", "%2F")
+    return f"http+unix://{replaced_str}/"
+
+
+def wait_for_unix_socket(
+    socket_path: Path, timeout: float, process: Optional[subprocess.Popen] = None
+) -> None:
+    """
+    Wait until a unix domain socket accepts connections or raise after `timeout`.
+
+    The socket is polled with a backoff from 10ms to 50ms. If the `process` that is expected to
+    listen on the socket exits before it does, an exception is raised immediately.
+    """
+    deadline = time.monotonic() + timeout
+    poll_interval = DAEMON_STARTUP_MIN_POLL_INTERVAL_SECONDS
+    while not unix_socket_is_healthy(socket_path):
+        if process is not None and process.poll() is not None:
+            raise Exception(
+                f"t8n daemon exited with code {process.returncode} before listening on "
+                f"{socket_path}"
+            )
+        if time.monotonic() > deadline:
+            raise Exception(f"Timed out waiting for t8n daemon socket {socket_path}")
+        time.sleep(poll_interval)
+        poll_interval = min(2 * poll_interval, DAEMON_STARTUP_MAX_POLL_INTERVAL_SECONDS)
+
+
+def unix_socket_is_healthy(socket_path: Path) -> bool:
+    """Return True if a process is accepting connections on the unix domain socket."""
+    if not socket_path.exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def process_is_alive(pid: int) -> bool:
+    """
+    Return True if a process with the given PID is running.
+
+    Processes that exited but were not reaped by their parent yet (zombies) are not running,
+    which can only be told apart through `/proc`, where available.
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except (OSError, IndexError):
+        return True
+
+
+class TransitionToolDaemonPool:
+    """
+    Pool of long-lived t8n daemons shared by all the xdist workers of a session.
+
+    The daemons are started once per session by the first worker that checks out a socket,
+    and the pool state is kept in a JSON file inside the session's shared temporary folder,
+    protected by a file lock. Each worker checks out the daemon with the fewest users,
+    restarting it first if it no longer accepts connections, and the last worker to check in
+    terminates all daemons.
+
+    The users of each daemon are recorded by PID, so that workers that exited without checking
+    in (e.g. because they crashed) are not counted as users anymore. Workers that exit without
+    checking in are also checked in when their interpreter exits.
+    """
+
+    state_file_name = "t8n_daemon_pool.json"
+
+    def __init__(
+        self,
+        *,
+        folder: Path,
+        size: int,
+        start_daemon: Callable[[Path], subprocess.Popen],
+    ):
+        """Initialize the pool; no daemon is started until the first checkout."""
+        assert size > 0, "t8n daemon pool size must be positive"
+        self.folder = folder
+        self.size = size
+        self.start_daemon = start_daemon
+        self.state_file = folder / self.state_file_name
+        self.lock_file = folder / f"{self.state_file_name}.lock"
+        self.processes: Dict[int, subprocess.Popen] = {}
+
+    def _socket_path(self, index: int) -> Path:
+        return self.folder / f"t8n-{index}.sock"
+
+    def _load_state(self) -> Dict[str, Any] | None:
+        if not self.state_file.exists():
+            return None
+        with open(self.state_file, "r") as f:
+            state = json.load(f)
+        for daemon in state["daemons"]:
+            daemon["users"] = [pid for pid in daemon["users"] if process_is_alive(pid)]
+        return state
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        with open(self.state_file, "w") as f:
+            json.dump(state, f)
+
+    def _start_daemons(self, indexes: List[int]) -> Dict[int, int]:
+        """Start the daemons for the given indexes concurrently and return their PIDs."""
+        processes: Dict[int, subprocess.Popen] = {}
+        for index in indexes:
+            socket_path = self._socket_path(index)
+            socket_path.unlink(missing_ok=True)
+            process = self.start_daemon(socket_path)
+            self.processes[process.pid] = process
+            processes[index] = process
+        for index, process in processes.items():
+            wait_for_unix_socket(
+                self._socket_path(index), DAEMON_POOL_STARTUP_TIMEOUT_SECONDS, process
+            )
+        return {index: process.pid for index, process in processes.items()}
+
+    def _terminate_daemon(self, pid: int) -> None:
+        """Terminate a daemon, killing it if it doesn't exit in time."""
+        process = self.processes.pop(pid, None)
+        if process is not None:
+            # Started by this process, so it must also be reaped by it.
+            process.terminate()
+            try:
+                process.wait(timeout=DAEMON_POOL_SHUTDOWN_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            return
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        # Wait until the daemon is gone, even after killing it, so that it can't remove the
+        # socket of the daemon that a later checkout starts in its place.
+        deadline = time.time() + DAEMON_POOL_SHUTDOWN_TIMEOUT_SECONDS
+        killed = False
+        while process_is_alive(pid):
+            if not killed and time.time() > deadline:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    return
+                killed = True
+            time.sleep(0.01)
+
+    def checkout(self) -> str:
+        """Check out the least-loaded healthy daemon and return its server URL."""
+        with FileLock(self.lock_file):
+            state = self._load_state()
+            if state is None:
+                pids = self._start_daemons(list(range(self.size)))
+                state = {
+                    "daemons": [
+                        {"socket": str(self._socket_path(i)), "pid": pids[i], "users": []}
+                        for i in range(self.size)
+                    ],
+                }
+            index = min(range(self.size), key=lambda i: len(state["daemons"][i]["users"]))
+            daemon = state["daemons"][index]
+            if not unix_socket_is_healthy(Path(daemon["socket"])):
+                self._terminate_daemon(daemon["pid"])
+                daemon["pid"] = self._start_daemons([index])[index]
+            daemon["users"].append(os.getpid())
+            self._save_state(state)
+        server_url = unix_socket_url(Path(daemon["socket"]))
+        atexit.register(self.checkin, server_url)
+        return server_url
+
+    def checkin(self, server_url: str) -> None:
+        """Return a daemon to the pool; the last user terminates all daemons."""
+        atexit.unregister(self.checkin)
+        with FileLock(self.lock_file):
+            state = self._load_state()
+            if state is None:
+                return
+            for daemon in state["daemons"]:
+                if unix_socket_url(Path(daemon["socket"])) == server_url:
+                    if os.getpid() in daemon["users"]:
+                        daemon["users"].remove(os.getpid())
+            if any(daemon["users"] for daemon in state["daemons"]):
+                self._save_state(state)
+                return
+            for daemon in state["daemons"]:
+                self._terminate_daemon(daemon["pid"])
+                Path(daemon["socket"]).unlink(missing_ok=True)
+            self.state_file.unlink()
+
+
 class TransitionTool(EthereumCLI):
     """
     Transition tool abstract base class which should be inherited by all transition tool
     implementations.
     """
 
-    traces: List[List[List[Dict]]] | None = None
+    traces: TraceStore | None = None
+    trace_print_steps: int | None = DEFAULT_TRACE_PRINT_STEPS
 
     registered_tools: List[Type["TransitionTool"]] = []
     default_tool: Optional[Type["TransitionTool"]] = None
@@ -66,6 +288,12 @@ class TransitionTool(EthereumCLI):
     t8n_use_server: bool = False
     server_url: str | None = None
     process: Optional[subprocess.Popen] = None
+    cache: Optional[TransitionToolCache] = None
+    recorder: Optional[TransitionToolArchive] = None
+    workspace: Optional[ReusableWorkspace] = None
+    validate_output: bool = False
+    metrics: Optional[TransitionToolMetrics] = None
+    _server_session: Optional[Session] = None
 
     @abstractmethod
     def __init__(
@@ -86,6 +314,33 @@ class TransitionTool(EthereumCLI):
         """Register all subclasses of TransitionTool as possible tools."""
         TransitionTool.register_tool(cls)
 
+    @property
+    def transport_mode(self) -> str:
+        """Return the name of the transport used to exchange data with the tool."""
+        if self.t8n_use_server:
+            return "server"
+        if self.t8n_use_stream:
+            return "stream"
+        return "filesystem"
+
+    def _measure(self, phase: str) -> ContextManager[None]:
+        """Return a context that times a phase of the current call, if metrics are enabled."""
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.measure(phase)
+
+    def parse_output(self, output_json: Dict[str, Any]) -> TransitionToolOutput:
+        """
+        Parse the JSON output of the transition tool.
+
+        The output of the tool is trusted and the post allocation is built without validation,
+        unless `validate_output` is set, in which case the whole output is validated.
+        """
+        context = {"exception_mapper": self.exception_mapper}
+        if self.validate_output:
+            return TransitionToolOutput.model_validate(output_json, context=context)
+        return TransitionToolOutput.model_validate_trusted(output_json, context=context)
+
     @abstractmethod
     def is_fork_supported(self, fork: Fork) -> bool:
         """Return True if the fork is supported by the tool."""
@@ -98,21 +353,37 @@ class TransitionTool(EthereumCLI):
         """
         pass
 
+    @property
+    def supports_daemon(self) -> bool:
+        """Return True if the tool can run as a t8n daemon, i.e. implements `start_daemon`."""
+        return type(self).start_daemon is not TransitionTool.start_daemon
+
+    def start_daemon(self, socket_path: Path) -> subprocess.Popen:
+        """
+        Start a t8n daemon process listening on the unix domain socket at `socket_path`.
+
+        Only tools that can serve requests over a unix domain socket implement this method;
+        it is required to use the tool with a `TransitionToolDaemonPool`.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support running as a t8n daemon."
+        )
+
     def shutdown(self):
         """Perform any cleanup tasks related to the tested tool."""
-        pass
+        self.close_server_session()
+        if self.workspace is not None:
+            self.workspace.cleanup()
+            self.workspace = None
+        self.reset_traces()
 
     def reset_traces(self):
         """Reset the internal trace storage for a new test to begin."""
+        if self.traces is not None:
+            self.traces.cleanup()
         self.traces = None
 
-    def append_traces(self, new_traces: List[List[Dict]]):
-        """Append a list of traces of a state transition to the current list."""
-        if self.traces is None:
-            self.traces = []
-        self.traces.append(new_traces)
-
-    def get_traces(self) -> List[List[List[Dict]]] | None:
+    def get_traces(self) -> TraceStore | None:
         """Return the accumulated traces."""
         return self.traces
 
@@ -122,8 +393,12 @@ class TransitionTool(EthereumCLI):
         temp_dir: tempfile.TemporaryDirectory,
         debug_output_path: str = "",
     ) -> None:
-        """Collect the traces from the t8n tool output and store them in the traces list."""
-        traces: List[List[Dict]] = []
+        """
+        Collect the traces from the t8n tool output and move them to the trace store.
+
+        The trace files are kept on disk and only parsed when they are read from the store.
+        """
+        trace_files: List[Path] = []
         for i, r in enumerate(receipts):
             trace_file_name = f"trace-{i}-{r.transaction_hash}.jsonl"
             if debug_output_path:
@@ -131,12 +406,10 @@ class TransitionTool(EthereumCLI):
                     os.path.join(temp_dir.name, trace_file_name),
                     os.path.join(debug_output_path, trace_file_name),
                 )
-            with open(os.path.join(temp_dir.name, trace_file_name), "r") as trace_file:
-                tx_traces: List[Dict] = []
-                for trace_line in trace_file.readlines():
-                    tx_traces.append(json.loads(trace_line))
-                traces.append(tx_traces)
-        self.append_traces(traces)
+            trace_files.append(Path(temp_dir.name) / trace_file_name)
+        if self.traces is None:
+            self.traces = TraceStore(print_steps=self.trace_print_steps)
+        self.traces.add_block(trace_files)
 
     @dataclass
     class TransitionToolData:
@@ -184,63 +457,116 @@ class TransitionTool(EthereumCLI):
                 input=self.to_input(),
             )
 
+    def _filesystem_workspace(self, *, use_ram_filesystem: bool) -> ReusableWorkspace:
+        """
+        Return the workspace directory for the next filesystem call, recycling the previous one.
+
+        A workspace in a RAM-backed filesystem is replaced by one in the default temporary
+        directory when the RAM-backed filesystem must not be used.
+        """
+        if (
+            self.workspace is not None
+            and self.workspace.in_ram_filesystem
+            and not use_ram_filesystem
+        ):
+            self.workspace.cleanup()
+            self.workspace = None
+        if self.workspace is None:
+            self.workspace = ReusableWorkspace(
+                subdirectories=["input", "output"],
+                input_subdirectory="input",
+                use_ram_filesystem=use_ram_filesystem,
+            )
+        else:
+            self.workspace.recycle()
+        return self.workspace
+
     def _evaluate_filesystem(
         self,
         *,
         t8n_data: TransitionToolData,
         debug_output_path: str = "",
     ) -> TransitionToolOutput:
-        """Execute a transition tool using the filesystem for its inputs and outputs."""
-        temp_dir = tempfile.TemporaryDirectory()
-        os.mkdir(os.path.join(temp_dir.name, "input"))
-        os.mkdir(os.path.join(temp_dir.name, "output"))
-
-        input_contents = t8n_data.to_input().model_dump(mode="json", **model_dump_config)
-
-        input_paths = {
-            k: os.path.join(temp_dir.name, "input", f"{k}.json") for k in input_contents.keys()
-        }
-        for key, file_path in input_paths.items():
-            write_json_file(input_contents[key], file_path)
-
-        output_paths = {
-            output: os.path.join("output", f"{output}.json") for output in ["alloc", "result"]
-        }
-        output_paths["body"] = os.path.join("output", "txs.rlp")
+        """
+        Execute a transition tool using the filesystem for its inputs and outputs.
 
-        # Construct args for evmone-t8n binary
-        args = [
-            str(self.binary),
-            "--state.fork",
-            t8n_data.fork_name,
-            "--input.alloc",
-            input_paths["alloc"],
-            "--input.env",
-            input_paths["env"],
-            "--input.txs",
-            input_paths["txs"],
-            "--output.basedir",
-            temp_dir.name,
-            "--output.result",
-            output_paths["result"],
-            "--output.alloc",
-            output_paths["alloc"],
-            "--output.body",
-            output_paths["body"],
-            "--state.reward",
-            str(t8n_data.reward),
-            "--state.chainid",
-            str(t8n_data.chain_id),
-        ]
+        The files are exchanged through a workspace directory that is reused between calls;
+        input files whose contents did not change since the previous call are not rewritten.
+        The workspace is placed in a RAM-backed filesystem unless traces or debug output are
+        collected, and moved to the default temporary directory if the RAM-backed filesystem
+        runs out of space.
+        """
+        with self._measure("serialization"):
+            input_contents = t8n_data.to_input().model_dump(mode="json", **model_dump_config)
 
-        if self.trace:
-            args.append("--trace")
+        use_ram_filesystem = not (self.trace or debug_output_path)
+        while True:
+            workspace = self._filesystem_workspace(use_ram_filesystem=use_ram_filesystem)
+            temp_dir = workspace.temp_dir
+            input_paths = {
+                k: os.path.join(temp_dir.name, "input", f"{k}.json") for k in input_contents.keys()
+            }
+            try:
+                with self._measure("transport"):
+                    for key, file_path in input_paths.items():
+                        workspace.write_json_file(input_contents[key], file_path)
+            except OSError as e:
+                if e.errno != errno.ENOSPC or not workspace.in_ram_filesystem:
+                    raise
+                use_ram_filesystem = False
+                continue
+            if self.metrics is not None and self.metrics.current_call is not None:
+                self.metrics.current_call.request_bytes = sum(
+                    os.path.getsize(file_path) for file_path in input_paths.values()
+                )
 
-        result = subprocess.run(
-            args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+            output_paths = {
+                output: os.path.join("output", f"{output}.json") for output in ["alloc", "result"]
+            }
+            output_paths["body"] = os.path.join("output", "txs.rlp")
+
+            # Construct args for evmone-t8n binary
+            args = [
+                str(self.binary),
+                "--state.fork",
+                t8n_data.fork_name,
+                "--input.alloc",
+                input_paths["alloc"],
+                "--input.env",
+                input_paths["env"],
+                "--input.txs",
+                input_paths["txs"],
+                "--output.basedir",
+                temp_dir.name,
+                "--output.result",
+                output_paths["result"],
+                "--output.alloc",
+                output_paths["alloc"],
+                "--output.body",
+                output_paths["body"],
+                "--state.reward",
+                str(t8n_data.reward),
+                "--state.chainid",
+                str(t8n_data.chain_id),
+            ]
+
+            if self.trace:
+                args.append("--trace")
+
+            with self._measure("execution"):
+                result = subprocess.run(
+                    args,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+            if (
+                result.returncode != 0
+                and workspace.in_ram_filesystem
+                and os.strerror(errno.ENOSPC).encode() in result.stderr
+            ):
+                use_ram_filesystem = False
+                continue
+            break
 
         if debug_output_path:
             if os.path.exists(debug_output_path):
@@ -281,22 +607,37 @@ class TransitionTool(EthereumCLI):
         for key, file_path in output_paths.items():
             output_paths[key] = os.path.join(temp_dir.name, file_path)
 
-        output_contents = {}
-        for key, file_path in output_paths.items():
-            if "txs.rlp" in file_path:
-                continue
-            with open(file_path, "r+") as file:
-                output_contents[key] = json.load(file)
-        output = TransitionToolOutput.model_validate(
-            output_contents, context={"exception_mapper": self.exception_mapper}
-        )
+        output_files: Dict[str, bytes] = {}
+        with self._measure("transport"):
+            for key, file_path in output_paths.items():
+                if "txs.rlp" in file_path:
+                    continue
+                with open(file_path, "rb") as file:
+                    output_files[key] = file.read()
+        if self.metrics is not None and self.metrics.current_call is not None:
+            self.metrics.current_call.response_bytes = sum(map(len, output_files.values()))
+        with self._measure("parse"):
+            output = self.parse_output(
+                {key: json.loads(contents) for key, contents in output_files.items()}
+            )
         if self.trace:
             self.collect_traces(output.result.receipts, temp_dir, debug_output_path)
 
-        temp_dir.cleanup()
-
         return output
 
+    @property
+    def server_session(self) -> Session:
+        """Return the persistent session used to send requests to the t8n-server."""
+        if self._server_session is None:
+            self._server_session = Session()
+        return self._server_session
+
+    def close_server_session(self) -> None:
+        """Close the persistent t8n-server session and its pooled connections."""
+        if self._server_session is not None:
+            self._server_session.close()
+            self._server_session = None
+
     def _server_post(
         self,
         data: Dict[str, Any],
@@ -310,7 +651,7 @@ class TransitionTool(EthereumCLI):
         post_delay = 0.1
         while True:
             try:
-                response = Session().post(
+                response = self.server_session.post(
                     f"{self.server_url}?{urlencode(url_args, doseq=True)}",
                     json=data,
                     timeout=timeout,
@@ -330,6 +671,21 @@ class TransitionTool(EthereumCLI):
             )
         return response
 
+    def record_server_response(self, response: Response, round_trip_time: float) -> None:
+        """
+        Record the metrics of a t8n-server round-trip in the current call.
+
+        The time until the response headers are received is attributed to the execution of the
+        tool, and the rest of the round-trip to the transport.
+        """
+        assert self.metrics is not None and self.metrics.current_call is not None
+        call = self.metrics.current_call
+        execution_time = min(response.elapsed.total_seconds(), round_trip_time)
+        call.execution_time += execution_time
+        call.transport_time += round_trip_time - execution_time
+        call.request_bytes += len(response.request.body or b"")
+        call.response_bytes += len(response.content)
+
     def _generate_post_args(self, t8n_data: TransitionToolData) -> Dict[str, List[str] | str]:
         """Generate the arguments for the POST request to the t8n-server."""
         return {}
@@ -343,7 +699,8 @@ class TransitionTool(EthereumCLI):
     ) -> TransitionToolOutput:
         """Execute the transition tool sending inputs and outputs via a server."""
         request_data = t8n_data.get_request_data()
-        request_data_json = request_data.model_dump(mode="json", **model_dump_config)
+        with self._measure("serialization"):
+            request_data_json = request_data.model_dump(mode="json", **model_dump_config)
 
         temp_dir = tempfile.TemporaryDirectory()
         request_data_json["trace"] = self.trace
@@ -368,17 +725,19 @@ class TransitionTool(EthereumCLI):
                 },
             )
 
+        start = time.perf_counter()
         response = self._server_post(
             data=request_data_json, url_args=self._generate_post_args(t8n_data), timeout=timeout
         )
-        response_json = response.json()
+        if self.metrics is not None and self.metrics.current_call is not None:
+            self.record_server_response(response, time.perf_counter() - start)
+        with self._measure("parse"):
+            response_json = response.json()
 
-        # pop optional test ``_info`` metadata from response, if present
-        self._info_metadata = response_json.pop("_info_metadata", {})
+            # pop optional test ``_info`` metadata from response, if present
+            self._info_metadata = response_json.pop("_info_metadata", {})
 
-        output: TransitionToolOutput = TransitionToolOutput.model_validate(
-            response_json, context={"exception_mapper": self.exception_mapper}
-        )
+            output = self.parse_output(response_json)
 
         if self.trace:
             self.collect_traces(output.result.receipts, temp_dir, debug_output_path)
@@ -414,21 +773,26 @@ class TransitionTool(EthereumCLI):
 
         stdin = t8n_data.to_input()
 
-        result = subprocess.run(
-            args,
-            input=stdin.model_dump_json(**model_dump_config).encode(),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        with self._measure("serialization"):
+            stdin_bytes = stdin.model_dump_json(**model_dump_config).encode()
+        with self._measure("execution"):
+            result = subprocess.run(
+                args,
+                input=stdin_bytes,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        if self.metrics is not None and self.metrics.current_call is not None:
+            self.metrics.current_call.request_bytes = len(stdin_bytes)
+            self.metrics.current_call.response_bytes = len(result.stdout)
 
         self.dump_debug_stream(debug_output_path, temp_dir, stdin, args, result)
 
         if result.returncode != 0:
             raise Exception("failed to evaluate: " + result.stderr.decode())
 
-        output: TransitionToolOutput = TransitionToolOutput.model_validate_json(
-            result.stdout, context={"exception_mapper": self.exception_mapper}
-        )
+        with self._measure("parse"):
+            output = self.parse_output(json.loads(result.stdout))
 
         if debug_output_path:
             dump_files_to_directory(
@@ -543,6 +907,25 @@ class TransitionTool(EthereumCLI):
             },
         )
 
+    def cache_identity(self) -> str | None:
+        """
+        Return the identity of the tool used in the keys of the result cache, which must change
+        whenever the tool may produce different outputs, or None if it can't be determined.
+        """
+        return f"{self.__class__.__name__} {self.version()}"
+
+    def cache_key(self, transition_tool_data: TransitionToolData) -> str:
+        """Return the key used to cache the evaluation of the given transition tool data."""
+        tool_identity = self.cache_identity()
+        assert tool_identity is not None, "the identity of the tool can't be determined"
+        return TransitionToolCache.key(
+            tool_version=tool_identity,
+            request=transition_tool_data.get_request_data().model_dump(
+                mode="json", **model_dump_config
+            ),
+            extra=self._generate_post_args(transition_tool_data),
+        )
+
     def evaluate(
         self,
         *,
@@ -553,9 +936,118 @@ class TransitionTool(EthereumCLI):
         """
         Execute the relevant evaluate method as required by the `t8n` tool.
 
+        If a result cache is configured, the output is served from the cache when the same
+        request was already evaluated by the same tool version. The cache is bypassed when
+        collecting traces or dumping debug output, as both require the tool to run.
+
         If a client's `t8n` tool varies from the default behavior, this method
         can be overridden.
         """
+        if self.metrics is not None:
+            self.metrics.start_call(
+                fork=transition_tool_data.fork_name,
+                mode=self.transport_mode,
+                tx_count=len(transition_tool_data.txs),
+            )
+        try:
+            output = self._evaluate_cached(
+                transition_tool_data=transition_tool_data,
+                debug_output_path=debug_output_path,
+                slow_request=slow_request,
+            )
+            if self.metrics is not None and self.metrics.current_call is not None:
+                self.metrics.current_call.gas_used = int(output.result.gas_used)
+            if self.recorder is not None:
+                self._record_output(transition_tool_data, output)
+            return output
+        finally:
+            if self.metrics is not None:
+                self.metrics.current_call = None
+
+    def _evaluate_cached(
+        self,
+        *,
+        transition_tool_data: TransitionToolData,
+        debug_output_path: str,
+        slow_request: bool,
+    ) -> TransitionToolOutput:
+        """Serve the evaluation from the result cache, if possible, or run the tool."""
+        cache_key: str | None = None
+        if self.cache is not None and not self.trace and not debug_output_path:
+            cache_key = self.cache_key(transition_tool_data)
+            with self._measure("parse"):
+                cached_output = self._get_cached_output(cache_key)
+            if cached_output is not None:
+                if self.metrics is not None and self.metrics.current_call is not None:
+                    self.metrics.current_call.mode = "cache"
+                return cached_output
+
+        output = self._evaluate(
+            transition_tool_data=transition_tool_data,
+            debug_output_path=debug_output_path,
+            slow_request=slow_request,
+        )
+
+        if cache_key is not None:
+            self._cache_output(cache_key, output)
+        return output
+
+    def _get_cached_output(self, cache_key: str) -> TransitionToolOutput | None:
+        """Return the cached output for the key, if present, and restore its metadata."""
+        assert self.cache is not None
+        cached_entry = self.cache.get(cache_key)
+        if cached_entry is None:
+            return None
+        self._info_metadata = cached_entry["info_metadata"]
+        return self.parse_output(cached_entry["output"])
+
+    def archive_key(self, transition_tool_data: TransitionToolData) -> str:
+        """Return the key used to record the evaluation of the given data in an archive."""
+        return TransitionToolArchive.key(
+            request=transition_tool_data.get_request_data().model_dump(
+                mode="json", **model_dump_config
+            ),
+            state_test=transition_tool_data.state_test,
+        )
+
+    def _record_output(
+        self, transition_tool_data: TransitionToolData, output: TransitionToolOutput
+    ) -> None:
+        """Record an output, along with the current test metadata, in the archive."""
+        assert self.recorder is not None
+        self.recorder.write_manifest(
+            tool=self.__class__.__name__,
+            version=self.version(),
+            exception_mapper=self.exception_mapper,
+        )
+        self.recorder.record_fork(transition_tool_data.fork_name)
+        self.recorder.record(
+            self.archive_key(transition_tool_data),
+            {
+                "output": output_to_cache_json(output, model_dump_config),
+                "info_metadata": self._info_metadata,
+            },
+        )
+
+    def _cache_output(self, cache_key: str, output: TransitionToolOutput) -> None:
+        """Store an output, along with the current test metadata, in the result cache."""
+        assert self.cache is not None
+        self.cache.put(
+            cache_key,
+            {
+                "output": output_to_cache_json(output, model_dump_config),
+                "info_metadata": self._info_metadata,
+            },
+        )
+
+    def _evaluate(
+        self,
+        *,
+        transition_tool_data: TransitionToolData,
+        debug_output_path: str = "",
+        slow_request: bool = False,
+    ) -> TransitionToolOutput:
+        """Dispatch the evaluation to the transport supported by the `t8n` tool."""
         if self.t8n_use_server:
             if not self.server_url:
                 self.start_server()
@@ -0,0 +1,103 @@
+"""Archive of recorded transition tool requests and outputs."""
+
+import importlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Set
+
+from ethereum_test_exceptions import ExceptionMapper
+
+from .transition_tool_cache import TransitionToolCache
+
+
+class TransitionToolArchive:
+    """
+    Archive of the outputs returned by a transition tool, keyed by the canonical hash of the
+    request that produced them.
+
+    The archive is recorded during a normal fill with `--t8n-record` and can then be replayed
+    with `--t8n-replay`, without running the tool. Unlike the result cache, the key does not
+    include the version of the tool, and outputs are never evicted. The manifest records the
+    tool that produced the outputs, including the exception mapper needed to interpret its
+    verbatim exception messages, and an empty marker file is written for each recorded fork.
+    """
+
+    manifest_file_name = "manifest.json"
+    forks_folder_name = "forks"
+
+    directory: Path
+    entries: TransitionToolCache
+
+    def __init__(self, directory: Path):
+        """Open the archive in the given directory, creating it if it does not exist."""
+        self.directory = directory
+        self.entries = TransitionToolCache(directory=directory, max_size=sys.maxsize)
+        self._recorded_forks: Set[str] = set()
+
+    @staticmethod
+    def key(*, request: Dict[str, Any], state_test: bool) -> str:
+        """Return the key of a serialized transition tool request in the archive."""
+        return TransitionToolCache.key(
+            tool_version="", request=request, extra={"state_test": state_test}
+        )
+
+    def write_manifest(self, *, tool: str, version: str, exception_mapper: ExceptionMapper):
+        """Record the tool that produced the outputs, if not recorded yet."""
+        manifest_path = self.directory / self.manifest_file_name
+        if manifest_path.exists():
+            return
+        exception_mapper_class = type(exception_mapper)
+        manifest = {
+            "tool": tool,
+            "version": version,
+            "exception_mapper": (
+                f"{exception_mapper_class.__module__}.{exception_mapper_class.__qualname__}"
+            ),
+        }
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as temp_file:
+            json.dump(manifest, temp_file, indent=2)
+        os.replace(temp_file.name, manifest_path)
+
+    def read_manifest(self) -> Dict[str, str]:
+        """Return the manifest of the archive."""
+        manifest_path = self.directory / self.manifest_file_name
+        if not manifest_path.exists():
+            raise Exception(f"Not a t8n archive (missing {manifest_path}).")
+        with open(manifest_path, "r") as f:
+            return json.load(f)
+
+    def exception_mapper(self) -> ExceptionMapper:
+        """Instantiate the exception mapper of the tool that recorded the archive."""
+        module_name, class_name = self.read_manifest()["exception_mapper"].rsplit(".", 1)
+        exception_mapper = getattr(importlib.import_module(module_name), class_name)()
+        assert isinstance(exception_mapper, ExceptionMapper)
+        return exception_mapper
+
+    def record_fork(self, fork_name: str) -> None:
+        """Record that the archive contains outputs of the given fork."""
+        if fork_name in self._recorded_forks:
+            return
+        forks_folder = self.directory / self.forks_folder_name
+        forks_folder.mkdir(parents=True, exist_ok=True)
+        (forks_folder / fork_name).touch()
+        self._recorded_forks.add(fork_name)
+
+    def recorded_forks(self) -> Set[str]:
+        """Return the names of the forks with outputs recorded in the archive."""
+        forks_folder = self.directory / self.forks_folder_name
+        if not forks_folder.exists():
+            return set()
+        return {path.name for path in forks_folder.iterdir()}
+
+    def record(self, key: str, entry: Dict[str, Any]) -> None:
+        """Record the output of a request, in the same format as a result cache entry."""
+        self.entries.put(key, entry)
+
+    def lookup(self, key: str) -> Dict[str, Any] | None:
+        """Return the recorded entry of a request, or None if it was not recorded."""
+        return self.entries.get(key)
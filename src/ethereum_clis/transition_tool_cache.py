@@ -0,0 +1,130 @@
+"""Content-addressed on-disk cache of transition tool evaluations."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Tuple
+
+from ethereum_test_exceptions import ExceptionWithMessage
+
+from .types import TransitionToolOutput
+
+CACHE_EVICTION_LOW_WATERMARK = 0.9
+"""Fraction of the maximum cache size to shrink the cache to when it is exceeded."""
+
+
+def output_to_cache_json(
+    output: TransitionToolOutput, model_dump_config: Mapping
+) -> Dict[str, Any]:
+    """
+    Serialize a transition tool output in the format it was originally returned by the tool.
+
+    Exceptions are stored as the verbatim message received from the tool, so that the
+    output can be validated again using the tool's exception mapper when read from the cache.
+    """
+    output_json = output.model_dump(mode="json", **model_dump_config)
+    result_json = output_json["result"]
+    for rejected_json, rejected in zip(
+        result_json.get("rejected", []), output.result.rejected_transactions, strict=True
+    ):
+        rejected_json["error"] = exception_message(rejected.error)
+    if output.result.block_exception is not None:
+        result_json["blockException"] = exception_message(output.result.block_exception)
+    return output_json
+
+
+def exception_message(exception: Any) -> str:
+    """Return the verbatim tool message of a mapped (or undefined) exception."""
+    if isinstance(exception, ExceptionWithMessage):
+        return exception.message
+    return str(exception)
+
+
+class TransitionToolCache:
+    """
+    Persistent cache of transition tool outputs keyed by a canonical hash of the request.
+
+    Entries are stored as one JSON file per request, sharded by the first byte of the key.
+    The modification time of an entry is refreshed on every hit, which is used to evict the
+    least recently used entries once the total size of the cache exceeds `max_size` bytes.
+    The cache can be shared between processes: entries are written atomically and a
+    missing entry (e.g. evicted by another process) is simply treated as a cache miss.
+    """
+
+    directory: Path
+    max_size: int
+    hits: int
+    misses: int
+
+    def __init__(self, *, directory: Path, max_size: int):
+        """Initialize the cache and compute the current size of the cache directory."""
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._size = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def key(*, tool_version: str, request: Dict[str, Any], extra: Any = None) -> str:
+        """Return the canonical hash of a transition tool request."""
+        canonical = json.dumps(
+            {"tool": tool_version, "request": request, "extra": extra},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        """Return the cached entry for the key, or None on a cache miss."""
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry in the cache and evict old entries if the cache is full."""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        contents = json.dumps(entry, separators=(",", ":"))
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False
+        ) as temp_file:
+            temp_file.write(contents)
+        os.replace(temp_file.name, path)
+        self._size += len(contents)
+        if self._size > self.max_size:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache is below its low watermark."""
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target_size = self.max_size * CACHE_EVICTION_LOW_WATERMARK
+        for _, entry_size, path in entries:
+            if size <= target_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
@@ -0,0 +1,171 @@
+"""Per-call instrumentation of transition tool evaluations."""
+
+import csv
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Dict, Generator, List
+
+TIMING_PHASES = ["serialization", "transport", "execution", "parse"]
+"""
+Phases of a transition tool call that are timed.
+
+- `serialization`: dumping the input models to JSON.
+- `transport`: exchanging the inputs and outputs with the tool, i.e. writing and reading files
+    in filesystem mode, or the part of the HTTP round-trip that is not spent waiting for the
+    response in server mode.
+- `execution`: running the tool; in stream mode this includes piping the input and output, and
+    in server mode it is the time until the response headers are received.
+- `parse`: decoding the JSON output of the tool into a `TransitionToolOutput`.
+"""
+
+
+@dataclass(kw_only=True)
+class TransitionToolCallMetrics:
+    """Metrics recorded for a single transition tool call."""
+
+    test_id: str
+    fork: str
+    mode: str
+    serialization_time: float = 0.0
+    transport_time: float = 0.0
+    execution_time: float = 0.0
+    parse_time: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    tx_count: int = 0
+    gas_used: int = 0
+
+    @property
+    def total_time(self) -> float:
+        """Return the total time spent in the call."""
+        return sum(getattr(self, f"{phase}_time") for phase in TIMING_PHASES)
+
+
+CALL_METRICS_FIELDS = [field.name for field in fields(TransitionToolCallMetrics)]
+
+
+class TransitionToolMetrics:
+    """
+    Collector of the metrics of every transition tool call made by a pytest worker.
+
+    The test the calls are attributed to is set by the filler before each test runs, and each
+    worker dumps its calls to its own file, which are then merged into a session report.
+    """
+
+    calls: List[TransitionToolCallMetrics]
+    test_id: str
+    current_call: TransitionToolCallMetrics | None
+
+    def __init__(self):
+        """Initialize an empty collector."""
+        self.calls = []
+        self.test_id = ""
+        self.current_call = None
+
+    def start_call(self, *, fork: str, mode: str, tx_count: int) -> TransitionToolCallMetrics:
+        """Start recording a new call and return its metrics."""
+        self.current_call = TransitionToolCallMetrics(
+            test_id=self.test_id, fork=fork, mode=mode, tx_count=tx_count
+        )
+        self.calls.append(self.current_call)
+        return self.current_call
+
+    @contextmanager
+    def measure(self, phase: str) -> Generator[None, None, None]:
+        """Add the time spent within the context to the given phase of the current call."""
+        assert phase in TIMING_PHASES, f"unknown t8n timing phase: {phase}"
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.current_call is not None:
+                attribute = f"{phase}_time"
+                elapsed = time.perf_counter() - start
+                setattr(
+                    self.current_call, attribute, getattr(self.current_call, attribute) + elapsed
+                )
+
+    def dump(self, file_path: Path) -> None:
+        """Write the recorded calls to a JSON lines file."""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w") as f:
+            for call in self.calls:
+                f.write(json.dumps(asdict(call)) + "\n")
+
+    @staticmethod
+    def load(folder: Path) -> List[TransitionToolCallMetrics]:
+        """Load the calls dumped by all the workers to the given folder."""
+        calls: List[TransitionToolCallMetrics] = []
+        for file_path in sorted(folder.glob("*.jsonl")):
+            with open(file_path, "r") as f:
+                calls.extend(TransitionToolCallMetrics(**json.loads(line)) for line in f)
+        return calls
+
+
+def aggregate_calls(
+    calls: List[TransitionToolCallMetrics], key: str
+) -> Dict[str, Dict[str, float | int]]:
+    """Aggregate the calls by the given attribute (e.g. `test_id`, `fork` or `mode`)."""
+    aggregates: Dict[str, Dict[str, float | int]] = {}
+    for call in calls:
+        aggregate = aggregates.setdefault(
+            getattr(call, key),
+            {"calls": 0, "total_time": 0.0}
+            | {f"{phase}_time": 0.0 for phase in TIMING_PHASES}
+            | {"request_bytes": 0, "response_bytes": 0, "tx_count": 0, "gas_used": 0},
+        )
+        aggregate["calls"] += 1
+        aggregate["total_time"] += call.total_time
+        for name in aggregate:
+            if name not in ("calls", "total_time"):
+                aggregate[name] += getattr(call, name)
+    return aggregates
+
+
+def write_report(calls: List[TransitionToolCallMetrics], directory: Path) -> None:
+    """
+    Write the t8n performance report to the given directory.
+
+    `t8n_metrics.json` contains the calls aggregated per mode, per fork and per test, and
+    `t8n_metrics.csv` contains one row per call.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / "t8n_metrics.json", "w") as f:
+        json.dump(
+            {
+                "per_mode": aggregate_calls(calls, "mode"),
+                "per_fork": aggregate_calls(calls, "fork"),
+                "per_test": aggregate_calls(calls, "test_id"),
+            },
+            f,
+            indent=2,
+        )
+    with open(directory / "t8n_metrics.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CALL_METRICS_FIELDS)
+        writer.writeheader()
+        for call in calls:
+            writer.writerow(asdict(call))
+
+
+def summary_lines(calls: List[TransitionToolCallMetrics]) -> List[str]:
+    """Return a summary of the calls per mode and per fork, to be printed in the terminal."""
+    lines = [
+        f"{'':<24} {'calls':>8} {'total (s)':>10} "
+        + " ".join(f"{phase + ' (s)':>17}" for phase in TIMING_PHASES)
+        + f" {'req (MiB)':>10} {'resp (MiB)':>10} {'Mgas/s':>8}"
+    ]
+    for key in ("mode", "fork"):
+        for name, aggregate in sorted(aggregate_calls(calls, key).items()):
+            total_time = aggregate["total_time"]
+            mgas_per_second = aggregate["gas_used"] / total_time / 1e6 if total_time else 0.0
+            lines.append(
+                f"{f'{key}={name}':<24} {aggregate['calls']:>8} {total_time:>10.2f} "
+                + " ".join(f"{aggregate[f'{phase}_time']:>17.2f}" for phase in TIMING_PHASES)
+                + f" {aggregate['request_bytes'] / 2**20:>10.1f}"
+                + f" {aggregate['response_bytes'] / 2**20:>10.1f}"
+                + f" {mgas_per_second:>8.1f}"
+            )
+    return lines
@@ -1,10 +1,22 @@
 """Types used in the transition tool interactions."""
 
-from typing import Annotated, List
+from typing import Annotated, Any, Dict, List
 
 from pydantic import Field
 
-from ethereum_test_base_types import BlobSchedule, Bloom, Bytes, CamelModel, Hash, HexNumber
+from ethereum_test_base_types import (
+    Account,
+    Address,
+    BlobSchedule,
+    Bloom,
+    Bytes,
+    CamelModel,
+    Hash,
+    HashInt,
+    HexNumber,
+    Storage,
+    ZeroPaddedHexNumber,
+)
 from ethereum_test_exceptions import (
     BlockException,
     ExceptionMapperValidator,
@@ -70,6 +82,45 @@ class TransitionToolInput(CamelModel):
     env: Environment
 
 
+def trusted_storage(storage_json: Dict[str, str]) -> Storage:
+    """
+    Build the storage of an account from the transition tool's JSON output without validation.
+
+    Keys and values are expected to be hex strings, as returned by every transition tool, so
+    they are converted directly and the range checks of `HashInt` are skipped.
+    """
+    return Storage.model_construct(
+        root={
+            int.__new__(HashInt, int(key, 16)): int.__new__(HashInt, int(value, 16))
+            for key, value in storage_json.items()
+        }
+    )
+
+
+def trusted_account(account_json: Dict[str, Any]) -> Account:
+    """Build an account from the transition tool's JSON output without validation."""
+    fields: Dict[str, Any] = {}
+    if "nonce" in account_json:
+        fields["nonce"] = ZeroPaddedHexNumber(account_json["nonce"])
+    if "balance" in account_json:
+        fields["balance"] = ZeroPaddedHexNumber(account_json["balance"])
+    if "code" in account_json:
+        fields["code"] = Bytes(account_json["code"])
+    if "storage" in account_json:
+        fields["storage"] = trusted_storage(account_json["storage"])
+    return Account.model_construct(**fields)
+
+
+def trusted_alloc(alloc_json: Dict[str, Dict[str, Any] | None]) -> Alloc:
+    """Build the post allocation from the transition tool's JSON output without validation."""
+    return Alloc.model_construct(
+        root={
+            Address(address): trusted_account(account) if account is not None else None
+            for address, account in alloc_json.items()
+        }
+    )
+
+
 class TransitionToolOutput(CamelModel):
     """Transition tool output."""
 
@@ -77,6 +128,25 @@ class TransitionToolOutput(CamelModel):
     result: Result
     body: Bytes | None = None
 
+    @classmethod
+    def model_validate_trusted(
+        cls, obj: Dict[str, Any], *, context: Dict[str, Any]
+    ) -> "TransitionToolOutput":
+        """
+        Build the output from the transition tool's JSON output, skipping the validation of the
+        post allocation, which can contain tens of thousands of storage slots.
+
+        The result is still fully validated, since it is small and its exceptions must be
+        mapped using the tool's exception mapper.
+        """
+        fields: Dict[str, Any] = {
+            "alloc": trusted_alloc(obj["alloc"]),
+            "result": Result.model_validate(obj["result"], context=context),
+        }
+        if "body" in obj:
+            fields["body"] = Bytes.or_none(obj["body"])
+        return cls.model_construct(**fields)
+
 
 class TransitionToolContext(CamelModel):
     """Transition tool context."""
@@ -31,13 +31,6 @@ def to_bytes(input_bytes: BytesConvertible) -> bytes:
     if input_bytes is None:
         raise Exception("Cannot convert `None` input to bytes")
 
-    if (
-        isinstance(input_bytes, SupportsBytes)
-        or isinstance(input_bytes, bytes)
-        or isinstance(input_bytes, list)
-    ):
-        return bytes(input_bytes)
-
     if isinstance(input_bytes, str):
         # We can have a hex representation of bytes with spaces for readability
         input_bytes = sub(r"\s+", "", input_bytes)
@@ -47,6 +40,13 @@ def to_bytes(input_bytes: BytesConvertible) -> bytes:
             input_bytes = "0" + input_bytes
         return bytes.fromhex(input_bytes)
 
+    if (
+        isinstance(input_bytes, bytes)
+        or isinstance(input_bytes, list)
+        or isinstance(input_bytes, SupportsBytes)
+    ):
+        return bytes(input_bytes)
+
     raise Exception("invalid type for `bytes`")
 
 
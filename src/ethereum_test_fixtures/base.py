@@ -19,6 +19,43 @@ from pydantic_core.core_schema import ValidatorFunctionWrapHandler
 from ethereum_test_base_types import CamelModel, ReferenceSpec
 from ethereum_test_forks import Fork
 
+CANONICAL_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+"""Encoder of the canonical JSON representation of a fixture, from which its hash is computed."""
+
+
+def update_canonical_json_hash(h: "hashlib._Hash", value: Any) -> None:
+    """
+    Update the hash with the canonical JSON encoding of the value, without encoding it as a
+    whole.
+
+    Dictionaries and lists containing other dictionaries or lists are walked, while the other
+    values are encoded in one piece, so the memory used is bounded by the largest of these values
+    (e.g. the storage of an account) rather than by the size of the whole value, for the same
+    speed. The bytes fed to the hash are exactly those of `CANONICAL_JSON_ENCODER.encode(value)`.
+    """
+    if isinstance(value, dict):
+        # Keys that are not strings are converted by the encoder, which is left to it.
+        if all(type(key) is str for key in value) and any(
+            isinstance(item, (dict, list, tuple)) for item in value.values()
+        ):
+            separator = b"{"
+            for key in sorted(value):
+                h.update(separator + CANONICAL_JSON_ENCODER.encode(key).encode() + b":")
+                update_canonical_json_hash(h, value[key])
+                separator = b","
+            h.update(b"}")
+            return
+    elif isinstance(value, (list, tuple)) and value:
+        if any(isinstance(item, (dict, list, tuple)) for item in value):
+            separator = b"["
+            for item in value:
+                h.update(separator)
+                update_canonical_json_hash(h, item)
+                separator = b","
+            h.update(b"]")
+            return
+    h.update(CANONICAL_JSON_ENCODER.encode(value).encode())
+
 
 def fixture_format_discriminator(v: Any) -> str | None:
     """Discriminator function that returns the model type as a string."""
@@ -94,15 +131,20 @@ class BaseFixture(CamelModel):
 
     @cached_property
     def json_dict(self) -> Dict[str, Any]:
-        """Returns the JSON representation of the fixture."""
+        """
+        Returns the JSON representation of the fixture.
+
+        The representation is computed once, and shared by the hash of the fixture and its JSON
+        representation with info.
+        """
         return self.model_dump(mode="json", by_alias=True, exclude_none=True, exclude={"info"})
 
     @cached_property
     def hash(self) -> str:
-        """Returns the hash of the fixture."""
-        json_str = json.dumps(self.json_dict, sort_keys=True, separators=(",", ":"))
-        h = hashlib.sha256(json_str.encode("utf-8")).hexdigest()
-        return f"0x{h}"
+        """Returns the hash of the canonical JSON representation of the fixture."""
+        h = hashlib.sha256()
+        update_canonical_json_hash(h, self.json_dict)
+        return f"0x{h.hexdigest()}"
 
     def json_dict_with_info(self, hash_only: bool = False) -> Dict[str, Any]:
         """Return JSON representation of the fixture with the info field."""
@@ -136,6 +178,14 @@ class BaseFixture(CamelModel):
         """Return fork of the fixture as a string."""
         raise NotImplementedError
 
+    @classmethod
+    def get_fork_name_from_json(cls, json_fixture: Dict[str, Any]) -> str | None:
+        """
+        Return the name of the fork of a fixture from its JSON representation, without
+        validating the fixture.
+        """
+        raise NotImplementedError
+
     @classmethod
     def supports_fork(cls, fork: Fork) -> bool:
         """
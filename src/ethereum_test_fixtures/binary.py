@@ -0,0 +1,232 @@
+"""
+Compact binary encoding of fixture files, written alongside the canonical JSON files.
+
+Loading large JSON fixture files is dominated by the validation of the `pre` and `post` state
+allocations, where every nonce, balance, code and storage slot is parsed from a hex string and
+range-checked. The binary encoding stores these allocations with integers and unprefixed hex
+strings, and the loader builds them directly, without validation; all the other fields of
+the fixtures are still validated. The encoding is therefore meant for fixture files produced by
+`fill`, and JSON stays the canonical interchange format.
+
+The file starts with a header made of a magic string, the version of the encoding, and the
+sha256 hash of the JSON fixture file it was written from. The binary file is only used while the
+version is supported and the hash matches the JSON file, regardless of file times, which
+archives don't reliably preserve. The header is followed by the JSON tree of the fixtures, in
+which each state allocation is replaced by an object with the single key `ALLOC_TAG`, holding
+its accounts with integers and unprefixed hex strings. Decoding the file therefore only parses
+JSON, and never executes or unpickles any data.
+"""
+
+import gc
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from ethereum_test_base_types import (
+    Account,
+    Address,
+    Alloc,
+    Bytes,
+    HashInt,
+    Storage,
+    ZeroPaddedHexNumber,
+)
+
+from .compression import open_fixture_file, uncompressed_name
+from .file import Fixtures
+
+BINARY_FIXTURE_FILE_SUFFIX = ".bin"
+BINARY_FIXTURE_MAGIC = b"EESTFIX"
+BINARY_FIXTURE_VERSION = 2
+"""Version of the encoding, increased on every incompatible change."""
+BINARY_FIXTURE_HEADER_SIZE = len(BINARY_FIXTURE_MAGIC) + 1 + 32
+
+ALLOC_TAG = "\u0000alloc"
+"""Key of the objects that hold an encoded state allocation, which JSON fixtures never use."""
+
+ALLOC_KEYS = frozenset({"pre", "postState", "postStateDiff", "state"})
+"""JSON keys of the fixture fields that contain state allocations."""
+
+ACCOUNT_KEYS = frozenset({"nonce", "balance", "code", "storage"})
+
+CompactAccount = Dict[str, int | str | List[Tuple[int, int]]]
+CompactAlloc = Dict[str, List[Tuple[str, CompactAccount | None]]]
+
+
+def binary_fixture_path(fixture_path: Path) -> Path:
+    """Return the path of the binary file written alongside a (compressed) JSON fixture file."""
+    stem = uncompressed_name(fixture_path).removesuffix(".json")
+    return fixture_path.with_name(stem + BINARY_FIXTURE_FILE_SUFFIX)
+
+
+def is_alloc_json(value: Any) -> bool:
+    """Return True if the JSON value has the shape of a non-empty state allocation."""
+    if not isinstance(value, dict) or not value:
+        return False
+    for address, account in value.items():
+        if len(address) != 42 or not address.startswith("0x"):
+            return False
+        if account is not None and (
+            not isinstance(account, dict) or not account.keys() <= ACCOUNT_KEYS
+        ):
+            return False
+    return True
+
+
+def encode_alloc(alloc_json: Dict[str, Any]) -> CompactAlloc:
+    """Encode a JSON state allocation with integers and unprefixed hex strings."""
+    accounts: List[Tuple[str, CompactAccount | None]] = []
+    for address, account_json in alloc_json.items():
+        account: CompactAccount | None = None
+        if account_json is not None:
+            account = {}
+            if "nonce" in account_json:
+                account["nonce"] = int(account_json["nonce"], 16)
+            if "balance" in account_json:
+                account["balance"] = int(account_json["balance"], 16)
+            if "code" in account_json:
+                account["code"] = account_json["code"][2:]
+            if "storage" in account_json:
+                account["storage"] = [
+                    (int(key, 16), int(value, 16))
+                    for key, value in account_json["storage"].items()
+                ]
+        accounts.append((address[2:], account))
+    return {ALLOC_TAG: accounts}
+
+
+def decode_alloc(compact_alloc: CompactAlloc) -> Alloc:
+    """Build a state allocation from its binary encoding, without validation."""
+    root: Dict[Address, Account | None] = {}
+    for address, compact_account in compact_alloc[ALLOC_TAG]:
+        account: Account | None = None
+        if compact_account is not None:
+            fields: Dict[str, Any] = {}
+            for key, value in compact_account.items():
+                if key == "storage":
+                    assert isinstance(value, list)
+                    fields[key] = Storage.model_construct(
+                        root={
+                            int.__new__(HashInt, slot): int.__new__(HashInt, slot_value)
+                            for slot, slot_value in value
+                        }
+                    )
+                elif key == "code":
+                    assert isinstance(value, str)
+                    fields[key] = Bytes(bytes.fromhex(value))
+                else:
+                    assert isinstance(value, int)
+                    fields[key] = int.__new__(ZeroPaddedHexNumber, value)
+            account = Account.model_construct(**fields)
+        root[Address(bytes.fromhex(address))] = account
+    return Alloc.model_construct(root=root)
+
+
+def encode_tree(value: Any) -> Any:
+    """Replace the state allocations of a JSON tree with their binary encoding."""
+    if isinstance(value, dict):
+        return {
+            key: encode_alloc(item)
+            if key in ALLOC_KEYS and is_alloc_json(item)
+            else encode_tree(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [encode_tree(item) for item in value]
+    return value
+
+
+def decode_tree(value: Any) -> Any:
+    """Replace the binary-encoded state allocations of a tree with `Alloc` models."""
+    if isinstance(value, dict):
+        if len(value) == 1 and ALLOC_TAG in value:
+            return decode_alloc(value)
+        return {key: decode_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_tree(item) for item in value]
+    return value
+
+
+def binary_fixture_header(json_hash: bytes) -> bytes:
+    """Return the header of a binary file written from a JSON file with the given hash."""
+    return BINARY_FIXTURE_MAGIC + bytes([BINARY_FIXTURE_VERSION]) + json_hash
+
+
+def encode_fixtures(json_fixtures: Dict[str, Any], json_hash: bytes = bytes(32)) -> bytes:
+    """Encode the JSON contents of a fixture file, whose sha256 hash is `json_hash`."""
+    body = json.dumps(encode_tree(json_fixtures), separators=(",", ":"))
+    return binary_fixture_header(json_hash) + body.encode()
+
+
+def decode_fixtures(data: bytes) -> Fixtures:
+    """
+    Load the fixtures of a binary fixture file.
+
+    The garbage collector is paused while decoding: the hundreds of thousands of objects created
+    for large allocations would otherwise trigger repeated full collections, which take more time
+    than the decoding itself, and the decoded tree contains no reference cycles.
+    """
+    if not data.startswith(BINARY_FIXTURE_MAGIC):
+        raise ValueError("Not a binary fixture file.")
+    version = data[len(BINARY_FIXTURE_MAGIC)]
+    if version != BINARY_FIXTURE_VERSION:
+        raise ValueError(
+            f"Unsupported binary fixture file version {version}, expected "
+            f"{BINARY_FIXTURE_VERSION}."
+        )
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        tree = decode_tree(json.loads(data[BINARY_FIXTURE_HEADER_SIZE:]))
+        return Fixtures.model_validate(tree)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+@lru_cache(maxsize=1024)
+def _file_hash(path: Path, size: int, mtime_ns: int) -> bytes:
+    """Return the sha256 hash of a file, memoized while its size and time are unchanged."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").digest()
+
+
+def fixture_file_hash(fixture_path: Path) -> bytes:
+    """Return the sha256 hash of a (compressed) JSON fixture file, as stored on disk."""
+    stat = fixture_path.stat()
+    return _file_hash(fixture_path, stat.st_size, stat.st_mtime_ns)
+
+
+def write_binary_fixture_file(fixture_path: Path) -> Path:
+    """Write the binary encoding of a (compressed) JSON fixture file alongside it."""
+    with open_fixture_file(fixture_path) as f:
+        json_fixtures = json.load(f)
+    binary_path = binary_fixture_path(fixture_path)
+    binary_path.write_bytes(encode_fixtures(json_fixtures, fixture_file_hash(fixture_path)))
+    return binary_path
+
+
+def has_binary_fixture_file(fixture_path: Path) -> bool:
+    """
+    Return True if a binary file with a supported version was written alongside the JSON fixture
+    file from its current contents.
+    """
+    binary_path = binary_fixture_path(fixture_path)
+    if not binary_path.exists():
+        return False
+    with open(binary_path, "rb") as f:
+        header = f.read(BINARY_FIXTURE_HEADER_SIZE)
+    return header == binary_fixture_header(fixture_file_hash(fixture_path))
+
+
+def load_fixtures(fixture_path: Path) -> Fixtures:
+    """
+    Load the fixtures of a (compressed) JSON fixture file, from the binary file written alongside
+    it if there is one that was written from the current contents of the JSON file.
+    """
+    if has_binary_fixture_file(fixture_path):
+        return decode_fixtures(binary_fixture_path(fixture_path).read_bytes())
+    with open_fixture_file(fixture_path) as f:
+        return Fixtures.model_validate_json(f.read())
@@ -5,6 +5,7 @@ from typing import (
     Annotated,
     Any,
     ClassVar,
+    Dict,
     List,
     Literal,
     Tuple,
@@ -505,6 +506,11 @@ class BlockchainFixtureCommon(BaseFixture):
         """Return fork of the fixture as a string."""
         return self.fork
 
+    @classmethod
+    def get_fork_name_from_json(cls, json_fixture: Dict[str, Any]) -> str | None:
+        """Return the name of the fixture's fork from its JSON representation."""
+        return json_fixture["network"]
+
 
 class BlockchainFixture(BlockchainFixtureCommon):
     """Cross-client specific blockchain test model use in JSON fixtures."""
@@ -535,6 +541,11 @@ class BlockchainEngineFixtureCommon(BaseFixture):
         """Return fixture's `Fork`."""
         return self.fork
 
+    @classmethod
+    def get_fork_name_from_json(cls, json_fixture: Dict[str, Any]) -> str | None:
+        """Return the name of the fixture's fork from its JSON representation."""
+        return json_fixture["network"]
+
     @classmethod
     def supports_fork(cls, fork: Fork) -> bool:
         """
@@ -7,15 +7,18 @@ import json
 import os
 import re
 import sys
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar, Dict, Literal, Optional, Tuple
+from typing import ClassVar, Dict, List, Literal, Optional, Tuple, Type
 
 from ethereum_test_base_types import to_json
 
 from .base import BaseFixture
+from .compression import COMPRESSED_FIXTURE_FILE_SUFFIX
 from .consume import FixtureConsumer
 from .file import Fixtures
+from .shards import append_to_shard, read_shard_fixture, write_fixture_file, write_shard_line
 
 
 @dataclass(kw_only=True, slots=True)
@@ -103,9 +106,26 @@ class TestInfo:
         return module_path
 
 
+@dataclass(kw_only=True, slots=True)
+class StreamedFixture:
+    """Metadata of a fixture that was written to a shard as soon as it was collected."""
+
+    name: str
+    hash: str
+    format: Type[BaseFixture]
+    offset: int  # Byte offset of the fixture in the shard
+
+
 @dataclass(kw_only=True)
 class FixtureCollector:
-    """Collects all fixtures generated by the test cases."""
+    """
+    Collects all fixtures generated by the test cases.
+
+    If `stream_fixtures` is set, each fixture is appended to the shard as soon as it is added,
+    and only its metadata is kept in memory until the collector is torn down.
+
+    If `compression_level` is set, fixture files are gzip-compressed `.json.gz` files.
+    """
 
     output_dir: Path
     flat_output: bool
@@ -113,9 +133,13 @@ class FixtureCollector:
     single_fixture_per_file: bool
     filler_path: Path
     base_dump_dir: Optional[Path] = None
+    shard_path: Optional[Path] = None
+    stream_fixtures: bool = False
+    compression_level: Optional[int] = None
 
     # Internal state
     all_fixtures: Dict[Path, Fixtures] = field(default_factory=dict)
+    streamed_fixtures: Dict[Path, List[StreamedFixture]] = field(default_factory=dict)
     json_path_to_test_item: Dict[Path, TestInfo] = field(default_factory=dict)
 
     def get_fixture_basename(self, info: TestInfo) -> Path:
@@ -145,6 +169,14 @@ class FixtureCollector:
             / fixture.output_base_dir_name()
             / fixture_basename.with_suffix(fixture.output_file_extension)
         )
+        if self.compression_level is not None:
+            fixture_path = fixture_path.with_name(
+                fixture_path.name.removesuffix(".json") + COMPRESSED_FIXTURE_FILE_SUFFIX
+            )
+        if self.stream_fixtures:
+            self.stream_fixture(fixture_path, info, fixture)
+            return fixture_path
+
         if fixture_path not in self.all_fixtures.keys():  # relevant when we group by test function
             self.all_fixtures[fixture_path] = Fixtures(root={})
             self.json_path_to_test_item[fixture_path] = info
@@ -153,34 +185,106 @@ class FixtureCollector:
 
         return fixture_path
 
+    def stream_fixture(self, fixture_path: Path, info: TestInfo, fixture: BaseFixture) -> None:
+        """Append the fixture to the shard and keep only its metadata."""
+        assert self.shard_path is not None, "Streaming fixtures requires a shard path."
+        if fixture_path not in self.streamed_fixtures:
+            self.streamed_fixtures[fixture_path] = []
+            self.json_path_to_test_item[fixture_path] = info
+        elif self.streamed_fixtures[fixture_path][0].format != fixture.__class__:
+            raise TypeError("All fixtures in a single file must have the same format.")
+        json_fixture = fixture.json_dict_with_info()
+        self.shard_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.shard_path, "ab") as f:
+            offset = write_shard_line(
+                f,
+                fixture_path.relative_to(self.output_dir).as_posix(),
+                info.get_id(),
+                json_fixture,
+            )
+        self.streamed_fixtures[fixture_path].append(
+            StreamedFixture(
+                name=info.get_id(),
+                hash=json_fixture["_info"]["hash"],
+                format=fixture.__class__,
+                offset=offset,
+            )
+        )
+
     def dump_fixtures(self) -> None:
-        """Dump all collected fixtures to their respective files."""
+        """
+        Dump all collected fixtures to their respective files.
+
+        If a shard path is set, the fixtures are appended to the shard instead, and the fixture
+        files are written when the shards are merged at the end of the session.
+        """
         if self.output_dir.name == "stdout":
             combined_fixtures = {
                 k: to_json(v) for fixture in self.all_fixtures.values() for k, v in fixture.items()
             }
             json.dump(combined_fixtures, sys.stdout, indent=4)
             return
+        for fixtures in self.all_fixtures.values():
+            if len({fixture.__class__ for fixture in fixtures.values()}) != 1:
+                raise TypeError("All fixtures in a single file must have the same format.")
+        if self.shard_path is not None:
+            append_to_shard(self.shard_path, self.output_dir, self.all_fixtures)
+            return
         os.makedirs(self.output_dir, exist_ok=True)
         for fixture_path, fixtures in self.all_fixtures.items():
             os.makedirs(fixture_path.parent, exist_ok=True)
-            if len({fixture.__class__ for fixture in fixtures.values()}) != 1:
-                raise TypeError("All fixtures in a single file must have the same format.")
-            fixtures.collect_into_file(fixture_path)
+            fixtures.collect_into_file(fixture_path, self.compression_level)
 
     def verify_fixture_files(self, evm_fixture_verification: FixtureConsumer) -> None:
         """Run `evm [state|block]test` on each fixture."""
-        for fixture_path, name_fixture_dict in self.all_fixtures.items():
-            for _fixture_name, fixture in name_fixture_dict.items():
-                if evm_fixture_verification.can_consume(fixture.__class__):
-                    info = self.json_path_to_test_item[fixture_path]
-                    consume_direct_dump_dir = self._get_consume_direct_dump_dir(info)
-                    evm_fixture_verification.consume_fixture(
-                        fixture.__class__,
-                        fixture_path,
-                        fixture_name=None,
-                        debug_output_path=consume_direct_dump_dir,
-                    )
+        fixture_formats: Dict[Path, List[Type[BaseFixture]]] = {
+            fixture_path: [fixture.__class__ for fixture in fixtures.values()]
+            for fixture_path, fixtures in self.all_fixtures.items()
+        } | {
+            fixture_path: [streamed_fixture.format for streamed_fixture in streamed_fixtures]
+            for fixture_path, streamed_fixtures in self.streamed_fixtures.items()
+        }
+        with tempfile.TemporaryDirectory(prefix="fixture-verification-") as temp_dir:
+            for fixture_path, formats in fixture_formats.items():
+                verified_path = fixture_path
+                if self.shard_path is not None or self.compression_level is not None:
+                    # The fixture file is only written when the shards are merged, or cannot be
+                    # read by the consumer if compressed, so verify a plain file containing the
+                    # fixtures of this collector.
+                    verified_path = Path(temp_dir) / fixture_path.relative_to(
+                        self.output_dir
+                    ).with_name(fixture_path.name.removesuffix(".gz"))
+                    verified_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._write_collected_fixtures(fixture_path, verified_path)
+                for fixture_format in formats:
+                    if evm_fixture_verification.can_consume(fixture_format):
+                        info = self.json_path_to_test_item[fixture_path]
+                        consume_direct_dump_dir = self._get_consume_direct_dump_dir(info)
+                        evm_fixture_verification.consume_fixture(
+                            fixture_format,
+                            verified_path,
+                            fixture_name=None,
+                            debug_output_path=consume_direct_dump_dir,
+                        )
+
+    def _write_collected_fixtures(self, fixture_path: Path, file_path: Path) -> None:
+        """Write the fixtures collected for the given fixture path to another file."""
+        if fixture_path in self.all_fixtures:
+            self.all_fixtures[fixture_path].collect_into_file(file_path)
+            return
+        assert self.shard_path is not None
+        shard_path = self.shard_path
+        streamed_fixtures = {
+            streamed_fixture.name: streamed_fixture.offset
+            for streamed_fixture in self.streamed_fixtures[fixture_path]
+        }
+        write_fixture_file(
+            file_path,
+            (
+                (name, read_shard_fixture(shard_path, offset))
+                for name, offset in sorted(streamed_fixtures.items())
+            ),
+        )
 
     def _get_consume_direct_dump_dir(
         self,
@@ -0,0 +1,78 @@
+"""Reading and writing of plain and gzip-compressed JSON fixture files."""
+
+import gzip
+import io
+import shutil
+from pathlib import Path
+from typing import IO, Iterator, Literal
+
+FIXTURE_FILE_SUFFIX = ".json"
+COMPRESSED_FIXTURE_FILE_SUFFIX = ".json.gz"
+DEFAULT_COMPRESSION_LEVEL = 6
+"""Default gzip compression level, a good trade-off between size and speed for hex JSON."""
+
+
+def is_compressed_fixture_file(path: Path) -> bool:
+    """Return True if the path is a compressed JSON fixture file."""
+    return path.name.endswith(COMPRESSED_FIXTURE_FILE_SUFFIX)
+
+
+def is_fixture_file(path: Path) -> bool:
+    """Return True if the path is a plain or compressed JSON fixture file."""
+    return path.suffix == FIXTURE_FILE_SUFFIX or is_compressed_fixture_file(path)
+
+
+def uncompressed_name(path: Path) -> str:
+    """Return the name of the file without the compression suffix, e.g. `add.json`."""
+    if is_compressed_fixture_file(path):
+        return path.name.removesuffix(".gz")
+    return path.name
+
+
+def iter_fixture_files(folder: Path) -> Iterator[Path]:
+    """Iterate over all the plain and compressed JSON files in the folder, recursively."""
+    return (path for path in folder.rglob("*.json*") if is_fixture_file(path))
+
+
+def open_fixture_file(
+    path: Path, mode: Literal["r", "w"] = "r", compression_level: int | None = None
+) -> IO[str]:
+    """
+    Open a fixture file in text mode, compressing or decompressing it if its name ends in
+    `.json.gz`; files are compressed with `DEFAULT_COMPRESSION_LEVEL` if no level is given.
+
+    Compressed files are written without a modification time in the gzip header, so that filling
+    the same fixtures twice produces identical files.
+    """
+    if not is_compressed_fixture_file(path):
+        return open(path, mode)
+    if mode == "r":
+        return gzip.open(path, "rt")
+    if compression_level is None:
+        compression_level = DEFAULT_COMPRESSION_LEVEL
+    return io.TextIOWrapper(
+        gzip.GzipFile(filename=path, mode="wb", compresslevel=compression_level, mtime=0)
+    )
+
+
+def read_fixture_file(path: Path) -> str:
+    """Return the decompressed contents of a fixture file."""
+    with open_fixture_file(path) as f:
+        return f.read()
+
+
+def decode_fixture_file(path: Path, data: bytes) -> str:
+    """Return the decompressed text of the raw contents of the fixture file at the path."""
+    if is_compressed_fixture_file(path):
+        data = gzip.decompress(data)
+    return data.decode()
+
+
+def decompress_fixture_file(path: Path, decompressed_path: Path) -> None:
+    """
+    Write a plain JSON copy of a compressed fixture file, used to pass fixtures to client tools
+    that only read plain JSON files.
+    """
+    decompressed_path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "rb") as source, open(decompressed_path, "wb") as destination:
+        shutil.copyfileobj(source, destination)
@@ -62,6 +62,10 @@ class TestCaseIndexFile(TestCaseBase):
     """The test case model used to save/load test cases to/from an index file."""
 
     json_path: Path
+    byte_offset: int | None = None
+    """Offset of the fixture's JSON object in the (uncompressed) fixture file, if known."""
+    byte_length: int | None = None
+    """Length of the fixture's JSON object in the fixture file, if known."""
     __test__ = False  # stop pytest from collecting this class as a test
 
     # TODO: add pytest marks
@@ -1,6 +1,6 @@
 """EOFTest Type Definitions."""
 
-from typing import Any, ClassVar, Mapping
+from typing import Any, ClassVar, Dict, Mapping
 
 from pydantic import Field
 
@@ -49,3 +49,8 @@ class EOFFixture(BaseFixture):
     def get_fork(self) -> Fork | None:
         """Return fork of the fixture as a string."""
         return None
+
+    @classmethod
+    def get_fork_name_from_json(cls, json_fixture: Dict[str, Any]) -> str | None:
+        """Return the name of the fixture's fork from its JSON representation."""
+        return None
@@ -1,8 +1,10 @@
 """Defines models for interacting with JSON fixture files."""
 
 import json
+import mmap
+import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
 
 from filelock import FileLock
 from pydantic import SerializeAsAny
@@ -10,6 +12,9 @@ from pydantic import SerializeAsAny
 from ethereum_test_base_types import EthereumTestRootModel
 
 from .base import BaseFixture
+from .compression import open_fixture_file
+
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
 class Fixtures(EthereumTestRootModel):
@@ -50,10 +55,12 @@ class Fixtures(EthereumTestRootModel):
     def items(self):  # noqa: D102
         return self.root.items()
 
-    def collect_into_file(self, file_path: Path):
+    def collect_into_file(self, file_path: Path, compression_level: int | None = None):
         """
         For all formats, we join the fixtures as json into a single file.
 
+        The file is gzip-compressed with the given level if its name ends in `.json.gz`.
+
         Note: We don't use pydantic model_dump_json() on the Fixtures object as we
         add the hash to the info field on per-fixture basis.
         """
@@ -61,10 +68,50 @@ class Fixtures(EthereumTestRootModel):
         lock_file_path = file_path.with_suffix(".lock")
         with FileLock(lock_file_path):
             if file_path.exists():
-                with open(file_path, "r") as f:
+                with open_fixture_file(file_path) as f:
                     json_fixtures = json.load(f)
             for name, fixture in self.items():
                 json_fixtures[name] = fixture.json_dict_with_info()
 
-            with open(file_path, "w") as f:
+            with open_fixture_file(file_path, "w", compression_level) as f:
                 json.dump(dict(sorted(json_fixtures.items())), f, indent=4)
+
+
+def scan_fixture_file(text: str) -> Iterator[Tuple[str, Any, int, int]]:
+    """
+    Parse the top-level object of a fixture file, yielding the name and the JSON value of each
+    fixture, along with the offset and length of the value in the text.
+    """
+    decoder = json.JSONDecoder()
+
+    def skip_whitespace(index: int) -> int:
+        match = JSON_WHITESPACE.match(text, index)
+        assert match is not None
+        return match.end()
+
+    index = skip_whitespace(0)
+    if text[index : index + 1] != "{":
+        raise ValueError("Fixture file does not contain a JSON object.")
+    index = skip_whitespace(index + 1)
+    if text[index : index + 1] == "}":
+        return
+    while True:
+        name, index = decoder.raw_decode(text, index)
+        index = skip_whitespace(index)
+        if text[index : index + 1] != ":":
+            raise ValueError(f"Expected ':' at position {index} of the fixture file.")
+        index = skip_whitespace(index + 1)
+        value, end = decoder.raw_decode(text, index)
+        yield name, value, index, end - index
+        index = skip_whitespace(end)
+        if text[index : index + 1] == "}":
+            return
+        if text[index : index + 1] != ",":
+            raise ValueError(f"Expected ',' or '}}' at position {index} of the fixture file.")
+        index = skip_whitespace(index + 1)
+
+
+def read_fixture_bytes(file_path: Path, byte_offset: int, byte_length: int) -> bytes:
+    """Read the JSON object of a single fixture from a plain fixture file, by memory-mapping it."""
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return m[byte_offset : byte_offset + byte_length]
@@ -1,12 +1,13 @@
 """Pre-allocation group models for test fixture generation."""
 
+import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, List, Tuple
 
 from filelock import FileLock
-from pydantic import Field, computed_field
+from pydantic import Field, PrivateAttr, computed_field
 
-from ethereum_test_base_types import CamelModel, EthereumTestRootModel
+from ethereum_test_base_types import Account, CamelModel, EthereumTestRootModel, Hash
 from ethereum_test_forks import Fork
 from ethereum_test_types import Alloc, Environment
 
@@ -29,15 +30,49 @@ class PreAllocGroup(CamelModel):
     environment: Environment = Field(..., description="Grouping environment for this test group")
     fork: Fork = Field(..., alias="network")
     pre: Alloc
+    alloc_hash: Hash | None = Field(
+        None, description="Content hash of the pre-allocation when its state root was computed"
+    )
+    state_root: Hash | None = Field(None, description="State root of the pre-allocation")
+
+    # Fraction of the groups loaded with a precomputed state root for which it is computed
+    # again and verified. Pytest plugins may override it.
+    state_root_verification_rate: ClassVar[float] = 0.0
 
     def model_post_init(self, __context):
-        """Post-init hook to ensure pre is not None."""
+        """
+        Post-init hook to ensure pre is not None, and to verify a sample of the precomputed state
+        roots of the pre-allocations.
+        """
         super().model_post_init(__context)
 
         self.pre = Alloc.merge(
             Alloc.model_validate(self.fork.pre_allocation_blockchain()),
             self.pre,
         )
+        if self.alloc_hash is not None and self.state_root is not None:
+            sample = int.from_bytes(self.alloc_hash[:8], "big") / 2**64
+            if sample < self.state_root_verification_rate:
+                state_root = self.pre.state_root()
+                if state_root != self.state_root:
+                    raise ValueError(
+                        f"Precomputed state root {self.state_root} of pre-allocation group "
+                        f"doesn't match its computed state root {state_root}."
+                    )
+
+    def compute_state_root(self) -> None:
+        """
+        Compute the state root of the pre-allocation, and record it along with the content hash
+        of the pre-allocation, so that it's reused when the group is loaded again.
+        """
+        self.alloc_hash = self.pre.content_hash()
+        self.state_root = self.pre.state_root()
+
+    def genesis_state_root(self) -> Hash:
+        """Return the precomputed state root of the pre-allocation, or compute it if missing."""
+        if self.state_root is not None:
+            return self.state_root
+        return self.pre.state_root()
 
     @computed_field  # type: ignore[misc]
     def genesis(self) -> FixtureHeader:
@@ -45,7 +80,7 @@ class PreAllocGroup(CamelModel):
         return FixtureHeader.genesis(
             self.fork,
             self.environment.set_fork_requirements(self.fork),
-            self.pre.state_root(),
+            self.genesis_state_root(),
         )
 
     def to_file(self, file: Path) -> None:
@@ -71,48 +106,240 @@ class PreAllocGroups(EthereumTestRootModel):
 
     root: Dict[str, PreAllocGroup]
 
+    _group_files: Dict[str, Path] = PrivateAttr(default_factory=dict)
+    _loaded_group_sizes: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _cache_size: int | None = PrivateAttr(default=None)
+    _shards_folder: Path | None = PrivateAttr(default=None)
+    _shard_name: str = PrivateAttr(default="master")
+
     def __setitem__(self, key: str, value: Any):
         """Set item in root dict."""
         self.root[key] = value
 
     @classmethod
-    def from_folder(cls, folder: Path) -> "PreAllocGroups":
-        """Create PreAllocGroups from a folder of pre-allocation files."""
+    def from_folder(
+        cls,
+        folder: Path,
+        *,
+        lazy_load: bool = False,
+        cache_size: int | None = None,
+    ) -> "PreAllocGroups":
+        """
+        Create PreAllocGroups from a folder of pre-allocation files.
+
+        With `lazy_load`, only the group files are listed, and each group is loaded when it is
+        first accessed by its hash. Loaded groups are then kept while the total size of their
+        files is within `cache_size` bytes (unbounded if None), unloading the least recently
+        used groups beyond it.
+        """
+        if lazy_load:
+            groups = cls(root={})
+            groups._group_files = {file.stem: file for file in sorted(folder.glob("*.json"))}
+            groups._cache_size = cache_size
+            return groups
         data = {}
         for file in folder.glob("*.json"):
             with open(file) as f:
                 data[file.stem] = PreAllocGroup.model_validate_json(f.read())
         return cls(root=data)
 
+    def _load_group(self, key: str) -> PreAllocGroup:
+        """Load a group from its file, unloading the least recently used groups if needed."""
+        group_json = self._group_files[key].read_bytes()
+        group = PreAllocGroup.model_validate_json(group_json)
+        self.root[key] = group
+        self._loaded_group_sizes[key] = len(group_json)
+        if self._cache_size is not None:
+            while (
+                len(self._loaded_group_sizes) > 1
+                and sum(self._loaded_group_sizes.values()) > self._cache_size
+            ):
+                evicted_key = next(iter(self._loaded_group_sizes))
+                del self._loaded_group_sizes[evicted_key]
+                del self.root[evicted_key]
+        return group
+
     def to_folder(self, folder: Path) -> None:
         """Save PreAllocGroups to a folder of pre-allocation files."""
         for key, value in self.root.items():
             value.to_file(folder / f"{key}.json")
 
+    def stream_to_shards(self, shards_folder: Path, shard_name: str) -> None:
+        """
+        Append the pre-allocation of each test recorded with `add_test_pre` to the shards of
+        this worker as soon as it's recorded, instead of keeping it in memory.
+        """
+        self._shards_folder = shards_folder
+        self._shard_name = shard_name
+
+    def add_test_pre(self, key: str, test_id: str, pre: Alloc) -> None:
+        """
+        Append the pre-allocation of a test of a group, one line per test, to the shard of this
+        worker for the group, to be merged with the pre-allocations of the other tests of the
+        group by `merge_pre_alloc_group_shards`.
+
+        Each line is the JSON encoded test ID and the JSON encoded pre-allocation, separated by
+        a tab, which JSON encoded strings never contain.
+        """
+        assert self._shards_folder is not None, "Call `stream_to_shards` first."
+        group_folder = self._shards_folder / key
+        group_folder.mkdir(parents=True, exist_ok=True)
+        pre_json = json.dumps(pre.model_dump(mode="json", by_alias=True, exclude_unset=True))
+        with open(group_folder / f"{self._shard_name}.jsonl", "a") as f:
+            f.write(f"{json.dumps(test_id)}\t{pre_json}\n")
+
+    def to_shards(self, shards_folder: Path, shard_name: str) -> None:
+        """
+        Save the pre-allocation groups of a worker as shards, to be merged with the shards of the
+        other workers by `merge_pre_alloc_group_shards`.
+
+        The environment, fork and test IDs of each group are written to a JSON file alongside the
+        pre-allocations of its tests appended by `add_test_pre`. If none were appended, the
+        pre-allocation of the whole group is written instead, keyed by its test IDs.
+        """
+        for key, value in self.root.items():
+            group_folder = shards_folder / key
+            group_folder.mkdir(parents=True, exist_ok=True)
+            shard = value.model_dump(
+                mode="json", by_alias=True, exclude_none=True, include={"environment", "fork"}
+            )
+            shard["testIds"] = value.test_ids
+            (group_folder / f"{shard_name}.json").write_text(json.dumps(shard))
+            test_pres_file = group_folder / f"{shard_name}.jsonl"
+            if not test_pres_file.exists():
+                pre_json = json.dumps(
+                    value.pre.model_dump(mode="json", by_alias=True, exclude_unset=True)
+                )
+                test_pres_file.write_text(f"{json.dumps(','.join(value.test_ids))}\t{pre_json}\n")
+
     def __getitem__(self, item):
-        """Get item from root dict."""
+        """Get item from root dict, loading it from its file if it's not loaded."""
+        if item in self._loaded_group_sizes:
+            # Mark the group as the most recently used
+            self._loaded_group_sizes[item] = self._loaded_group_sizes.pop(item)
+        elif item not in self.root and item in self._group_files:
+            return self._load_group(item)
         return self.root[item]
 
     def __iter__(self):
         """Iterate over root dict."""
-        return iter(self.root)
+        return iter(self.keys())
 
     def __contains__(self, item):
         """Check if item in root dict."""
-        return item in self.root
+        return item in self.root or item in self._group_files
 
     def __len__(self):
         """Get length of root dict."""
-        return len(self.root)
+        return len(self.keys())
 
     def keys(self):
         """Get keys from root dict."""
+        if self._group_files:
+            return list(self._group_files) + [
+                key for key in self.root if key not in self._group_files
+            ]
         return self.root.keys()
 
     def values(self):
         """Get values from root dict."""
+        if self._group_files:
+            return [self[key] for key in self.keys()]
         return self.root.values()
 
     def items(self):
         """Get items from root dict."""
+        if self._group_files:
+            return [(key, self[key]) for key in self.keys()]
         return self.root.items()
+
+
+def index_test_pres(test_pres_files: List[Path]) -> List[Tuple[str, int, int]]:
+    """
+    Return the test ID, file index and byte offset of each line of the files of test
+    pre-allocations of a group, sorted by test ID.
+    """
+    index: List[Tuple[str, int, int]] = []
+    for file_index, test_pres_file in enumerate(test_pres_files):
+        with open(test_pres_file, "rb") as f:
+            offset = 0
+            for line in f:
+                test_id_json, _ = line.split(b"\t", 1)
+                index.append((json.loads(test_id_json), file_index, offset))
+                offset += len(line)
+    index.sort()
+    return index
+
+
+def normalized_account(account: Dict[str, Any] | None) -> Dict[str, Any]:
+    """Return the JSON account with all its fields, including the ones left to their default."""
+    return Account.model_validate(account or {}).model_dump(mode="json")
+
+
+def merge_pre_alloc_group_shards(shards_folder: Path, folder: Path) -> Dict[str, List[str]]:
+    """
+    Merge the shards of the pre-allocation groups written by all the workers into one file per
+    group in the folder.
+
+    Each group is merged on its own: the pre-allocations of its tests are read back one at a
+    time, in test ID order, and merged field by field into the pre-allocation of the group,
+    dropping empty accounts as in `Alloc.merge`. The test IDs of the group are sorted, so that
+    the group files are the same no matter which worker filled which test, and in which order.
+    Only the merged pre-allocation of the group being merged is kept in memory, and each group
+    file is written exactly once, so no locking is needed.
+
+    Return the addresses of the accounts that are defined differently by different tests of a
+    group, by group. Accounts are compared with all their fields, so that a field left to its
+    default value by one test collides with the same field set to another value by another test.
+    """
+    collisions: Dict[str, List[str]] = {}
+    folder.mkdir(parents=True, exist_ok=True)
+    for group_folder in sorted(shards_folder.iterdir()):
+        if not group_folder.is_dir():
+            continue
+        merged_group: Dict[str, Any] = {}
+        test_ids: List[str] = []
+        for shard_file in sorted(group_folder.glob("*.json")):
+            shard = json.loads(shard_file.read_text())
+            merged_group.setdefault("environment", shard["environment"])
+            merged_group.setdefault("network", shard["network"])
+            test_ids.extend(shard["testIds"])
+        if not merged_group:
+            continue
+
+        merged_pre: Dict[str, Any] = {}
+        group_collisions: Dict[str, None] = {}
+        test_pres_files = sorted(group_folder.glob("*.jsonl"))
+        test_pres_handles = [open(test_pres_file, "rb") for test_pres_file in test_pres_files]
+        try:
+            for _, file_index, offset in index_test_pres(test_pres_files):
+                test_pres_handle = test_pres_handles[file_index]
+                test_pres_handle.seek(offset)
+                _, pre_json = test_pres_handle.readline().split(b"\t", 1)
+                for address, account in json.loads(pre_json).items():
+                    if address in merged_pre and merged_pre[address] != account:
+                        if normalized_account(merged_pre[address]) != normalized_account(account):
+                            group_collisions[address] = None
+                        account = {**(merged_pre[address] or {}), **(account or {})}
+                    merged_pre[address] = account
+        finally:
+            for test_pres_handle in test_pres_handles:
+                test_pres_handle.close()
+        if group_collisions:
+            collisions[group_folder.name] = list(group_collisions)
+        merged_pre = {
+            address: account
+            for address, account in merged_pre.items()
+            if account is not None and Account.model_validate(account)
+        }
+
+        merged_group["testIds"] = sorted(test_ids)
+        merged_group["testCount"] = len(test_ids)
+        merged_group["pre"] = merged_pre
+        group = PreAllocGroup.model_validate(merged_group)
+        group.pre_account_count = len(group.pre.root)
+        group.compute_state_root()
+        (folder / f"{group_folder.name}.json").write_text(
+            group.model_dump_json(by_alias=True, exclude_none=True, indent=2)
+        )
+    return collisions
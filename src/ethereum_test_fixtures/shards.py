@@ -0,0 +1,137 @@
+"""
+Append-only fixture shards written by each pytest worker, and merged into the final fixture
+files at the end of the session.
+"""
+
+import json
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Tuple
+
+from .compression import open_fixture_file
+from .file import Fixtures
+
+FIXTURE_SHARD_INDENT = 4
+"""Indentation of the fixture files, which must match `Fixtures.collect_into_file`."""
+
+
+def write_shard_line(f: IO[bytes], relative_path: str, name: str, json_fixture: Any) -> int:
+    """
+    Write a fixture to a shard opened for appending, and return the byte offset of the fixture.
+
+    Each line of the shard is the JSON-encoded `[path, name]` header of a fixture, with the path
+    relative to the output directory, followed by a tab and the JSON-encoded fixture. The tab
+    cannot appear in the JSON-encoded header, so the header can be decoded without parsing the
+    fixture.
+    """
+    header = json.dumps([relative_path, name]).encode() + b"\t"
+    offset = f.tell() + len(header)
+    f.write(header + json.dumps(json_fixture).encode() + b"\n")
+    return offset
+
+
+def read_shard_fixture(shard_path: Path, offset: int) -> Any:
+    """Read the fixture at the given byte offset of a shard."""
+    with open(shard_path, "rb") as f:
+        f.seek(offset)
+        return json.loads(f.readline())
+
+
+def append_to_shard(shard_path: Path, output_dir: Path, fixtures: Dict[Path, Fixtures]) -> None:
+    """Append the fixtures to the shard of the worker."""
+    shard_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(shard_path, "ab") as f:
+        for fixture_path, path_fixtures in fixtures.items():
+            relative_path = fixture_path.relative_to(output_dir).as_posix()
+            for name, fixture in path_fixtures.items():
+                write_shard_line(f, relative_path, name, fixture.json_dict_with_info())
+
+
+def iter_shard_headers(shard_path: Path) -> Iterator[Tuple[str, str, int]]:
+    """Yield the relative path, name and byte offset of each fixture in a shard."""
+    with open(shard_path, "rb") as f:
+        offset = 0
+        for line in f:
+            header, _, _ = line.partition(b"\t")
+            relative_path, name = json.loads(header)
+            yield relative_path, name, offset + len(header) + 1
+            offset += len(line)
+
+
+def write_fixture_file(
+    file_path: Path,
+    json_fixtures: Iterator[Tuple[str, Any]],
+    compression_level: int | None = None,
+) -> None:
+    """
+    Write the fixtures, in the given order, one at a time.
+
+    The output is byte-identical to `json.dump` of the whole dictionary with the same
+    indentation, without holding all the fixtures of the file in memory. The file is
+    gzip-compressed with the given level if its name ends in `.json.gz`.
+    """
+    with open_fixture_file(file_path, "w", compression_level) as f:
+        separator = "{"
+        for name, json_fixture in json_fixtures:
+            json_fixture_str = json.dumps(json_fixture, indent=FIXTURE_SHARD_INDENT).replace(
+                "\n", "\n" + " " * FIXTURE_SHARD_INDENT
+            )
+            f.write(
+                f"{separator}\n{' ' * FIXTURE_SHARD_INDENT}{json.dumps(name)}: {json_fixture_str}"
+            )
+            separator = ","
+        f.write("{}" if separator == "{" else "\n}")
+
+
+def merge_fixture_shards(
+    shards_folder: Path, output_dir: Path, compression_level: int | None = None
+) -> int:
+    """
+    Merge the shards of all the workers into the fixture files in the output directory.
+
+    Only the headers of the shards are decoded in a first pass; each fixture file is then written
+    by reading its fixtures from the shards in sorted name order, so the memory used is bounded
+    by the largest fixture rather than by the largest file. Fixtures already present in an
+    existing fixture file are kept, as when collecting fixtures directly into the file.
+
+    Return the number of fixture files written.
+    """
+    shard_paths = sorted(shards_folder.glob("*.jsonl"))
+    locations: Dict[str, Dict[str, Tuple[int, int]]] = {}
+    for shard_number, shard_path in enumerate(shard_paths):
+        for relative_path, name, offset in iter_shard_headers(shard_path):
+            locations.setdefault(relative_path, {})[name] = (shard_number, offset)
+
+    shard_files = [open(shard_path, "rb") for shard_path in shard_paths]
+    try:
+
+        def read_fixture(location: Tuple[int, int]) -> Any:
+            shard_number, offset = location
+            shard_file = shard_files[shard_number]
+            shard_file.seek(offset)
+            return json.loads(shard_file.readline())
+
+        for relative_path, file_locations in locations.items():
+            file_path = output_dir / relative_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            existing_fixtures: Dict[str, Any] = {}
+            if file_path.exists():
+                with open_fixture_file(file_path) as f:
+                    existing_fixtures = json.load(f)
+            names: List[str] = sorted(existing_fixtures.keys() | file_locations.keys())
+            write_fixture_file(
+                file_path,
+                (
+                    (
+                        name,
+                        read_fixture(file_locations[name])
+                        if name in file_locations
+                        else existing_fixtures[name],
+                    )
+                    for name in names
+                ),
+                compression_level,
+            )
+    finally:
+        for shard_file in shard_files:
+            shard_file.close()
+    return len(locations)
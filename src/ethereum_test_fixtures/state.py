@@ -1,6 +1,6 @@
 """StateTest types."""
 
-from typing import ClassVar, List, Mapping, Sequence
+from typing import Any, ClassVar, Dict, List, Mapping, Sequence
 
 from pydantic import BaseModel, Field
 
@@ -106,3 +106,10 @@ class StateFixture(BaseFixture):
         forks = list(self.post.keys())
         assert len(forks) == 1, "Expected state test fixture with single fork"
         return forks[0]
+
+    @classmethod
+    def get_fork_name_from_json(cls, json_fixture: Dict[str, Any]) -> str | None:
+        """Return the name of the fixture's fork from its JSON representation."""
+        forks = list(json_fixture["post"].keys())
+        assert len(forks) == 1, "Expected state test fixture with single fork"
+        return forks[0]
@@ -1,8 +1,12 @@
 """Test cases for the ethereum_test_fixtures.base module."""
 
+import hashlib
+import json
+from typing import Any
+
 import pytest
 
-from ..base import BaseFixture
+from ..base import BaseFixture, update_canonical_json_hash
 from ..file import Fixtures
 from ..state import FixtureEnvironment, FixtureTransaction, StateFixture
 from ..transaction import FixtureResult, TransactionFixture
@@ -56,3 +60,27 @@ def test_base_fixtures_parsing(fixture: BaseFixture):
     json_dump = fixture.json_dict_with_info()
     assert json_dump is not None
     Fixtures.model_validate({"fixture": json_dump})
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        [],
+        "0x1234",
+        {"b": {"d": [1, {"e": None}], "c": "é"}, "a": [[], {}], "f": 1.5},
+        {"alloc": {"0x02": {"storage": {"0x01": "0x02"}}, "0x01": {"nonce": "0x00"}}},
+        {1: {"b": [True]}, 0: "a"},
+        [(1, {"a": 2}), ["x"]],
+    ],
+)
+def test_canonical_json_hash(value: Any):
+    """Test that the canonical JSON hash is the hash of the canonical JSON encoding."""
+    h = hashlib.sha256()
+    update_canonical_json_hash(h, value)
+    assert (
+        h.hexdigest()
+        == hashlib.sha256(
+            json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+    )
@@ -0,0 +1,96 @@
+"""Test the binary encoding of fixture files."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from ethereum_test_base_types import Account, Alloc, Hash, Storage
+from ethereum_test_forks import Prague
+
+from ..binary import (
+    BINARY_FIXTURE_MAGIC,
+    binary_fixture_path,
+    decode_fixtures,
+    encode_fixtures,
+    has_binary_fixture_file,
+    load_fixtures,
+    write_binary_fixture_file,
+)
+from ..file import Fixtures
+from ..state import FixtureEnvironment, FixtureForkPost, FixtureTransaction, StateFixture
+
+
+def state_fixture() -> StateFixture:
+    """Return a state fixture with non-trivial pre and post allocations."""
+    pre = Alloc(
+        {
+            0x1000: Account(nonce=1, balance=10**18, code=b"\x60\x00" * 100, storage={0: 1}),
+            0x2000: Account(storage=Storage({2**256 - 1: 2**255, 1: 0})),
+        }
+    )
+    post_state = Alloc({0x1000: Account(nonce=2, storage={}), 0x3000: None})
+    fixture = StateFixture(
+        env=FixtureEnvironment(),
+        pre=pre,
+        transaction=FixtureTransaction(nonce=0, gas_limit=[0], value=[0], data=[b""]),
+        post={
+            Prague: [
+                FixtureForkPost(
+                    state_root=Hash(1),
+                    logs_hash=Hash(2),
+                    tx_bytes=b"\x01",
+                    state=post_state,
+                )
+            ]
+        },
+        config={},
+    )
+    fixture.fill_info(
+        "t8n-version",
+        "description",
+        fixture_source_url="url",
+        ref_spec=None,
+        _info_metadata={},
+    )
+    return fixture
+
+
+def test_encode_decode_fixtures():
+    """Test that decoded fixtures serialize exactly as the original JSON fixtures."""
+    json_fixtures = json.loads(json.dumps({"test": state_fixture().json_dict_with_info()}))
+    encoded = encode_fixtures(json_fixtures)
+    assert len(encoded) < len(json.dumps(json_fixtures))
+
+    fixtures = decode_fixtures(encoded)
+    assert fixtures["test"].json_dict_with_info() == json_fixtures["test"]
+    assert fixtures["test"].hash == Fixtures.model_validate(json_fixtures)["test"].hash
+
+    with pytest.raises(ValueError, match="Not a binary fixture file"):
+        decode_fixtures(json.dumps(json_fixtures).encode())
+    with pytest.raises(ValueError, match="Unsupported binary fixture file version 1"):
+        decode_fixtures(BINARY_FIXTURE_MAGIC + b"\x01" + encoded[len(BINARY_FIXTURE_MAGIC) + 1 :])
+
+
+def test_load_fixtures(tmp_path: Path):
+    """Test that the binary file is loaded only if it was written from the current JSON file."""
+    fixture_path = tmp_path / "state_tests" / "test.json"
+    fixture_path.parent.mkdir()
+    Fixtures(root={"test": state_fixture()}).collect_into_file(fixture_path)
+    assert load_fixtures(fixture_path)["test"].hash == state_fixture().hash
+    assert not has_binary_fixture_file(fixture_path)
+
+    binary_path = write_binary_fixture_file(fixture_path)
+    assert has_binary_fixture_file(fixture_path)
+    assert binary_path == binary_fixture_path(fixture_path) == tmp_path / "state_tests/test.bin"
+    assert load_fixtures(fixture_path)["test"].hash == state_fixture().hash
+
+    os.utime(binary_path, (0, 0))
+    assert has_binary_fixture_file(fixture_path), "file times must not invalidate the binary file"
+
+    modified_fixture = state_fixture()
+    modified_fixture.pre = Alloc({0x4000: Account(nonce=1)})
+    Fixtures(root={"test": modified_fixture}).collect_into_file(fixture_path)
+    assert not has_binary_fixture_file(fixture_path)
+    assert load_fixtures(fixture_path)["test"].hash == modified_fixture.hash
@@ -0,0 +1,113 @@
+"""Test reading and writing compressed fixture files."""
+
+import gzip
+import json
+from pathlib import Path
+
+from ..base import FixtureFormat
+from ..collector import FixtureCollector
+from ..collector import TestInfo as CollectorTestInfo
+from ..compression import (
+    decompress_fixture_file,
+    is_fixture_file,
+    iter_fixture_files,
+    read_fixture_file,
+)
+from ..consume import FixtureConsumer
+from ..file import Fixtures
+from ..transaction import FixtureResult, TransactionFixture
+
+
+def fill_fixtures(output_dir: Path, suffix: str) -> None:
+    """Write the same fixtures to two files with the given suffix."""
+    for module in ("module_a", "module_b"):
+        fixtures = {}
+        for intrinsic_gas in (1, 2):
+            fixture = TransactionFixture(
+                transaction="0x1234",
+                result={"Paris": FixtureResult(intrinsic_gas=intrinsic_gas)},
+            )
+            fixture.fill_info(
+                "t8n-version",
+                "description",
+                fixture_source_url="url",
+                ref_spec=None,
+                _info_metadata={},
+            )
+            fixtures[f"{module}[{intrinsic_gas}]"] = fixture
+        file_path = output_dir / "transaction_tests" / f"{module}{suffix}"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        Fixtures(root=fixtures).collect_into_file(file_path)
+
+
+def test_compressed_fixture_files(tmp_path: Path):
+    """Test that compressed files contain the plain output, and are reproducible."""
+    fill_fixtures(tmp_path / "plain", ".json")
+    fill_fixtures(tmp_path / "compressed", ".json.gz")
+    plain_path = tmp_path / "plain" / "transaction_tests" / "module_a.json"
+    compressed_path = tmp_path / "compressed" / "transaction_tests" / "module_a.json.gz"
+
+    assert gzip.decompress(compressed_path.read_bytes()) == plain_path.read_bytes()
+    assert read_fixture_file(compressed_path) == plain_path.read_text()
+    compressed_bytes = compressed_path.read_bytes()
+    fill_fixtures(tmp_path / "compressed", ".json.gz")
+    assert compressed_path.read_bytes() == compressed_bytes
+
+    decompressed_path = tmp_path / "decompressed" / "module_a.json"
+    decompress_fixture_file(compressed_path, decompressed_path)
+    assert decompressed_path.read_bytes() == plain_path.read_bytes()
+
+    assert sorted(path.name for path in iter_fixture_files(tmp_path / "compressed")) == [
+        "module_a.json.gz",
+        "module_b.json.gz",
+    ]
+    assert not is_fixture_file(tmp_path / "fixtures.tar.gz")
+
+
+class PlainFileConsumer(FixtureConsumer):
+    """Fixture consumer that checks that the consumed fixture files are plain json files."""
+
+    def can_consume(self, fixture_format: FixtureFormat) -> bool:
+        """Consume any fixture format."""
+        return True
+
+    def consume_fixture(
+        self,
+        fixture_format: FixtureFormat,
+        fixture_path: Path,
+        fixture_name: str | None = None,
+        debug_output_path: Path | None = None,
+    ):
+        """Check the fixture file is plain json."""
+        assert fixture_path.suffix == ".json"
+        assert fixture_name is None
+        json.loads(fixture_path.read_text())
+
+
+def test_collector_compression(tmp_path: Path):
+    """Test that the collector writes compressed files and verifies plain copies."""
+    collector = FixtureCollector(
+        output_dir=tmp_path / "output",
+        flat_output=True,
+        fill_static_tests=False,
+        single_fixture_per_file=False,
+        filler_path=tmp_path / "tests",
+        compression_level=1,
+    )
+    fixture = TransactionFixture(
+        transaction="0x1234",
+        result={"Paris": FixtureResult(intrinsic_gas=1)},
+    )
+    fixture_path = collector.add_fixture(
+        CollectorTestInfo(
+            name="test_a[fork_Paris]",
+            id="test_a[fork_Paris]",
+            original_name="test_a",
+            module_path=tmp_path / "tests" / "test_module.py",
+        ),
+        fixture,
+    )
+    assert fixture_path == tmp_path / "output" / "transaction_tests" / "a.json.gz"
+    collector.dump_fixtures()
+    collector.verify_fixture_files(PlainFileConsumer())
+    assert list(json.loads(read_fixture_file(fixture_path))) == ["test_a[fork_Paris]"]
@@ -0,0 +1,143 @@
+"""Test the sharded saving of pre-allocation groups."""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from ethereum_test_base_types import Account, Address, Hash
+from ethereum_test_forks import Prague
+from ethereum_test_types import Alloc, Environment
+
+from ..pre_alloc_groups import PreAllocGroup, PreAllocGroups, merge_pre_alloc_group_shards
+
+
+def pre_alloc_groups(test_id: str, pre: Alloc) -> PreAllocGroups:
+    """Return pre-allocation groups with a single group for a single test."""
+    return PreAllocGroups(
+        root={
+            "0x01": PreAllocGroup(
+                test_count=1,
+                test_ids=[test_id],
+                fork=Prague,
+                environment=Environment(),
+                pre=pre,
+            )
+        }
+    )
+
+
+def test_merge_pre_alloc_group_shards(tmp_path: Path):
+    """
+    Test that the shards of all workers are merged into a single file per group, and that only
+    accounts that differ once their defaults are filled in collide.
+    """
+    shards_folder = tmp_path / "pre_alloc" / "shards"
+    pre_alloc_groups(
+        "test_a", Alloc({0x100: Account(nonce=1), 0x200: Account(balance=1)})
+    ).to_shards(shards_folder, "gw0")
+    pre_alloc_groups(
+        "test_b", Alloc({0x100: Account(nonce=1, balance=0), 0x200: Account(balance=2, nonce=1)})
+    ).to_shards(shards_folder, "gw1")
+
+    collisions = merge_pre_alloc_group_shards(shards_folder, tmp_path / "pre_alloc")
+    assert collisions == {"0x01": [str(Address(0x200))]}
+
+    groups = PreAllocGroups.from_folder(tmp_path / "pre_alloc")
+    assert list(groups.keys()) == ["0x01"]
+    group = groups["0x01"]
+    assert group.test_ids == ["test_a", "test_b"]
+    assert group.test_count == 2
+    assert group.pre_account_count == len(group.pre.root)
+    assert group.pre[0x100] == Account(nonce=1)
+    assert group.pre[0x200] == Account(balance=2, nonce=1)
+    assert group.model_dump()["genesis"]["state_root"] == group.pre.state_root()
+
+
+@pytest.mark.parametrize(
+    "schedule",
+    [
+        {"gw0": ["test_a", "test_b", "test_c"]},
+        {"gw0": ["test_c"], "gw1": ["test_b", "test_a"]},
+        {"gw0": ["test_b"], "gw1": ["test_c"], "gw2": ["test_a"]},
+    ],
+)
+def test_merge_is_deterministic(tmp_path: Path, schedule: Dict[str, List[str]]):
+    """Test that the merged groups don't depend on which worker filled which test, and when."""
+    test_pres = {
+        "test_a": Alloc({0x100: Account(nonce=1), 0x200: Account(balance=1)}),
+        "test_b": Alloc({0x200: Account(balance=2), 0x300: Account(nonce=3)}),
+        "test_c": Alloc({0x300: Account(storage={1: 1}), 0x100: Account(nonce=1)}),
+    }
+    shards_folder = tmp_path / "pre_alloc" / "shards"
+    for worker_id, test_ids in schedule.items():
+        groups = PreAllocGroups(root={})
+        groups.stream_to_shards(shards_folder, worker_id)
+        for test_id in test_ids:
+            if "0x01" in groups:
+                groups["0x01"].test_ids.append(test_id)
+            else:
+                groups["0x01"] = pre_alloc_groups(test_id, Alloc())["0x01"]
+            groups.add_test_pre("0x01", test_id, test_pres[test_id])
+        groups.to_shards(shards_folder, worker_id)
+
+    collisions = merge_pre_alloc_group_shards(shards_folder, tmp_path / "pre_alloc")
+    assert collisions == {"0x01": [str(Address(0x200)), str(Address(0x300))]}
+    group_file = tmp_path / "pre_alloc" / "0x01.json"
+    group = PreAllocGroup.model_validate_json(group_file.read_text())
+    assert group.test_ids == ["test_a", "test_b", "test_c"]
+    test_addresses = [Address(0x100), Address(0x200), Address(0x300)]
+    assert [address for address in group.pre.root if address in test_addresses] == test_addresses
+    assert group.pre[0x200] == Account(balance=2)
+    assert group.pre[0x300] == Account(nonce=3, storage={1: 1})
+
+
+def test_lazy_load(tmp_path: Path):
+    """Test that groups are loaded on access, and unloaded beyond the cache size."""
+    folder = tmp_path / "pre_alloc"
+    for i in range(3):
+        group = pre_alloc_groups(f"test_{i}", Alloc({0x100 + i: Account(nonce=1)}))["0x01"]
+        group.to_file(folder / f"0x0{i}.json")
+    group_size = (folder / "0x00.json").stat().st_size
+
+    groups = PreAllocGroups.from_folder(folder, lazy_load=True, cache_size=2 * group_size)
+    assert groups.root == {}
+    assert len(groups) == 3
+    assert "0x02" in groups and "0x03" not in groups
+
+    assert groups["0x00"].test_ids == ["test_0"]
+    assert groups["0x01"].test_ids == ["test_1"]
+    assert groups["0x00"] is groups.root["0x00"]
+    assert groups["0x02"].test_ids == ["test_2"]
+    assert list(groups.root) == ["0x00", "0x02"]
+
+    eager_groups = PreAllocGroups.from_folder(folder)
+    assert {key: group.test_ids for key, group in groups.items()} == {
+        key: group.test_ids for key, group in eager_groups.items()
+    }
+
+
+def test_precomputed_state_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that the state root computed at the end of phase 1 is reused, and verified."""
+    shards_folder = tmp_path / "pre_alloc" / "shards"
+    pre = Alloc({0x100: Account(nonce=1, storage={1: 1})})
+    group = pre_alloc_groups("test_a", pre)["0x01"]
+    PreAllocGroups(root={"0x01": group}).to_shards(shards_folder, "gw0")
+    merge_pre_alloc_group_shards(shards_folder, tmp_path / "pre_alloc")
+    group_file = tmp_path / "pre_alloc" / "0x01.json"
+    group_json = json.loads(group_file.read_text())
+    state_root = group.pre.state_root()
+    assert group_json["stateRoot"] == str(state_root)
+    assert group_json["genesis"]["stateRoot"] == str(state_root)
+
+    group_json["stateRoot"] = "0x" + "11" * 32
+    group_file.write_text(json.dumps(group_json))
+    group = PreAllocGroup.model_validate_json(group_file.read_text())
+    assert group.genesis_state_root() == Hash(group_json["stateRoot"])
+    assert group.genesis.state_root == Hash(group_json["stateRoot"])
+    assert group.pre.state_root() == state_root, "the pre-allocation itself must not be affected"
+
+    monkeypatch.setattr(PreAllocGroup, "state_root_verification_rate", 1.0)
+    with pytest.raises(ValueError, match="doesn't match"):
+        PreAllocGroup.model_validate_json(group_file.read_text())
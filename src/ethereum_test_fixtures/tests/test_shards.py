@@ -0,0 +1,155 @@
+"""Test the append-only fixture shards and their merge into fixture files."""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple, Type
+
+import pytest
+
+from ..base import BaseFixture, FixtureFormat
+from ..collector import FixtureCollector
+from ..collector import TestInfo as CollectorTestInfo
+from ..consume import FixtureConsumer
+from ..file import Fixtures
+from ..shards import append_to_shard, merge_fixture_shards, write_fixture_file
+from ..transaction import FixtureResult, TransactionFixture
+
+
+def transaction_fixture(intrinsic_gas: int) -> TransactionFixture:
+    """Return a transaction fixture with its info filled."""
+    fixture = TransactionFixture(
+        transaction="0x1234",
+        result={"Paris": FixtureResult(intrinsic_gas=intrinsic_gas)},
+    )
+    fixture.fill_info(
+        "t8n-version",
+        "test_case_description\nwith a second line",
+        fixture_source_url="fixture_source_url",
+        ref_spec=None,
+        _info_metadata={},
+    )
+    return fixture
+
+
+@pytest.mark.parametrize(
+    "json_fixtures",
+    [
+        pytest.param({}, id="empty"),
+        pytest.param({"b": {"x": [1, {}, []], "y": "é"}, "a": {}}, id="nested"),
+    ],
+)
+def test_write_fixture_file(tmp_path: Path, json_fixtures: Dict):
+    """Test that fixtures written one at a time are identical to a single `json.dump`."""
+    expected_path = tmp_path / "expected.json"
+    with open(expected_path, "w") as f:
+        json.dump(json_fixtures, f, indent=4)
+    file_path = tmp_path / "fixtures.json"
+    write_fixture_file(file_path, iter(json_fixtures.items()))
+    assert file_path.read_bytes() == expected_path.read_bytes()
+
+
+def test_merge_fixture_shards(tmp_path: Path):
+    """Test that merging the shards of several workers is identical to a locked collection."""
+    worker_fixtures = [
+        {
+            Path("state_tests/module_a.json"): {
+                "test_a[fork_Paris]": transaction_fixture(1),
+                "test_c[fork_Paris]": transaction_fixture(3),
+            },
+            Path("state_tests/sub/module_b.json"): {"test_b[fork_Paris]": transaction_fixture(4)},
+        },
+        {
+            Path("state_tests/module_a.json"): {"test_b[fork_Paris]": transaction_fixture(2)},
+        },
+    ]
+
+    expected_dir = tmp_path / "expected"
+    output_dir = tmp_path / "output"
+    shards_folder = output_dir / ".meta" / "fixture_shards"
+    for worker, fixtures in enumerate(worker_fixtures):
+        for relative_path, path_fixtures in fixtures.items():
+            expected_path = expected_dir / relative_path
+            expected_path.parent.mkdir(parents=True, exist_ok=True)
+            Fixtures(root=path_fixtures).collect_into_file(expected_path)
+        append_to_shard(
+            shards_folder / f"gw{worker}.jsonl",
+            output_dir,
+            {
+                output_dir / relative_path: Fixtures(root=path_fixtures)
+                for relative_path, path_fixtures in fixtures.items()
+            },
+        )
+
+    assert merge_fixture_shards(shards_folder, output_dir) == 2
+    for expected_path in expected_dir.rglob("*.json"):
+        output_path = output_dir / expected_path.relative_to(expected_dir)
+        assert output_path.read_bytes() == expected_path.read_bytes()
+    assert list(json.loads((output_dir / "state_tests/module_a.json").read_text())) == [
+        "test_a[fork_Paris]",
+        "test_b[fork_Paris]",
+        "test_c[fork_Paris]",
+    ]
+
+
+class RecordingFixtureConsumer(FixtureConsumer):
+    """Fixture consumer that records the contents of the consumed fixture files."""
+
+    def __init__(self):
+        """Initialize the consumer."""
+        self.consumed: List[Tuple[Type[BaseFixture], Dict]] = []
+
+    def can_consume(self, fixture_format: FixtureFormat) -> bool:
+        """Consume any fixture format."""
+        return True
+
+    def consume_fixture(
+        self,
+        fixture_format: FixtureFormat,
+        fixture_path: Path,
+        fixture_name: str | None = None,
+        debug_output_path: Path | None = None,
+    ):
+        """Record the fixture file contents."""
+        self.consumed.append((fixture_format, json.loads(fixture_path.read_text())))
+
+
+def test_stream_fixtures(tmp_path: Path):
+    """Test that streamed fixtures are written to the shard when added, not kept in memory."""
+    output_dir = tmp_path / "output"
+    shards_folder = output_dir / ".meta" / "fixture_shards"
+    collector = FixtureCollector(
+        output_dir=output_dir,
+        flat_output=False,
+        fill_static_tests=False,
+        single_fixture_per_file=False,
+        filler_path=tmp_path / "tests",
+        shard_path=shards_folder / "master.jsonl",
+        stream_fixtures=True,
+    )
+    fixtures = {f"test_a[fork_Paris-x={x}]": transaction_fixture(x) for x in (2, 1)}
+    for name, fixture in fixtures.items():
+        fixture_path = collector.add_fixture(
+            CollectorTestInfo(
+                name=name,
+                id=name,
+                original_name="test_a",
+                module_path=tmp_path / "tests" / "paris" / "test_module.py",
+            ),
+            fixture,
+        )
+        assert (shards_folder / "master.jsonl").exists()
+    assert collector.all_fixtures == {}
+    assert [streamed.hash for streamed in collector.streamed_fixtures[fixture_path]] == [
+        fixture.hash for fixture in fixtures.values()
+    ]
+
+    consumer = RecordingFixtureConsumer()
+    collector.dump_fixtures()
+    collector.verify_fixture_files(consumer)
+    expected_json = {name: fixtures[name].json_dict_with_info() for name in sorted(fixtures)}
+    assert consumer.consumed == [(TransactionFixture, expected_json)] * 2
+
+    merge_fixture_shards(shards_folder, output_dir)
+    expected_path = tmp_path / "expected.json"
+    Fixtures(root=fixtures).collect_into_file(expected_path)
+    assert fixture_path.read_bytes() == expected_path.read_bytes()
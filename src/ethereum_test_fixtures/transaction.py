@@ -1,6 +1,6 @@
 """TransactionTest types."""
 
-from typing import ClassVar, Mapping
+from typing import Any, ClassVar, Dict, Mapping
 
 from pydantic import Field
 
@@ -34,3 +34,10 @@ class TransactionFixture(BaseFixture):
         forks = list(self.result.keys())
         assert len(forks) == 1, "Expected transaction test fixture with single fork"
         return forks[0]
+
+    @classmethod
+    def get_fork_name_from_json(cls, json_fixture: Dict[str, Any]) -> str | None:
+        """Return the name of the fixture's fork from its JSON representation."""
+        forks = list(json_fixture["result"].keys())
+        assert len(forks) == 1, "Expected transaction test fixture with single fork"
+        return forks[0]
@@ -5,14 +5,14 @@ from abc import abstractmethod
 from functools import reduce
 from os import path
 from pathlib import Path
-from typing import Callable, ClassVar, Dict, Generator, List, Sequence, Type
+from typing import Any, Callable, ClassVar, Dict, Generator, List, Sequence, Tuple, Type
 
 import pytest
 from pydantic import BaseModel, Field, PrivateAttr
 from typing_extensions import Self
 
 from ethereum_clis import Result, TransitionTool
-from ethereum_test_base_types import to_hex
+from ethereum_test_base_types import Hash, to_hex
 from ethereum_test_execution import BaseExecute, ExecuteFormat, LabeledExecuteFormat
 from ethereum_test_fixtures import (
     BaseFixture,
@@ -55,6 +55,16 @@ class BaseTest(BaseModel):
     tag: str = ""
 
     _request: pytest.FixtureRequest | None = PrivateAttr(None)
+    _built_block_memo: Dict[Tuple[str, int, str], Any] | None = PrivateAttr(None)
+    """
+    Memo of the blocks built by the transition tool, shared between the fixture formats
+    filled from the same test, keyed by (fork, block index, input hash).
+    """
+    _pre_state_root: Hash | None = PrivateAttr(None)
+    """
+    Precomputed state root of the pre-allocation, merged with the pre-allocation of the fork,
+    e.g. the state root stored with the pre-allocation group that the test is filled from.
+    """
 
     spec_types: ClassVar[Dict[str, Type["BaseTest"]]] = {}
 
@@ -101,6 +111,8 @@ class BaseTest(BaseModel):
             **kwargs,
         )
         new_instance._request = base_test._request
+        new_instance._built_block_memo = base_test._built_block_memo
+        new_instance._pre_state_root = base_test._pre_state_root
         return new_instance
 
     @classmethod
@@ -228,29 +240,23 @@ class BaseTest(BaseModel):
         pre_alloc_hash = self.compute_pre_alloc_group_hash(fork=fork)
 
         if pre_alloc_hash in pre_alloc_groups:
-            # Update existing group - just merge pre-allocations
+            # Update existing group - the pre-allocations of its tests are only merged once all
+            # of them are recorded, by `merge_pre_alloc_group_shards`
             group = pre_alloc_groups[pre_alloc_hash]
-            group.pre = Alloc.merge(
-                group.pre,
-                self.pre,
-                allow_key_collision=True,
-            )
             group.fork = fork
             group.test_ids.append(str(test_id))
             group.test_count = len(group.test_ids)
-            group.pre_account_count = len(group.pre.root)
-            pre_alloc_groups[pre_alloc_hash] = group
         else:
             # Create new group - use Environment instead of expensive genesis generation
             group = PreAllocGroup(
                 test_count=1,
-                pre_account_count=len(self.pre.root),
                 test_ids=[str(test_id)],
                 fork=fork,
                 environment=self.get_genesis_environment(fork),
-                pre=self.pre,
+                pre=Alloc(),
             )
             pre_alloc_groups[pre_alloc_hash] = group
+        pre_alloc_groups.add_test_pre(pre_alloc_hash, str(test_id), self.pre)
         return pre_alloc_groups
 
     def compute_pre_alloc_group_hash(self, fork: Fork) -> str:
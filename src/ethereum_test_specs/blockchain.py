@@ -1,5 +1,6 @@
 """Ethereum blockchain test spec definition and filler."""
 
+import hashlib
 import warnings
 from pprint import pprint
 from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Sequence, Tuple, Type
@@ -437,8 +438,14 @@ class BlockchainTest(BaseTest):
         genesis_environment: Environment,
         pre: Alloc,
         fork: Fork,
+        state_root: Hash | None = None,
     ) -> Tuple[Alloc, FixtureBlock]:
-        """Create a genesis block from the blockchain test definition."""
+        """
+        Create a genesis block from the blockchain test definition.
+
+        The state root of the genesis pre-allocation is computed, unless it's given in
+        `state_root`.
+        """
         env = genesis_environment.set_fork_requirements(fork)
         assert env.withdrawals is None or len(env.withdrawals) == 0, (
             "withdrawals must be empty at genesis"
@@ -453,7 +460,8 @@ class BlockchainTest(BaseTest):
         )
         if empty_accounts := pre_alloc.empty_accounts():
             raise Exception(f"Empty accounts in pre state: {empty_accounts}")
-        state_root = pre_alloc.state_root()
+        if state_root is None:
+            state_root = pre_alloc.state_root()
         genesis = FixtureHeader.genesis(fork, env, state_root)
 
         return (
@@ -464,6 +472,50 @@ class BlockchainTest(BaseTest):
             ).with_rlp(txs=[]),
         )
 
+    def get_built_block(
+        self,
+        *,
+        t8n: TransitionTool,
+        fork: Fork,
+        block: Block,
+        block_index: int,
+        genesis_hash: Hash,
+        previous_env: Environment,
+        previous_alloc: Alloc,
+    ) -> BuiltBlock:
+        """
+        Return the built block, reusing the result of another fixture format filled from the
+        same test if available.
+
+        All fixture formats of a test build the same chain of blocks on top of the same
+        genesis, so the block index, the genesis hash (which commits to the pre-allocation)
+        and the parent environment identify the transition tool inputs of a block. The memo
+        is bypassed when dumping debug output or collecting traces, as both are expected for
+        every fixture format. Each caller receives its own copy of the memoized block, so that
+        a fixture format modifying it does not affect the others.
+        """
+        if self._built_block_memo is None or self.t8n_dump_dir is not None or t8n.trace:
+            return self.generate_block_data(
+                t8n=t8n,
+                fork=fork,
+                block=block,
+                previous_env=previous_env,
+                previous_alloc=previous_alloc,
+            )
+        input_hash = hashlib.sha256(
+            bytes(genesis_hash) + previous_env.model_dump_json(exclude_none=True).encode()
+        ).hexdigest()
+        memo_key = (fork.name(), block_index, input_hash)
+        if memo_key not in self._built_block_memo:
+            self._built_block_memo[memo_key] = self.generate_block_data(
+                t8n=t8n,
+                fork=fork,
+                block=block,
+                previous_env=previous_env,
+                previous_alloc=previous_alloc,
+            )
+        return self._built_block_memo[memo_key].model_copy(deep=True)
+
     def generate_block_data(
         self,
         t8n: TransitionTool,
@@ -635,20 +687,24 @@ class BlockchainTest(BaseTest):
         """Create a fixture from the blockchain test definition."""
         fixture_blocks: List[FixtureBlock | InvalidFixtureBlock] = []
 
-        pre, genesis = BlockchainTest.make_genesis(self.genesis_environment, self.pre, fork)
+        pre, genesis = BlockchainTest.make_genesis(
+            self.genesis_environment, self.pre, fork, self._pre_state_root
+        )
 
         alloc = pre
         env = environment_from_parent_header(genesis.header)
         head = genesis.header.block_hash
         invalid_blocks = 0
-        for block in self.blocks:
+        for block_index, block in enumerate(self.blocks):
             # This is the most common case, the RLP needs to be constructed
             # based on the transactions to be included in the block.
             # Set the environment according to the block to execute.
-            built_block = self.generate_block_data(
+            built_block = self.get_built_block(
                 t8n=t8n,
                 fork=fork,
                 block=block,
+                block_index=block_index,
+                genesis_hash=genesis.header.block_hash,
                 previous_env=env,
                 previous_alloc=alloc,
             )
@@ -692,16 +748,20 @@ class BlockchainTest(BaseTest):
         """Create a hive fixture from the blocktest definition."""
         fixture_payloads: List[FixtureEngineNewPayload] = []
 
-        pre, genesis = BlockchainTest.make_genesis(self.genesis_environment, self.pre, fork)
+        pre, genesis = BlockchainTest.make_genesis(
+            self.genesis_environment, self.pre, fork, self._pre_state_root
+        )
         alloc = pre
         env = environment_from_parent_header(genesis.header)
         head_hash = genesis.header.block_hash
         invalid_blocks = 0
-        for block in self.blocks:
-            built_block = self.generate_block_data(
+        for block_index, block in enumerate(self.blocks):
+            built_block = self.get_built_block(
                 t8n=t8n,
                 fork=fork,
                 block=block,
+                block_index=block_index,
+                genesis_hash=genesis.header.block_hash,
                 previous_env=env,
                 previous_alloc=alloc,
             )
@@ -738,10 +798,12 @@ class BlockchainTest(BaseTest):
             # Most clients require the header to start the sync process, so we create an empty
             # block on top of the last block of the test to send it as new payload and trigger the
             # sync process.
-            sync_built_block = self.generate_block_data(
+            sync_built_block = self.get_built_block(
                 t8n=t8n,
                 fork=fork,
                 block=Block(),
+                block_index=len(self.blocks),
+                genesis_hash=genesis.header.block_hash,
                 previous_env=env,
                 previous_alloc=alloc,
             )
@@ -1,11 +1,21 @@
 """Test spec debugging tools."""
 
 import pprint
-from typing import Dict, List
+from typing import Any, Dict, Iterable
 
+from ethereum_clis import TraceStore
 
-def print_traces(traces: List[List[List[Dict]]] | None):
-    """Print the traces from the transition tool for debugging."""
+TRACE_SUMMARY_TOP_OPCODES = 10
+"""Number of opcodes listed in the summary of each transaction trace."""
+
+
+def print_traces(traces: TraceStore | None):
+    """
+    Print the traces from the transition tool for debugging.
+
+    For each transaction, a summary of the executed opcodes is printed, followed by the last
+    `traces.print_steps` execution steps, or all of them if `print_steps` is None.
+    """
     if traces is None:
         print("Traces not collected. Use `--traces` to see detailed execution information.")
         return
@@ -14,8 +24,20 @@ def print_traces(traces: List[List[List[Dict]]] | None):
     for block_number, block in enumerate(traces):
         print(f"Block {block_number}:")
         for tx_number, tx in enumerate(block):
-            print(f"Transaction {tx_number}:")
-            for exec_step, trace in enumerate(tx):
+            summary = tx.summary()
+            print(f"Transaction {tx_number}: {summary.step_count} steps")
+            for opcode, count in summary.opcode_counts.most_common(TRACE_SUMMARY_TOP_OPCODES):
+                print(f"  {opcode:<16} count: {count:<10} gas: {summary.opcode_gas[opcode]}")
+            steps: Iterable[Dict[str, Any]]
+            if traces.print_steps is None:
+                first_step = 0
+                steps = tx.steps()
+            else:
+                steps = tx.last_steps(traces.print_steps)
+                first_step = summary.step_count - len(steps)
+                if first_step > 0:
+                    print(f"Showing the last {len(steps)} steps:")
+            for exec_step, trace in enumerate(steps, start=first_step):
                 print(f"Step {exec_step}:")
                 pp.pprint(trace)
                 print()
@@ -0,0 +1,88 @@
+"""Test the reuse of built blocks between the fixture formats of a test."""
+
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from ethereum_test_base_types import Account, Hash
+from ethereum_test_forks import Cancun, Prague
+from ethereum_test_types import Alloc, Environment
+
+from ..blockchain import Block, BlockchainTest
+
+
+class StubTransitionTool:
+    """Minimal stand-in for a transition tool, only used to check the tracing flag."""
+
+    trace = False
+
+
+@pytest.fixture
+def generated_blocks(monkeypatch: pytest.MonkeyPatch) -> List[Any]:
+    """Record the calls to the transition tool block generation and return a stand-in block."""
+    calls: List[Any] = []
+
+    def generate_block_data(self, **kwargs):
+        calls.append(kwargs)
+        return Alloc({0x100: Account(nonce=len(calls))})
+
+    monkeypatch.setattr(BlockchainTest, "generate_block_data", generate_block_data)
+    return calls
+
+
+def get_built_block(test: BlockchainTest, **overrides) -> Any:
+    """Call `get_built_block` with default arguments."""
+    kwargs: dict = {
+        "t8n": StubTransitionTool(),
+        "fork": Cancun,
+        "block": Block(),
+        "block_index": 0,
+        "genesis_hash": Hash(1),
+        "previous_env": Environment(),
+        "previous_alloc": Alloc(),
+    }
+    kwargs.update(overrides)
+    return test.get_built_block(**kwargs)
+
+
+def test_built_block_is_reused(generated_blocks: List[Any]):
+    """Test that blocks with the same fork, index and inputs are only built once."""
+    memo: dict = {}
+    first_format = BlockchainTest(pre=Alloc(), post=Alloc(), blocks=[Block()])
+    first_format._built_block_memo = memo
+    second_format = BlockchainTest(pre=Alloc(), post=Alloc(), blocks=[Block()])
+    second_format._built_block_memo = memo
+
+    built_block = get_built_block(first_format)
+    assert get_built_block(second_format) == built_block
+    assert len(generated_blocks) == 1
+
+    # Modifying the block served to a format must not affect the others.
+    built_block[0x100].nonce = 2
+    reused_block = get_built_block(second_format)
+    assert reused_block is not built_block
+    assert reused_block[0x100].nonce == 1
+
+    get_built_block(second_format, block_index=1)
+    get_built_block(second_format, fork=Prague)
+    get_built_block(second_format, genesis_hash=Hash(2))
+    get_built_block(second_format, previous_env=Environment(number=100))
+    assert len(generated_blocks) == 5
+
+
+@pytest.mark.parametrize("memo_disabled_by", ["no_memo", "dump_dir", "traces"])
+def test_built_block_memo_bypassed(generated_blocks: List[Any], memo_disabled_by: str):
+    """Test that the memo is not used without a memo, when dumping or when tracing."""
+    test = BlockchainTest(pre=Alloc(), post=Alloc(), blocks=[Block()])
+    t8n = StubTransitionTool()
+    if memo_disabled_by != "no_memo":
+        test._built_block_memo = {}
+    if memo_disabled_by == "dump_dir":
+        test.t8n_dump_dir = Path("dump")
+    if memo_disabled_by == "traces":
+        t8n.trace = True
+
+    get_built_block(test, t8n=t8n)
+    get_built_block(test, t8n=t8n)
+    assert len(generated_blocks) == 2
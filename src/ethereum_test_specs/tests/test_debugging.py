@@ -0,0 +1,30 @@
+"""Test the test spec debugging tools."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ethereum_clis import TraceStore
+
+from ..debugging import print_traces
+
+
+@pytest.mark.parametrize("print_steps", [2, None])
+def test_print_traces(tmp_path: Path, capsys, print_steps: int | None):
+    """Test that only the requested steps are printed after the opcode summary."""
+    trace_file = tmp_path / "trace-0-0x00.jsonl"
+    with open(trace_file, "w") as f:
+        for pc in range(5):
+            f.write(json.dumps({"pc": pc, "opName": "JUMPDEST", "gasCost": "0x1"}) + "\n")
+        f.write(json.dumps({"output": "", "gasUsed": "0x5"}) + "\n")
+    store = TraceStore(print_steps=print_steps)
+    store.add_block([trace_file])
+
+    print_traces(store)
+    printed = capsys.readouterr().out
+    assert "Transaction 0: 5 steps" in printed
+    assert "JUMPDEST         count: 5          gas: 5" in printed
+    assert ("Step 2:" in printed) == (print_steps is None)
+    assert "Step 3:" in printed and "Step 4:" in printed
+    store.cleanup()
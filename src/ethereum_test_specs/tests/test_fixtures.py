@@ -2,6 +2,7 @@
 
 import json
 import os
+from pathlib import Path
 from typing import Any, List, Mapping
 
 import pytest
@@ -16,6 +17,7 @@ from ethereum_test_fixtures import (
     BlockchainFixture,
     BlockchainFixtureCommon,
     FixtureFormat,
+    PreAllocGroups,
     StateFixture,
 )
 from ethereum_test_forks import Berlin, Cancun, Fork, Istanbul, London, Paris, Shanghai
@@ -908,3 +910,28 @@ def test_fill_blockchain_invalid_txs(
     assert fixture_name in fixture
     assert fixture_name in expected
     assert fixture[fixture_name] == expected[fixture_name]
+
+
+def test_update_pre_alloc_groups(tmp_path: Path):
+    """Test that phase 1 appends the pre-allocation of each test to the shards of the worker."""
+    pre_alloc_groups = PreAllocGroups(root={})
+    pre_alloc_groups.stream_to_shards(tmp_path, "gw0")
+    test_pres = {
+        "test_a": Alloc({0x100: Account(nonce=1)}),
+        "test_b": Alloc({0x200: Account(balance=1)}),
+    }
+    for test_id, pre in test_pres.items():
+        BlockchainTest(pre=pre, post={}, blocks=[]).update_pre_alloc_groups(
+            pre_alloc_groups, Cancun, test_id
+        )
+
+    assert len(pre_alloc_groups) == 1
+    key, group = next(iter(pre_alloc_groups.items()))
+    assert group.test_ids == ["test_a", "test_b"]
+    assert group.test_count == 2
+    assert 0x100 not in group.pre and 0x200 not in group.pre
+    lines = (tmp_path / key / "gw0.jsonl").read_text().splitlines()
+    assert [
+        (json.loads(test_id), Alloc.model_validate_json(pre))
+        for test_id, pre in (line.split("\t") for line in lines)
+    ] == list(test_pres.items())
@@ -1,9 +1,13 @@
 """Account-related types for Ethereum tests."""
 
+import hashlib
+import json
 from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Optional, Tuple
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Tuple
 
 from coincurve.keys import PrivateKey
+from Crypto.Hash import keccak
+from ethereum_rlp import rlp
 from ethereum_types.bytes import Bytes20
 from ethereum_types.numeric import U256, Bytes32, Uint
 from pydantic import PrivateAttr
@@ -25,7 +29,16 @@ from ethereum_test_base_types.conversions import (
 )
 from ethereum_test_vm import EVMCodeType
 
-from .trie import EMPTY_TRIE_ROOT, FrontierAccount, Trie, root, trie_get, trie_set
+from .trie import (
+    EMPTY_TRIE_ROOT,
+    FrontierAccount,
+    Trie,
+    bulk_root,
+    rlp_encode_bytes,
+    root,
+    trie_get,
+    trie_set,
+)
 from .utils import keccak256
 
 FrontierAddress = Bytes20
@@ -137,6 +150,10 @@ class Alloc(BaseAlloc):
 
     _eoa_fund_amount_default: int = PrivateAttr(10**21)
 
+    # Name of the backend of `STATE_ROOT_BACKENDS` that computes state roots. Other libraries may
+    # override it, e.g. to compute state roots through the spec trie.
+    state_root_backend: ClassVar[str] = "bulk"
+
     @dataclass(kw_only=True)
     class UnexpectedAccountError(Exception):
         """Unexpected account found in the allocation."""
@@ -232,30 +249,17 @@ class Alloc(BaseAlloc):
         """Return list of addresses of empty accounts."""
         return [address for address, account in self.root.items() if not account]
 
+    def content_hash(self) -> Hash:
+        """Return a hash of the accounts of the allocation, independent of their order."""
+        content = json.dumps(self.model_dump(mode="json"), sort_keys=True)
+        return Hash(hashlib.sha256(content.encode()).digest())
+
     def state_root(self) -> Hash:
-        """Return state root of the allocation."""
-        state = State()
-        for address, account in self.root.items():
-            if account is None:
-                continue
-            set_account(
-                state=state,
-                address=FrontierAddress(address),
-                account=FrontierAccount(
-                    nonce=Uint(account.nonce) if account.nonce is not None else Uint(0),
-                    balance=(U256(account.balance) if account.balance is not None else U256(0)),
-                    code=account.code if account.code is not None else b"",
-                ),
-            )
-            if account.storage is not None:
-                for key, value in account.storage.root.items():
-                    set_storage(
-                        state=state,
-                        address=FrontierAddress(address),
-                        key=Bytes32(Hash(key)),
-                        value=U256(value),
-                    )
-        return Hash(state_root(state))
+        """
+        Return state root of the allocation, computed by the backend named by
+        `Alloc.state_root_backend`.
+        """
+        return STATE_ROOT_BACKENDS[self.state_root_backend](self)
 
     def verify_post_alloc(self, got_alloc: "Alloc"):
         """
@@ -319,3 +323,69 @@ class Alloc(BaseAlloc):
         The account is not a precompile or a system contract.
         """
         raise NotImplementedError("empty_account is not implemented in the base class")
+
+
+def spec_state_root(alloc: Alloc) -> Hash:
+    """Return the state root of an allocation, computed through the spec state and trie."""
+    state = State()
+    for address, account in alloc.root.items():
+        if account is None:
+            continue
+        set_account(
+            state=state,
+            address=FrontierAddress(address),
+            account=FrontierAccount(
+                nonce=Uint(account.nonce) if account.nonce is not None else Uint(0),
+                balance=(U256(account.balance) if account.balance is not None else U256(0)),
+                code=account.code if account.code is not None else b"",
+            ),
+        )
+        if account.storage is not None:
+            for key, value in account.storage.root.items():
+                set_storage(
+                    state=state,
+                    address=FrontierAddress(address),
+                    key=Bytes32(Hash(key)),
+                    value=U256(value),
+                )
+    return Hash(state_root(state))
+
+
+def bulk_state_root(alloc: Alloc) -> Hash:
+    """
+    Return the state root of an allocation, computed by encoding the accounts and storage slots
+    directly and building each trie with `bulk_root`, hashing the code shared by several
+    accounts once.
+    """
+    code_hashes: Dict[bytes, bytes] = {}
+    encoded_accounts: Dict[bytes, bytes] = {}
+    for address, account in alloc.root.items():
+        if account is None:
+            continue
+        encoded_storage: Dict[bytes, bytes] = {}
+        if account.storage is not None:
+            for key, value in account.storage.root.items():
+                if value:
+                    key_hash = keccak.new(data=int(key).to_bytes(32, "big"), digest_bits=256)
+                    encoded_storage[key_hash.digest()] = rlp_encode_bytes(
+                        int(value).to_bytes((int(value).bit_length() + 7) // 8, "big")
+                    )
+        code = bytes(account.code) if account.code is not None else b""
+        if code not in code_hashes:
+            code_hashes[code] = keccak.new(data=code, digest_bits=256).digest()
+        address_hash = keccak.new(data=address, digest_bits=256).digest()
+        encoded_accounts[address_hash] = rlp.encode(
+            (
+                Uint(account.nonce) if account.nonce is not None else Uint(0),
+                U256(account.balance) if account.balance is not None else U256(0),
+                bulk_root(encoded_storage),
+                code_hashes[code],
+            )
+        )
+    return Hash(bulk_root(encoded_accounts))
+
+
+STATE_ROOT_BACKENDS: Dict[str, Callable[[Alloc], Hash]] = {
+    "spec": spec_state_root,
+    "bulk": bulk_state_root,
+}
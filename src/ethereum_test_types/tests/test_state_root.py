@@ -0,0 +1,47 @@
+"""Test the state root backends of `Alloc` against the spec trie."""
+
+import random
+
+import pytest
+
+from ethereum_test_base_types import Account, Hash
+from ethereum_test_types import Alloc
+from ethereum_test_types.account_types import bulk_state_root, spec_state_root
+from ethereum_test_types.trie import EMPTY_TRIE_ROOT
+
+
+def random_alloc(seed: int, account_count: int) -> Alloc:
+    """Return an allocation of random accounts, with edge values of each field."""
+    rng = random.Random(seed)
+    return Alloc(
+        {
+            rng.getrandbits(160): Account(
+                nonce=rng.choice([0, 1, 2**64 - 1]),
+                balance=rng.choice([0, 1, 10**30, 2**256 - 1]),
+                code=rng.randbytes(rng.choice([0, 1, 31, 32, 100])),
+                storage={
+                    rng.choice([0, 1, rng.getrandbits(256)]): rng.choice([0, 1, 2**256 - 1])
+                    for _ in range(rng.choice([0, 1, 2, 17, 300]))
+                },
+            )
+            for _ in range(account_count)
+        }
+    )
+
+
+@pytest.mark.parametrize("account_count", [0, 1, 2, 3, 16, 17, 200])
+@pytest.mark.parametrize("seed", range(3))
+def test_bulk_state_root(seed: int, account_count: int):
+    """Test that the bulk backend computes the same state roots as the spec trie."""
+    alloc = random_alloc(seed, account_count)
+    assert bulk_state_root(alloc) == spec_state_root(alloc)
+
+
+def test_state_root_backend(monkeypatch: pytest.MonkeyPatch):
+    """Test that the state root is computed by the selected backend."""
+    alloc = Alloc({0x100: Account(nonce=1, storage={1: 1}), 0x200: Account(balance=1)})
+    assert Alloc.state_root_backend == "bulk"
+    assert Alloc().state_root() == Hash(EMPTY_TRIE_ROOT)
+    state_root = alloc.state_root()
+    monkeypatch.setattr(Alloc, "state_root_backend", "spec")
+    assert alloc.state_root() == state_root
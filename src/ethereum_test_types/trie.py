@@ -1,6 +1,7 @@
 """The state trie is the structure responsible for storing."""
 
 import copy
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from typing import (
     Callable,
@@ -383,3 +384,96 @@ def patricialize(obj: Mapping[Bytes, Bytes], level: Uint) -> Optional[InternalNo
         cast(BranchSubnodes, assert_type(subnodes, Tuple[Extended, ...])),
         value,
     )
+
+
+def rlp_encode_bytes(data: bytes) -> bytes:
+    """RLP-encode a byte string."""
+    if len(data) == 1 and data[0] < 0x80:
+        return data
+    if len(data) < 56:
+        return bytes([0x80 + len(data)]) + data
+    length = len(data).to_bytes((len(data).bit_length() + 7) // 8, "big")
+    return bytes([0xB7 + len(length)]) + length + data
+
+
+def _rlp_encode_list(payload: bytes) -> bytes:
+    """RLP-encode a list, given the concatenated RLP encodings of its items."""
+    if len(payload) < 56:
+        return bytes([0xC0 + len(payload)]) + payload
+    length = len(payload).to_bytes((len(payload).bit_length() + 7) // 8, "big")
+    return bytes([0xF7 + len(length)]) + length + payload
+
+
+def _compact_path(path: str, is_leaf: bool) -> bytes:
+    """Encode a hex string of nibbles like `nibble_list_to_compact`, as an RLP string."""
+    flag = 2 * is_leaf
+    if len(path) % 2:
+        return rlp_encode_bytes(
+            bytes([16 * (flag + 1) + int(path[0], 16)]) + bytes.fromhex(path[1:])
+        )
+    return rlp_encode_bytes(bytes([16 * flag]) + bytes.fromhex(path))
+
+
+def _node_reference(encoded_node: bytes) -> bytes:
+    """Return the RLP encoding of the reference to a node from its parent."""
+    if len(encoded_node) < 32:
+        return encoded_node
+    return b"\xa0" + keccak.new(data=encoded_node, digest_bits=256).digest()
+
+
+def bulk_root(items: Mapping[bytes, bytes]) -> Bytes32:
+    """
+    Compute the root of a secured trie in one pass, from the hashes of its keys mapped to the
+    encodings of its values, as `root` does for a trie with the same items.
+
+    The keys are sorted so that the keys below each node are a contiguous range, and the nodes
+    are built bottom-up with an explicit stack instead of recursion, RLP-encoding and hashing
+    each node once, directly from bytes.
+    """
+    if not items:
+        return EMPTY_TRIE_ROOT
+    paths = sorted(key.hex() for key in items)
+    assert len({len(path) for path in paths}) == 1, "keys of a secured trie must be hashes"
+    values = [rlp_encode_bytes(items[bytes.fromhex(path)]) for path in paths]
+
+    # Each task either builds the node of a range of keys at a level, or assembles an extension
+    # (with its key segment) or branch node (with the nibbles of its subnodes) from the
+    # encodings of its subnodes, built by the tasks pushed after it.
+    tasks: List[Tuple[str, int, int, int, str]] = [("node", 0, len(paths), 0, "")]
+    encoded_nodes: List[bytes] = []
+    while tasks:
+        task, start, end, level, nibbles = tasks.pop()
+        if task == "extension":
+            subnode = _node_reference(encoded_nodes.pop())
+            encoded_nodes.append(_rlp_encode_list(_compact_path(nibbles, False) + subnode))
+        elif task == "branch":
+            subnodes = dict(zip(nibbles, encoded_nodes[-len(nibbles) :], strict=True))
+            del encoded_nodes[-len(nibbles) :]
+            payload = b"".join(
+                _node_reference(subnodes[nibble]) if nibble in subnodes else b"\x80"
+                for nibble in "0123456789abcdef"
+            )
+            encoded_nodes.append(_rlp_encode_list(payload + b"\x80"))
+        elif end - start == 1:
+            leaf_path = _compact_path(paths[start][level:], True)
+            encoded_nodes.append(_rlp_encode_list(leaf_path + values[start]))
+        else:
+            first_path = paths[start]
+            prefix_length = common_prefix_length(first_path[level:], paths[end - 1][level:])
+            if prefix_length > 0:
+                key_segment = first_path[level : level + prefix_length]
+                tasks.append(("extension", start, end, level, key_segment))
+                tasks.append(("node", start, end, level + prefix_length, ""))
+                continue
+            subnode_tasks = []
+            subnode_start = start
+            while subnode_start < end:
+                nibble = paths[subnode_start][level]
+                subnode_end = bisect_left(
+                    paths, first_path[:level] + nibble + "g", subnode_start, end
+                )
+                subnode_tasks.append(("node", subnode_start, subnode_end, level + 1, nibble))
+                subnode_start = subnode_end
+            tasks.append(("branch", start, end, level, "".join(t[4] for t in subnode_tasks)))
+            tasks.extend(reversed(subnode_tasks))
+    return Bytes32(keccak.new(data=encoded_nodes[0], digest_bits=256).digest())
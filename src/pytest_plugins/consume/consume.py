@@ -3,10 +3,11 @@
 import re
 import sys
 import tarfile
+from collections import Counter
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import platformdirs
@@ -16,7 +17,8 @@ import rich
 
 from cli.gen_index import generate_fixtures_index
 from ethereum_test_fixtures import BaseFixture
-from ethereum_test_fixtures.consume import IndexFile, TestCases
+from ethereum_test_fixtures.compression import iter_fixture_files
+from ethereum_test_fixtures.consume import IndexFile, TestCaseIndexFile, TestCases
 from ethereum_test_forks import get_forks, get_relative_fork_markers, get_transition_forks
 from ethereum_test_tools.utility.versioning import get_current_commit_hash_or_tag
 
@@ -186,7 +188,7 @@ class FixturesSource:
         """Validate that a local fixture path exists and contains JSON files."""
         if not path.exists():
             pytest.exit(f"Specified fixture directory '{path}' does not exist.")
-        if not any(path.glob("**/*.json")):
+        if not any(iter_fixture_files(path)):
             pytest.exit(f"Specified fixture directory '{path}' does not contain any JSON files.")
         return FixturesSource(input_option=str(path), path=path)
 
@@ -419,6 +421,12 @@ def fixtures_source(request) -> FixturesSource:  # noqa: D103
     return request.config.fixtures_source
 
 
+@pytest.fixture(scope="session")
+def partially_selected_fixture_files(request) -> Set[Path]:
+    """Return the fixture files of which only some of the test cases were selected."""
+    return request.config.partially_selected_fixture_files
+
+
 def pytest_generate_tests(metafunc):
     """
     Generate test cases for every test fixture in all the JSON fixture files
@@ -448,6 +456,30 @@ def pytest_generate_tests(metafunc):
         metafunc.parametrize("client_type", metafunc.config.hive_execution_clients, ids=client_ids)
 
 
+def pytest_collection_finish(session: pytest.Session):
+    """
+    Record the fixture files of which only some of the test cases were selected (e.g. by `-k`,
+    `--regex` or `--sim.limit`), so that only the selected fixtures are loaded from them.
+    """
+    config = session.config
+    config.partially_selected_fixture_files = set()  # type: ignore[attr-defined]
+    test_cases = getattr(config, "test_cases", None)
+    if test_cases is None or config.fixtures_source.is_stdin:  # type: ignore[attr-defined]
+        return
+    selected_ids: Dict[Path, Set[str]] = {}
+    for item in session.items:
+        callspec = getattr(item, "callspec", None)
+        test_case = callspec.params.get("test_case") if callspec is not None else None
+        if isinstance(test_case, TestCaseIndexFile):
+            selected_ids.setdefault(test_case.json_path, set()).add(test_case.id)
+    test_case_counts = Counter(test_case.json_path for test_case in test_cases)
+    config.partially_selected_fixture_files = {  # type: ignore[attr-defined]
+        json_path
+        for json_path, ids in selected_ids.items()
+        if len(ids) < test_case_counts[json_path]
+    }
+
+
 def pytest_collection_modifyitems(items):
     """Modify collected item names to remove the test runner function from the name."""
     for item in items:
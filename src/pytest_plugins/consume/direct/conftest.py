@@ -9,6 +9,7 @@ import json
 import tempfile
 import warnings
 from pathlib import Path
+from typing import Set
 
 import pytest
 
@@ -16,8 +17,9 @@ from ethereum_clis.ethereum_cli import EthereumCLI
 from ethereum_clis.fixture_consumer_tool import FixtureConsumerTool
 from ethereum_test_base_types import to_json
 from ethereum_test_fixtures import BaseFixture, BlockchainFixture, EOFFixture, StateFixture
+from ethereum_test_fixtures.compression import decompress_fixture_file, is_compressed_fixture_file
 from ethereum_test_fixtures.consume import TestCaseIndexFile, TestCaseStream
-from ethereum_test_fixtures.file import Fixtures
+from ethereum_test_fixtures.file import Fixtures, read_fixture_bytes
 from pytest_plugins.consume.consume import FixturesSource
 
 
@@ -115,12 +117,30 @@ def test_dump_dir(request, fixture_path: Path, fixture_name: str) -> Path | None
     return base_dump_dir / fixture_path.stem / fixture_name.replace("/", "-")
 
 
+@pytest.fixture(scope="session")
+def decompressed_fixtures_dir():
+    """Temporary directory containing plain copies of the compressed fixture files consumed."""
+    with tempfile.TemporaryDirectory(prefix="decompressed-fixtures-") as temp_dir:
+        yield Path(temp_dir)
+
+
 @pytest.fixture
-def fixture_path(test_case: TestCaseIndexFile | TestCaseStream, fixtures_source: FixturesSource):
+def fixture_path(
+    test_case: TestCaseIndexFile | TestCaseStream,
+    fixtures_source: FixturesSource,
+    decompressed_fixtures_dir: Path,
+    partially_selected_fixture_files: Set[Path],
+):
     """
     Path to the current JSON fixture file.
 
-    If the fixture source is stdin, the fixture is written to a temporary json file.
+    If the fixture source is stdin, the fixture is written to a temporary json file. If the
+    fixture file is compressed, it is decompressed once to a temporary json file, since fixture
+    consumers only read plain json files. If only some of the tests of the file are selected and
+    the index file records the location of the fixture in its file, the fixture alone is copied
+    to a temporary file of the same name, so that the fixture consumer doesn't parse the whole
+    file to run a single test. Otherwise, the fixture file itself is passed to the consumer, which
+    can then reuse its result for all the tests of the file.
     """
     if fixtures_source.is_stdin:
         assert isinstance(test_case, TestCaseStream)
@@ -133,7 +153,29 @@ def fixture_path(test_case: TestCaseIndexFile | TestCaseStream, fixtures_source:
         temp_dir.cleanup()
     else:
         assert isinstance(test_case, TestCaseIndexFile)
-        yield fixtures_source.path / test_case.json_path
+        fixture_path = fixtures_source.path / test_case.json_path
+        if is_compressed_fixture_file(fixture_path):
+            decompressed_path = decompressed_fixtures_dir / test_case.json_path.with_suffix("")
+            if not decompressed_path.exists():
+                decompress_fixture_file(fixture_path, decompressed_path)
+            fixture_path = decompressed_path
+        elif (
+            test_case.json_path in partially_selected_fixture_files
+            and test_case.byte_offset is not None
+            and test_case.byte_length is not None
+        ):
+            temp_dir = tempfile.TemporaryDirectory()
+            single_fixture_path = Path(temp_dir.name) / fixture_path.name
+            with open(single_fixture_path, "wb") as f:
+                f.write(b"{" + json.dumps(test_case.id).encode() + b": ")
+                f.write(
+                    read_fixture_bytes(fixture_path, test_case.byte_offset, test_case.byte_length)
+                )
+                f.write(b"}")
+            yield single_fixture_path
+            temp_dir.cleanup()
+            return
+        yield fixture_path
 
 
 @pytest.fixture(scope="function")
@@ -1,7 +1,7 @@
 """Common pytest fixtures for the Hive simulators."""
 
 from pathlib import Path
-from typing import Dict, Literal
+from typing import Dict, Literal, Set
 
 import pytest
 from hive.client import Client
@@ -9,8 +9,9 @@ from hive.client import Client
 from ethereum_test_fixtures import (
     BaseFixture,
 )
+from ethereum_test_fixtures.binary import has_binary_fixture_file, load_fixtures
 from ethereum_test_fixtures.consume import TestCaseIndexFile, TestCaseStream
-from ethereum_test_fixtures.file import Fixtures
+from ethereum_test_fixtures.file import Fixtures, read_fixture_bytes
 from ethereum_test_rpc import EthRPC
 from pytest_plugins.consume.consume import FixturesSource
 
@@ -47,7 +48,7 @@ class FixturesDict(Dict[Path, Fixtures]):
         """Return the fixtures from the index file, if not found, load from disk."""
         assert key.is_file(), f"Expected a file path, got '{key}'"
         if key not in self._fixtures:
-            self._fixtures[key] = Fixtures.model_validate_json(key.read_text())
+            self._fixtures[key] = load_fixtures(key)
         return self._fixtures[key]
 
 
@@ -61,6 +62,7 @@ def fixture_file_loader() -> Dict[Path, Fixtures]:
 def fixture(
     fixtures_source: FixturesSource,
     fixture_file_loader: Dict[Path, Fixtures],
+    partially_selected_fixture_files: Set[Path],
     test_case: TestCaseIndexFile | TestCaseStream,
 ) -> BaseFixture:
     """
@@ -69,7 +71,11 @@ def fixture(
 
     The fixture is either already available within the test case (if consume
     is taking input on stdin) or loaded from the fixture json file if taking
-    input from disk (fixture directory with index file).
+    input from disk (fixture directory with index file). If the index file
+    records the location of the fixture in its file, and either only some of
+    the tests of the file are selected or the file has no binary encoding,
+    only the fixture itself is read and parsed. Otherwise, the whole file is
+    loaded once and shared by all of its tests.
     """
     fixture: BaseFixture
     if fixtures_source.is_stdin:
@@ -78,8 +84,22 @@ def fixture(
     else:
         assert isinstance(test_case, TestCaseIndexFile), "Expected an index file test case"
         fixtures_file_path = fixtures_source.path / test_case.json_path
-        fixtures: Fixtures = fixture_file_loader[fixtures_file_path]
-        fixture = fixtures[test_case.id]
+        if (
+            test_case.byte_offset is not None
+            and test_case.byte_length is not None
+            and (
+                test_case.json_path in partially_selected_fixture_files
+                or not has_binary_fixture_file(fixtures_file_path)
+            )
+        ):
+            fixture = test_case.format.model_validate_json(
+                read_fixture_bytes(
+                    fixtures_file_path, test_case.byte_offset, test_case.byte_length
+                )
+            )
+        else:
+            fixtures: Fixtures = fixture_file_loader[fixtures_file_path]
+            fixture = fixtures[test_case.id]
     assert isinstance(fixture, test_case.format), (
         f"Expected a {test_case.format.format_name} test fixture"
     )
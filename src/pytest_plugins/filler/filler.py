@@ -6,13 +6,16 @@ and that modifies pytest hooks in order to fill test specs for all tests and
 writes the generated fixtures to file.
 """
 
+import argparse
 import configparser
 import datetime
 import os
+import shutil
 import warnings
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Type
+from typing import Any, Dict, Generator, List, Tuple, Type
 
 import pytest
 import xdist
@@ -20,9 +23,18 @@ from _pytest.compat import NotSetType
 from _pytest.terminal import TerminalReporter
 from pytest_metadata.plugin import metadata_key  # type: ignore
 
-from cli.gen_index import generate_fixtures_index
-from ethereum_clis import TransitionTool
+from cli.gen_index import INDEX_EXCLUDED_PATH_PARTS, generate_fixtures_index
+from ethereum_clis import (
+    ReplayTransitionTool,
+    TransitionTool,
+    TransitionToolArchive,
+    TransitionToolCache,
+    TransitionToolDaemonPool,
+    TransitionToolMetrics,
+)
 from ethereum_clis.clis.geth import FixtureConsumerTool
+from ethereum_clis.trace_store import DEFAULT_TRACE_PRINT_STEPS
+from ethereum_clis.transition_tool_metrics import summary_lines, write_report
 from ethereum_test_base_types import Account, Address, Alloc, ReferenceSpec
 from ethereum_test_fixtures import (
     BaseFixture,
@@ -34,6 +46,10 @@ from ethereum_test_fixtures import (
     PreAllocGroups,
     TestInfo,
 )
+from ethereum_test_fixtures.binary import write_binary_fixture_file
+from ethereum_test_fixtures.compression import DEFAULT_COMPRESSION_LEVEL, iter_fixture_files
+from ethereum_test_fixtures.pre_alloc_groups import merge_pre_alloc_group_shards
+from ethereum_test_fixtures.shards import merge_fixture_shards
 from ethereum_test_forks import Fork, get_transition_fork_predecessor, get_transition_forks
 from ethereum_test_specs import BaseTest
 from ethereum_test_tools.utility.versioning import (
@@ -114,6 +130,18 @@ def default_html_report_file_path() -> str:
     return ".meta/report_fill.html"
 
 
+def traces_print_steps(value: str) -> int | None:
+    """
+    Parse the value of `--traces-print-steps`: a positive number of steps, or `all` to print
+    every step (None).
+    """
+    if value == "all":
+        return None
+    if not value.isdigit() or int(value) == 0:
+        raise argparse.ArgumentTypeError(f"expected 'all' or a positive integer, got '{value}'")
+    return int(value)
+
+
 def pytest_addoption(parser: pytest.Parser):
     """Add command-line options to pytest."""
     evm_group = parser.getgroup("evm", "Arguments defining evm executable behavior")
@@ -139,6 +167,76 @@ def pytest_addoption(parser: pytest.Parser):
             "intended for regular CLI use."
         ),
     )
+    evm_group.addoption(
+        "--t8n-daemon-pool",
+        action="store",
+        dest="t8n_daemon_pool_size",
+        type=str,
+        default=None,
+        help=(
+            "Start a pool of N long-lived t8n daemons once per session and share them between "
+            "all xdist workers, instead of starting one daemon per worker. Use 'auto' to size "
+            "the pool to the number of CPUs. Only supported by t8n tools that can run as a "
+            "daemon (e.g. `ethereum-spec-evm-resolver`)."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-cache-dir",
+        action="store",
+        dest="t8n_cache_dir",
+        type=Path,
+        default=None,
+        help=(
+            "Directory of a persistent cache of t8n results keyed by the request and the t8n "
+            "version, including the EELS resolutions of `ethereum-spec-evm-resolver`. Unchanged "
+            "tests are served from the cache on subsequent fills. The cache is bypassed when "
+            "collecting traces or dumping t8n debug output."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-cache-max-size",
+        action="store",
+        dest="t8n_cache_max_size",
+        type=int,
+        default=4096,
+        help=(
+            "Maximum size of the t8n result cache in MiB; the least recently used entries are "
+            "evicted when exceeded. Default: 4096."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-record",
+        action="store",
+        dest="t8n_record_archive",
+        type=Path,
+        default=None,
+        help=(
+            "Record every t8n request and output into an archive in the given directory, which "
+            "can be replayed with --t8n-replay."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-replay",
+        action="store",
+        dest="t8n_replay_archive",
+        type=Path,
+        default=None,
+        help=(
+            "Serve the t8n outputs recorded with --t8n-record from the given archive instead of "
+            "running a t8n tool, e.g. to measure the framework overhead of filling or to fill on "
+            "machines without any client binaries. --evm-bin is ignored."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-validate-output",
+        action="store_true",
+        dest="t8n_validate_output",
+        default=False,
+        help=(
+            "Fully validate the post allocation returned by the t8n tool. By default, the "
+            "output of the tool is trusted and the post allocation is built without validation."
+        ),
+    )
     evm_group.addoption(
         "--traces",
         action="store_true",
@@ -146,6 +244,18 @@ def pytest_addoption(parser: pytest.Parser):
         default=None,
         help="Collect traces of the execution information from the transition tool.",
     )
+    evm_group.addoption(
+        "--traces-print-steps",
+        action="store",
+        dest="traces_print_steps",
+        type=traces_print_steps,
+        default=str(DEFAULT_TRACE_PRINT_STEPS),
+        help=(
+            "Number of execution steps printed before the end of each transaction trace when a "
+            "test fails with --traces, after a summary of the executed opcodes. Use 'all' to "
+            f"print every step. Default: {DEFAULT_TRACE_PRINT_STEPS}."
+        ),
+    )
     evm_group.addoption(
         "--verify-fixtures",
         action="store_true",
@@ -217,6 +327,64 @@ def pytest_addoption(parser: pytest.Parser):
             "file. This can be used to increase the granularity of --verify-fixtures."
         ),
     )
+    test_group.addoption(
+        "--fixture-shards",
+        action="store_true",
+        dest="fixture_shards",
+        default=False,
+        help=(
+            "Append the fixtures generated by each xdist worker to its own shard in the `.meta` "
+            "folder, instead of merging them into the shared fixture files under a file lock, "
+            "and merge the shards into the fixture files at the end of the session. The "
+            "resulting fixture files are identical."
+        ),
+    )
+    test_group.addoption(
+        "--stream-fixtures",
+        action="store_true",
+        dest="stream_fixtures",
+        default=False,
+        help=(
+            "Write each fixture to the shard of the worker as soon as it is generated, instead of "
+            "keeping all the fixtures of a module in memory until the module is finished. "
+            "Implies --fixture-shards."
+        ),
+    )
+    test_group.addoption(
+        "--compress-fixtures",
+        action="store_true",
+        dest="compress_fixtures",
+        default=False,
+        help=(
+            "Write gzip-compressed fixture files (`.json.gz`) instead of plain JSON files. "
+            "Compressed fixtures are read transparently by `consume`, `gen_index`, `hasher` and "
+            "`check_fixtures`."
+        ),
+    )
+    test_group.addoption(
+        "--compression-level",
+        action="store",
+        dest="fixture_compression_level",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_COMPRESSION_LEVEL,
+        metavar="LEVEL",
+        help=(
+            "The gzip compression level, from 0 to 9, of the fixture files written with "
+            f"--compress-fixtures. Default: {DEFAULT_COMPRESSION_LEVEL}."
+        ),
+    )
+    test_group.addoption(
+        "--binary-fixtures",
+        action="store_true",
+        dest="binary_fixtures",
+        default=False,
+        help=(
+            "Also write a compact binary encoding of each fixture file (`.bin`) alongside it, "
+            "which `consume` loads much faster than the JSON file. JSON remains the canonical "
+            "format."
+        ),
+    )
     test_group.addoption(
         "--no-html",
         action="store_true",
@@ -267,6 +435,30 @@ def pytest_addoption(parser: pytest.Parser):
         default=False,
         help="Fill tests using existing pre-allocation groups (phase 2 only).",
     )
+    test_group.addoption(
+        "--pre-alloc-groups-cache-size",
+        action="store",
+        dest="pre_alloc_groups_cache_size",
+        default=None,
+        type=int,
+        help=(
+            "Maximum total size, in MiB, of the pre-allocation group files kept loaded by each "
+            "worker in phase 2. Groups are loaded when first used by a test, and the least "
+            "recently used groups are unloaded beyond this size. (Default: unbounded)"
+        ),
+    )
+    test_group.addoption(
+        "--pre-alloc-groups-verify-state-roots",
+        action="store",
+        dest="pre_alloc_groups_verify_state_roots",
+        default=0.0,
+        type=float,
+        help=(
+            "Fraction, between 0 and 1, of the pre-allocation groups whose state root, computed "
+            "at the end of phase 1, is computed again and verified when loaded in phase 2. "
+            "(Default: 0)"
+        ),
+    )
     test_group.addoption(
         "--generate-all-formats",
         action="store_true",
@@ -291,6 +483,18 @@ def pytest_addoption(parser: pytest.Parser):
             "Only creates debug output when explicitly specified."
         ),
     )
+    debug_group.addoption(
+        "--t8n-metrics",
+        action="store_true",
+        dest="t8n_metrics",
+        default=False,
+        help=(
+            "Record the serialization, transport, execution and parse times, the request and "
+            "response sizes, and the tx count and gas used of every t8n call. A report "
+            "aggregated per mode, fork and test is written to the `.meta` folder of the output "
+            "and a summary is printed at the end of the session."
+        ),
+    )
 
 
 def pytest_sessionstart(session: pytest.Session):
@@ -302,14 +506,22 @@ def pytest_sessionstart(session: pytest.Session):
     """
     # Initialize empty pre-allocation groups container for phase 1
     if session.config.getoption("generate_pre_alloc_groups"):
-        session.config.pre_alloc_groups = PreAllocGroups(root={})  # type: ignore[attr-defined]
+        pre_alloc_groups = PreAllocGroups(root={})
+        pre_alloc_groups.stream_to_shards(
+            session.config.fixture_output.pre_alloc_groups_shards_folder_path,  # type: ignore[attr-defined]
+            os.environ.get("PYTEST_XDIST_WORKER", "master"),
+        )
+        session.config.pre_alloc_groups = pre_alloc_groups  # type: ignore[attr-defined]
 
     # Load the pre-allocation groups for phase 2
     if session.config.getoption("use_pre_alloc_groups"):
         pre_alloc_groups_folder = session.config.fixture_output.pre_alloc_groups_folder_path  # type: ignore[attr-defined]
         if pre_alloc_groups_folder.exists():
+            cache_size = session.config.getoption("pre_alloc_groups_cache_size")
             session.config.pre_alloc_groups = PreAllocGroups.from_folder(  # type: ignore[attr-defined]
-                pre_alloc_groups_folder
+                pre_alloc_groups_folder,
+                lazy_load=True,
+                cache_size=cache_size * 1024 * 1024 if cache_size is not None else None,
             )
         else:
             pytest.exit(
@@ -339,6 +551,11 @@ def pytest_configure(config):
     if config.getoption("block_gas_limit"):
         EnvironmentDefaults.gas_limit = config.getoption("block_gas_limit")
 
+    # Verify a sample of the precomputed state roots of the pre-allocation groups if specified.
+    PreAllocGroup.state_root_verification_rate = config.getoption(
+        "pre_alloc_groups_verify_state_roots"
+    )
+
     # Initialize fixture output configuration
     config.fixture_output = FixtureOutput.from_config(config)
 
@@ -361,7 +578,11 @@ def pytest_configure(config):
     # Instantiate the transition tool here to check that the binary path/trace option is valid.
     # This ensures we only raise an error once, if appropriate, instead of for every test.
     evm_bin = config.getoption("evm_bin")
-    if evm_bin is None:
+    if t8n_replay_archive := config.getoption("t8n_replay_archive"):
+        t8n: TransitionTool = ReplayTransitionTool(
+            archive=t8n_replay_archive, trace=config.getoption("evm_collect_traces")
+        )
+    elif evm_bin is None:
         assert TransitionTool.default_tool is not None, "No default transition tool found"
         t8n = TransitionTool.default_tool(trace=config.getoption("evm_collect_traces"))
     else:
@@ -460,6 +681,13 @@ def pytest_terminal_summary(
                 bold=True,
                 green=True,
             )
+            collisions = getattr(config, "pre_alloc_group_collisions", {})
+            for pre_alloc_hash, addresses in collisions.items():
+                terminalreporter.write_line(
+                    f"Warning: pre-allocation group {pre_alloc_hash} defines accounts differently "
+                    f"in different tests: {', '.join(addresses)}",
+                    yellow=True,
+                )
 
         else:
             # Normal message for fixture generation
@@ -474,6 +702,13 @@ def pytest_terminal_summary(
                 bold=True,
                 yellow=True,
             )
+    if t8n_calls := getattr(config, "t8n_calls", None):
+        terminalreporter.write_sep("-", "t8n performance summary")
+        for line in summary_lines(t8n_calls):
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(
+            f"Full report: {config.fixture_output.metadata_dir / 't8n_metrics.json'}"  # type: ignore[attr-defined]
+        )
 
 
 def pytest_metadata(metadata):
@@ -578,9 +813,29 @@ def t8n_server_url(request: pytest.FixtureRequest) -> str | None:
     return request.config.getoption("t8n_server_url")
 
 
+@pytest.fixture(scope="session")
+def t8n_daemon_pool_size(request: pytest.FixtureRequest) -> int | None:
+    """Return the configured size of the shared t8n daemon pool, or None if disabled."""
+    pool_size = request.config.getoption("t8n_daemon_pool_size")
+    if pool_size is None:
+        return None
+    if pool_size == "auto":
+        return os.cpu_count() or 1
+    try:
+        return max(int(pool_size), 1)
+    except ValueError:
+        pytest.exit(
+            f"Invalid value for --t8n-daemon-pool: {pool_size}. Expected an integer or 'auto'.",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
+
+
 @pytest.fixture(autouse=True, scope="session")
 def t8n(
-    request: pytest.FixtureRequest, evm_bin: Path | None, t8n_server_url: str | None
+    request: pytest.FixtureRequest,
+    evm_bin: Path | None,
+    t8n_server_url: str | None,
+    t8n_daemon_pool_size: int | None,
 ) -> Generator[TransitionTool, None, None]:
     """Return configured transition tool."""
     kwargs = {
@@ -588,11 +843,47 @@ def t8n(
     }
     if t8n_server_url is not None:
         kwargs["server_url"] = t8n_server_url
-    if evm_bin is None:
+    if t8n_replay_archive := request.config.getoption("t8n_replay_archive"):
+        t8n: TransitionTool = ReplayTransitionTool(
+            archive=t8n_replay_archive, trace=kwargs["trace"]
+        )
+    elif evm_bin is None:
         assert TransitionTool.default_tool is not None, "No default transition tool found"
         t8n = TransitionTool.default_tool(**kwargs)
     else:
         t8n = TransitionTool.from_binary_path(binary_path=evm_bin, **kwargs)
+    t8n_daemon_pool: TransitionToolDaemonPool | None = None
+    if t8n_daemon_pool_size is not None and t8n_server_url is None:
+        if not t8n.supports_daemon:
+            pytest.exit(
+                f"The t8n tool ({t8n.__class__.__name__}) can't run as a t8n daemon; "
+                "--t8n-daemon-pool is not supported.",
+                returncode=pytest.ExitCode.USAGE_ERROR,
+            )
+        t8n_daemon_pool = TransitionToolDaemonPool(
+            folder=request.getfixturevalue("session_temp_folder"),
+            size=t8n_daemon_pool_size,
+            start_daemon=t8n.start_daemon,
+        )
+        t8n.server_url = t8n_daemon_pool.checkout()
+    if t8n_cache_dir := request.config.getoption("t8n_cache_dir"):
+        if t8n.cache_identity() is None:
+            pytest.exit(
+                f"The version of the t8n tool ({t8n.__class__.__name__}) can't be determined, "
+                "e.g. because EELS is resolved to a local checkout or to a branch without a "
+                "pinned commit; --t8n-cache-dir is not supported.",
+                returncode=pytest.ExitCode.USAGE_ERROR,
+            )
+        t8n.cache = TransitionToolCache(
+            directory=t8n_cache_dir,
+            max_size=request.config.getoption("t8n_cache_max_size") * 1024 * 1024,
+        )
+    if t8n_record_archive := request.config.getoption("t8n_record_archive"):
+        t8n.recorder = TransitionToolArchive(t8n_record_archive)
+    t8n.validate_output = request.config.getoption("t8n_validate_output")
+    t8n.trace_print_steps = request.config.getoption("traces_print_steps")
+    if request.config.getoption("t8n_metrics"):
+        t8n.metrics = TransitionToolMetrics()
     if not t8n.exception_mapper.reliable:
         warnings.warn(
             f"The t8n tool that is currently being used to fill tests ({t8n.__class__.__name__}) "
@@ -603,6 +894,39 @@ def t8n(
         )
     yield t8n
     t8n.shutdown()
+    if t8n.metrics is not None:
+        # Phase 1 and phase 2 of a two-phase fill are separate sessions run by the same worker
+        # ids; each phase dumps to its own files so that the second one doesn't overwrite the
+        # calls of the first one.
+        phase = (
+            "pre_alloc_groups" if request.config.getoption("generate_pre_alloc_groups") else "fill"
+        )
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        t8n.metrics.dump(t8n_metrics_folder(request.config) / f"{phase}-{worker_id}.jsonl")
+    if t8n_daemon_pool is not None:
+        assert t8n.server_url is not None
+        t8n_daemon_pool.checkin(t8n.server_url)
+
+
+def t8n_metrics_folder(config: pytest.Config) -> Path:
+    """Return the folder where each worker dumps the metrics of its t8n calls."""
+    return config.fixture_output.metadata_dir / "t8n_metrics"  # type: ignore[attr-defined]
+
+
+def merge_t8n_metrics(config: pytest.Config) -> None:
+    """
+    Merge the t8n metrics dumped by all the workers into the session report.
+
+    The dumps of phase 1 of a two-phase fill are kept, so that the report written at the end
+    of phase 2 covers the t8n calls of both phases.
+    """
+    fixture_output = config.fixture_output  # type: ignore[attr-defined]
+    metrics_folder = t8n_metrics_folder(config)
+    t8n_calls = TransitionToolMetrics.load(metrics_folder)
+    write_report(t8n_calls, fixture_output.metadata_dir)
+    if not config.getoption("generate_pre_alloc_groups"):
+        shutil.rmtree(metrics_folder, ignore_errors=True)
+    config.t8n_calls = t8n_calls  # type: ignore[attr-defined]
 
 
 @pytest.fixture(scope="session")
@@ -802,6 +1126,10 @@ def fixture_collector(
         request.config.pluginmanager.import_plugin("pytest_plugins.filler.static_filler")
         request.config.pluginmanager.import_plugin("pytest_plugins.solc.solc")
 
+    shard_path = None
+    if fixture_output.shards and not fixture_output.is_stdout:
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        shard_path = fixture_output.shards_folder_path / f"{worker_id}.jsonl"
     fixture_collector = FixtureCollector(
         output_dir=fixture_output.directory,
         flat_output=fixture_output.flat_output,
@@ -809,6 +1137,9 @@ def fixture_collector(
         single_fixture_per_file=fixture_output.single_fixture_per_file,
         filler_path=filler_path,
         base_dump_dir=base_dump_dir,
+        shard_path=shard_path,
+        stream_fixtures=fixture_output.stream_fixtures and shard_path is not None,
+        compression_level=None if fixture_output.is_stdout else fixture_output.compression_level,
     )
     yield fixture_collector
     fixture_collector.dump_fixtures()
@@ -866,6 +1197,43 @@ def fixture_source_url(
     return github_url
 
 
+BUILT_BLOCK_MEMO_MAX_TESTS = 4
+"""
+Number of tests for which the blocks built by the transition tool are kept in memory to be
+reused by the other fixture formats of the same test.
+"""
+
+
+@pytest.fixture(scope="session")
+def built_block_memos() -> OrderedDict[Tuple[Any, ...], Dict]:
+    """Return the least recently used memos of built blocks, keyed by test."""
+    return OrderedDict()
+
+
+def get_built_block_memo(
+    built_block_memos: OrderedDict[Tuple[Any, ...], Dict],
+    node: pytest.Item,
+    spec_parameter_name: str,
+) -> Dict:
+    """
+    Return the memo of built blocks shared by all the fixture formats filled from the same
+    test, i.e., the test items that only differ in the fixture format parameter.
+    """
+    params = node.callspec.params if isinstance(node, pytest.Function) else {}
+    test_key = (
+        str(node.path),
+        node.originalname if isinstance(node, pytest.Function) else node.name,
+        tuple(sorted((k, repr(v)) for k, v in params.items() if k != spec_parameter_name)),
+    )
+    if test_key in built_block_memos:
+        built_block_memos.move_to_end(test_key)
+    else:
+        built_block_memos[test_key] = {}
+        while len(built_block_memos) > BUILT_BLOCK_MEMO_MAX_TESTS:
+            built_block_memos.popitem(last=False)
+    return built_block_memos[test_key]
+
+
 def base_test_parametrizer(cls: Type[BaseTest]):
     """
     Generate pytest.fixture for a given BaseTest subclass.
@@ -889,6 +1257,7 @@ def base_test_parametrizer(cls: Type[BaseTest]):
         fixture_collector: FixtureCollector,
         test_case_description: str,
         fixture_source_url: str,
+        built_block_memos: OrderedDict[Tuple[Any, ...], Dict],
     ):
         """
         Fixture used to instantiate an auto-fillable BaseTest object from within
@@ -916,6 +1285,11 @@ def base_test_parametrizer(cls: Type[BaseTest]):
                     kwargs["pre"] = pre
                 super(BaseTestWrapper, self).__init__(*args, **kwargs)
                 self._request = request
+                if t8n.metrics is not None:
+                    t8n.metrics.test_id = request.node.nodeid
+                self._built_block_memo = get_built_block_memo(
+                    built_block_memos, request.node, cls.pytest_parameter_name()
+                )
 
                 # Phase 1: Generate pre-allocation groups
                 if fixture_format is BlockchainEngineXFixture and request.config.getoption(
@@ -946,6 +1320,7 @@ def base_test_parametrizer(cls: Type[BaseTest]):
                         )
                     group: PreAllocGroup = request.config.pre_alloc_groups[pre_alloc_hash]  # type: ignore[annotation-unchecked]
                     self.pre = group.pre
+                    self._pre_state_root = group.genesis_state_root()
 
                 fixture = self.generate(
                     t8n=t8n,
@@ -1149,19 +1524,30 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
     """
     Perform session finish tasks.
 
-    - Save pre-allocation groups (phase 1)
+    - Save pre-allocation groups (phase 1), merging the shards of all workers.
+    - Merge the t8n metrics of all workers into the session report.
+    - Merge the fixture shards of all workers into the fixture files.
     - Remove any lock files that may have been created.
+    - Write the binary encoding of each fixture file.
     - Generate index file for all produced fixtures.
     - Create tarball of the output directory if the output is a tarball.
     """
-    # Save pre-allocation groups after phase 1
+    # Save pre-allocation groups after phase 1: each worker writes its groups as shards, which
+    # are merged into the group files once all workers are done.
     fixture_output = session.config.fixture_output  # type: ignore[attr-defined]
     if session.config.getoption("generate_pre_alloc_groups") and hasattr(
         session.config, "pre_alloc_groups"
     ):
-        pre_alloc_groups_folder = fixture_output.pre_alloc_groups_folder_path
-        pre_alloc_groups_folder.mkdir(parents=True, exist_ok=True)
-        session.config.pre_alloc_groups.to_folder(pre_alloc_groups_folder)
+        shards_folder = fixture_output.pre_alloc_groups_shards_folder_path
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        session.config.pre_alloc_groups.to_shards(shards_folder, worker_id)
+        if not xdist.is_xdist_worker(session) and shards_folder.exists():
+            session.config.pre_alloc_group_collisions = merge_pre_alloc_group_shards(  # type: ignore[attr-defined]
+                shards_folder, fixture_output.pre_alloc_groups_folder_path
+            )
+            shutil.rmtree(shards_folder)
+        if not xdist.is_xdist_worker(session) and session.config.getoption("t8n_metrics"):
+            merge_t8n_metrics(session.config)
         return
 
     if xdist.is_xdist_worker(session):
@@ -1170,10 +1556,29 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
     if fixture_output.is_stdout or is_help_or_collectonly_mode(session.config):
         return
 
+    # Merge the fixture shards of all workers into the fixture files.
+    if fixture_output.shards and fixture_output.shards_folder_path.exists():
+        merge_fixture_shards(
+            fixture_output.shards_folder_path,
+            fixture_output.directory,
+            compression_level=fixture_output.compression_level,
+        )
+        shutil.rmtree(fixture_output.shards_folder_path)
+
     # Remove any lock files that may have been created.
     for file in fixture_output.directory.rglob("*.lock"):
         file.unlink()
 
+    # Merge the t8n metrics of all workers into the session report.
+    if session.config.getoption("t8n_metrics"):
+        merge_t8n_metrics(session.config)
+
+    # Write the binary encoding of each fixture file alongside it.
+    if fixture_output.binary_fixtures:
+        for fixture_path in iter_fixture_files(fixture_output.directory):
+            if not any(part in INDEX_EXCLUDED_PATH_PARTS for part in fixture_path.parts):
+                write_binary_fixture_file(fixture_path)
+
     # Generate index file for all produced fixtures.
     if session.config.getoption("generate_index") and not session.config.getoption(
         "generate_pre_alloc_groups"
@@ -7,7 +7,10 @@ from pathlib import Path
 import pytest
 from pydantic import BaseModel, Field
 
+from cli.index_manifest import INDEX_MANIFEST_FILE_NAME
+from ethereum_test_fixtures.binary import BINARY_FIXTURE_FILE_SUFFIX
 from ethereum_test_fixtures.blockchain import BlockchainEngineXFixture
+from ethereum_test_fixtures.compression import is_fixture_file
 
 
 class FixtureOutput(BaseModel):
@@ -25,6 +28,28 @@ class FixtureOutput(BaseModel):
             "write each fixture to its own file"
         ),
     )
+    shards: bool = Field(
+        default=False,
+        description=(
+            "Append the fixtures of each worker to its own shard and merge the shards into the "
+            "fixture files at the end of the session"
+        ),
+    )
+    stream_fixtures: bool = Field(
+        default=False,
+        description=(
+            "Append each fixture to the shard of the worker as soon as it is generated, keeping "
+            "only its metadata in memory; implies shards"
+        ),
+    )
+    compression_level: int | None = Field(
+        default=None,
+        description="Write gzip-compressed `.json.gz` fixture files with the given level",
+    )
+    binary_fixtures: bool = Field(
+        default=False,
+        description="Write the binary encoding of each fixture file alongside it",
+    )
     clean: bool = Field(
         default=False,
         description="Clean (remove) the output directory before filling fixtures.",
@@ -54,6 +79,11 @@ class FixtureOutput(BaseModel):
             return self.directory
         return self.directory / ".meta"
 
+    @property
+    def shards_folder_path(self) -> Path:
+        """Return the path of the folder containing the fixture shards of the workers."""
+        return self.metadata_dir / "fixture_shards"
+
     @property
     def is_tarball(self) -> bool:
         """Return True if the output should be packaged as a tarball."""
@@ -71,6 +101,11 @@ class FixtureOutput(BaseModel):
         engine_x_dir = BlockchainEngineXFixture.output_base_dir_name()
         return self.directory / engine_x_dir / "pre_alloc"
 
+    @property
+    def pre_alloc_groups_shards_folder_path(self) -> Path:
+        """Return the path of the pre-allocation group shards written by each worker."""
+        return self.pre_alloc_groups_folder_path / "shards"
+
     @property
     def should_auto_enable_all_formats(self) -> bool:
         """Check if all formats should be auto-enabled due to tarball output."""
@@ -204,7 +239,9 @@ class FixtureOutput(BaseModel):
 
         with tarfile.open(self.output_path, "w:gz") as tar:
             for file in self.directory.rglob("*"):
-                if file.suffix in {".json", ".ini"}:
+                if file.name == INDEX_MANIFEST_FILE_NAME:
+                    continue  # local cache of the index generation
+                if is_fixture_file(file) or file.suffix in {BINARY_FIXTURE_FILE_SUFFIX, ".ini"}:
                     arcname = Path("fixtures") / file.relative_to(self.directory)
                     tar.add(file, arcname=arcname)
 
@@ -223,6 +260,14 @@ class FixtureOutput(BaseModel):
             output_path=output_path,
             flat_output=config.getoption("flat_output"),
             single_fixture_per_file=config.getoption("single_fixture_per_file"),
+            shards=config.getoption("fixture_shards") or config.getoption("stream_fixtures"),
+            stream_fixtures=config.getoption("stream_fixtures"),
+            compression_level=(
+                config.getoption("fixture_compression_level")
+                if config.getoption("compress_fixtures")
+                else None
+            ),
+            binary_fixtures=config.getoption("binary_fixtures"),
             clean=config.getoption("clean"),
             generate_pre_alloc_groups=config.getoption("generate_pre_alloc_groups"),
             use_pre_alloc_groups=config.getoption("use_pre_alloc_groups"),
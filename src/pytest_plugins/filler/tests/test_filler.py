@@ -2,6 +2,7 @@
 Test the filler plugin.
 """
 
+import argparse
 import configparser
 import json
 import os
@@ -13,7 +14,7 @@ import pytest
 
 from ethereum_test_tools import Environment
 from ethereum_clis import ExecutionSpecsTransitionTool, TransitionTool
-from pytest_plugins.filler.filler import default_output_directory
+from pytest_plugins.filler.filler import default_output_directory, traces_print_steps
 
 
 # flake8: noqa
@@ -762,3 +763,16 @@ def test_fill_variables(
         assert "build" in properties
         build_name = args[args.index("--build-name") + 1]
         assert properties["build"] == build_name
+
+
+@pytest.mark.parametrize("value,expected", [("all", None), ("1", 1), ("64", 64)])
+def test_traces_print_steps(value: str, expected: int | None):
+    """Test the parsing of valid `--traces-print-steps` values."""
+    assert traces_print_steps(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "ten", ""])
+def test_traces_print_steps_invalid(value: str):
+    """Test that invalid `--traces-print-steps` values are rejected as usage errors."""
+    with pytest.raises(argparse.ArgumentTypeError, match="positive integer"):
+        traces_print_steps(value)
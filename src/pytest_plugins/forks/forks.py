@@ -13,7 +13,7 @@ import pytest
 from _pytest.mark.structures import ParameterSet
 from pytest import Mark, Metafunc
 
-from ethereum_clis import TransitionTool
+from ethereum_clis import ReplayTransitionTool, TransitionTool
 from ethereum_test_forks import (
     Fork,
     get_deployed_forks,
@@ -524,7 +524,10 @@ def pytest_configure(config: pytest.Config):
         return
 
     evm_bin = config.getoption("evm_bin", None)
-    if evm_bin is None:
+    t8n_replay_archive = config.getoption("t8n_replay_archive", None)
+    if t8n_replay_archive is not None:
+        t8n: TransitionTool = ReplayTransitionTool(archive=t8n_replay_archive)
+    elif evm_bin is None:
         assert TransitionTool.default_tool is not None, "No default transition tool found"
         t8n = TransitionTool.default_tool()
     elif evm_bin is not None: